@@ -4,3 +4,40 @@ except ImportError:
     __version__ = "unknown"
 
 from ._reader import napari_get_reader  # noqa: F401
+
+
+def cache_stats(reset: bool = False) -> dict:
+    """
+    return a snapshot of the yt-napari dataset cache statistics
+
+    Parameters
+    ----------
+    reset : bool
+        if True, the hit, miss, load and eviction counters are zeroed after
+        taking the snapshot (default False).
+
+    Returns
+    -------
+    dict
+        with the following keys:
+        hits, misses, loads, evictions : int
+            counts since the last reset
+        load_time : float
+            seconds spent loading datasets since the last reset
+        n_entries : int
+            the number of datasets in the cache
+        entry_nbytes : dict
+            the estimated memory in bytes held by each cached dataset
+        nbytes : int
+            the total estimated memory of the cache
+
+    Examples
+    --------
+
+    >>> import yt_napari
+    >>> yt_napari.cache_stats()["hits"]
+    """
+    # imported here to keep yt out of the napari plugin discovery import
+    from yt_napari._ds_cache import dataset_cache
+
+    return dataset_cache.stats(reset=reset)
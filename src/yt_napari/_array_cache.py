@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from yt_napari.config import ytcfg
+from yt_napari.logging import ytnapari_log
+
+
+def _dataset_identity(ds) -> Optional[Tuple[str, str, float, int]]:
+    # returns (path, unique identifier, mtime, size) for a dataset loaded from
+    # disk. In-memory datasets have no stable identity, so None is returned
+    # and their samples are never cached.
+    filename = getattr(ds, "parameter_filename", None)
+    if filename is None:
+        return None
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError, ValueError):
+        return None
+    uid = str(getattr(ds, "unique_identifier", ""))
+    return os.path.abspath(filename), uid, stat.st_mtime, stat.st_size
+
+
+def _canonical(obj):
+    # a json-compatible representation of a selection or a field. The list of
+    # fields is excluded from selections since fields are keyed separately.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", exclude={"fields"})
+    if hasattr(obj, "_cache_token"):
+        return obj._cache_token()
+    return obj
+
+
+def get_cache_key(ds, selection, field) -> Optional[str]:
+    """
+    return a content hash identifying a sampled field of a selection
+
+    Parameters
+    ----------
+    ds :
+        the yt dataset being sampled
+    selection :
+        the selection, either a pydantic model or an object with a
+        _cache_token method returning a json-compatible dict
+    field :
+        the field, either a pydantic ytField or a json-compatible object
+
+    Returns
+    -------
+    str or None
+        the hex digest of the key, or None if the dataset is not on disk.
+    """
+    ds_id = _dataset_identity(ds)
+    if ds_id is None:
+        return None
+
+    sel_type = type(selection)
+    contents = {
+        "dataset": ds_id,
+        "selection_type": f"{sel_type.__module__}.{sel_type.__name__}",
+        "selection": _canonical(selection),
+        "field": _canonical(field),
+    }
+    contents = json.dumps(contents, sort_keys=True, default=str)
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
+class ArrayCache:
+    # an in-memory store of sampled image arrays and their metadata keyed by
+    # get_cache_key. The least recently used arrays are evicted once the
+    # max_array_cache_memory budget (bytes, read from the yt_napari config)
+    # is exceeded. Access is guarded by a lock for use from worker threads.
+    def __init__(self):
+        self.available = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(arr.nbytes for arr, _ in self.available.values())
+
+    def exists(self, key: Optional[str]) -> bool:
+        return key is not None and key in self.available
+
+    def get(self, key: Optional[str]) -> Optional[Tuple[np.ndarray, dict]]:
+        with self._lock:
+            if not self.exists(key):
+                return None
+            self.available.move_to_end(key)
+            return self.available[key]
+
+    def add(self, key: Optional[str], data: np.ndarray, metadata: dict):
+        if key is None or not ytcfg.get("yt_napari", "in_memory_array_cache"):
+            return
+        with self._lock:
+            self.available[key] = (data, metadata)
+            self.available.move_to_end(key)
+            self._evict()
+
+    def rm(self, key: str):
+        with self._lock:
+            self.available.pop(key, None)
+
+    def rm_all(self):
+        with self._lock:
+            self.available = OrderedDict()
+
+    def _evict(self):
+        max_memory = ytcfg.get("yt_napari", "max_array_cache_memory")
+        if max_memory <= 0:
+            return
+        nbytes = self.nbytes
+        while nbytes > max_memory and len(self.available) > 0:
+            key, (arr, _) = self.available.popitem(last=False)
+            nbytes -= arr.nbytes
+            ytnapari_log.info(f"evicted array {key} from the array cache.")
+
+
+class DiskArrayCache:
+    # a persistent store of sampled image arrays in the directory set by the
+    # disk_cache_dir config option (disabled when empty). Each entry is a raw
+    # <key>.npy file plus a <key>.json sidecar with the key and the layer
+    # metadata. Hits are memory-mapped read-only, so no data is read until
+    # the array is accessed. Least recently used entries are removed once the
+    # directory exceeds max_disk_cache_size bytes.
+
+    @property
+    def directory(self) -> Optional[str]:
+        cache_dir = ytcfg.get("yt_napari", "disk_cache_dir")
+        if not cache_dir:
+            return None
+        return os.path.expanduser(cache_dir)
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + ".npy", base + ".json"
+
+    def exists(self, key: Optional[str]) -> bool:
+        if key is None or self.directory is None:
+            return False
+        npy_file, json_file = self._paths(key)
+        return os.path.isfile(npy_file) and os.path.isfile(json_file)
+
+    def get(self, key: Optional[str]) -> Optional[Tuple[np.ndarray, dict]]:
+        if not self.exists(key):
+            return None
+        npy_file, json_file = self._paths(key)
+        try:
+            with open(json_file, "r") as fhandle:
+                sidecar = json.load(fhandle)
+            data = np.load(npy_file, mmap_mode="r")
+        except (OSError, ValueError):
+            ytnapari_log.warning(f"could not read {key} from the disk cache.")
+            return None
+        # mark the entry as recently used
+        os.utime(json_file)
+        return data, sidecar["metadata"]
+
+    def add(self, key: Optional[str], data: np.ndarray, metadata: dict):
+        if key is None or self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        npy_file, json_file = self._paths(key)
+        np.save(npy_file, np.asarray(data))
+        with open(json_file, "w") as fhandle:
+            json.dump({"key": key, "metadata": metadata}, fhandle, default=str)
+        self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        # (last access, size, key) for every complete entry in the directory
+        entries = []
+        for fname in os.listdir(self.directory):
+            key, ext = os.path.splitext(fname)
+            if ext != ".json" or not self.exists(key):
+                continue
+            npy_file, json_file = self._paths(key)
+            size = os.path.getsize(npy_file) + os.path.getsize(json_file)
+            entries.append((os.path.getmtime(json_file), size, key))
+        return sorted(entries)
+
+    def rm(self, key: str):
+        for fname in self._paths(key):
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+    def rm_all(self):
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for _, _, key in self._entries():
+            self.rm(key)
+
+    def _evict(self):
+        max_size = ytcfg.get("yt_napari", "max_disk_cache_size")
+        if max_size <= 0:
+            return
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        # never remove the newest entry
+        for _, size, key in entries[:-1]:
+            if total <= max_size:
+                break
+            self.rm(key)
+            total -= size
+            ytnapari_log.info(f"evicted array {key} from the disk cache.")
+
+
+array_cache = ArrayCache()
+disk_cache = DiskArrayCache()
+
+
+def get_cached_array(key: Optional[str]) -> Optional[Tuple[np.ndarray, dict]]:
+    """
+    return a cached (array, metadata) tuple, checking the in-memory cache
+    before the disk cache. Returns None if the key is not cached.
+    """
+    cached = array_cache.get(key)
+    if cached is None:
+        cached = disk_cache.get(key)
+    return cached
+
+
+def cache_array(
+    key: Optional[str], data: np.ndarray, metadata: dict, in_memory: bool = True
+):
+    """
+    store an array and its json-compatible metadata in all enabled caches,
+    skipping the in-memory cache if in_memory is False.
+    """
+    if in_memory:
+        array_cache.add(key, data, metadata)
+    disk_cache.add(key, data, metadata)
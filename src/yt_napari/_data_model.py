@@ -1,7 +1,7 @@
 import inspect
 import json
 from pathlib import PosixPath
-from typing import List, Optional, Tuple, Union
+from typing import List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,19 @@ class _ytBaseModel(BaseModel):
     pass
 
 
+CachePolicy = Literal["none", "dataset", "dataset+arrays"]
+OutputDtype = Literal["float64", "float32", "uint8", "uint16"]
+
+
+def _get_default_cache_policy() -> str:
+    # the most permissive policy allowed by the in-memory cache config options
+    if not ytcfg.get("yt_napari", "in_memory_cache"):
+        return "none"
+    if ytcfg.get("yt_napari", "in_memory_array_cache"):
+        return "dataset+arrays"
+    return "dataset"
+
+
 class ytField(_ytBaseModel):
     field_type: str = Field(None, description="a field type in the yt dataset")
     field_name: str = Field(None, description="a field in the yt dataset")
@@ -59,11 +72,19 @@ class Region(_ytBaseModel):
         None,
         description="the right edge (max x, max y, max z)",
     )
-    resolution: Tuple[int, int, int] = Field(
+    resolution: Union[Tuple[int, int, int], Literal["auto"]] = Field(
         (400, 400, 400),
-        description="the resolution at which to sample between the edges.",
+        description="the resolution at which to sample between the edges. "
+        "auto matches the finest cells in the region, limited by the "
+        "auto_resolution_max_memory config option.",
     )
     rescale: bool = Field(False, description="rescale the final image between 0,1")
+    dtype: OutputDtype = Field(
+        "float64",
+        description="the dtype of the final image. uint8 and uint16 images are "
+        "quantized between the data min and max, with the scale and offset "
+        "stored in the layer metadata.",
+    )
 
 
 class CoveringGrid(_ytBaseModel):
@@ -84,6 +105,18 @@ class CoveringGrid(_ytBaseModel):
         description="Number of ghost zones to include",
     )
     rescale: bool = Field(False, description="rescale the final image between 0,1")
+    dtype: OutputDtype = Field(
+        "float64",
+        description="the dtype of the final image. uint8 and uint16 images are "
+        "quantized between the data min and max, with the scale and offset "
+        "stored in the layer metadata.",
+    )
+    multiscale: bool = Field(
+        False,
+        description="if enabled, loads a multiscale image with a covering grid "
+        "at every level from 0 up to level. All levels are sampled before the "
+        "layer is returned.",
+    )
 
 
 class Slice(_ytBaseModel):
@@ -108,6 +141,41 @@ class Slice(_ytBaseModel):
         False, description="should the slice be periodic? default False."
     )
     rescale: bool = Field(False, description="rescale the final image between 0,1")
+    dtype: OutputDtype = Field(
+        "float64",
+        description="the dtype of the final image. uint8 and uint16 images are "
+        "quantized between the data min and max, with the scale and offset "
+        "stored in the layer metadata.",
+    )
+
+
+class OrthoSlices(_ytBaseModel):
+    fields: List[ytField] = Field(
+        None, description="list of fields to load for this selection"
+    )
+    center: Length_Tuple = Field(
+        None,
+        description="The point the three orthogonal slices pass through, "
+        "default domain center",
+    )
+    slice_width: Length_Value = Field(
+        None,
+        description="The width and height of each slice, defaults to full domain",
+    )
+    resolution: Tuple[int, int] = Field(
+        (400, 400),
+        description="the resolution at which to sample each slice",
+    )
+    periodic: bool = Field(
+        False, description="should the slices be periodic? default False."
+    )
+    rescale: bool = Field(False, description="rescale the final images between 0,1")
+    dtype: OutputDtype = Field(
+        "float64",
+        description="the dtype of the final images. uint8 and uint16 images are "
+        "quantized between the data min and max, with the scale and offset "
+        "stored in the layer metadata.",
+    )
 
 
 class SelectionObject(_ytBaseModel):
@@ -116,6 +184,10 @@ class SelectionObject(_ytBaseModel):
     covering_grids: List[CoveringGrid] = Field(
         None, description="a list of covering grids to load"
     )
+    orthoslices: List[OrthoSlices] = Field(
+        None,
+        description="a list of orthogonal slice triplets to load, each placed in 3D",
+    )
 
 
 class DataContainer(_ytBaseModel):
@@ -127,6 +199,18 @@ class DataContainer(_ytBaseModel):
         ytcfg.get("yt_napari", "in_memory_cache"),
         description="if enabled, will store references to yt datasets.",
     )
+    cache_policy: CachePolicy = Field(
+        _get_default_cache_policy(),
+        description="what to keep in memory when store_in_cache is enabled: "
+        "nothing (none), the yt dataset (dataset) or the dataset and the "
+        "sampled arrays (dataset+arrays).",
+    )
+    lazy: bool = Field(
+        False,
+        description="if enabled, regions and covering grids are returned as "
+        "dask arrays that are sampled in chunks along the first axis as "
+        "they are accessed (requires dask).",
+    )
 
 
 class TimeSeriesFileSelection(_ytBaseModel):
@@ -149,9 +233,32 @@ class Timeseries(_ytBaseModel):
     load_as_stack: bool = Field(
         False, description="If True, will stack images along a new dimension."
     )
-    # process_in_parallel: Optional[bool] = Field(
-    #     False, description="If True, will attempt to load selections in parallel."
-    # )
+    store_in_cache: bool = Field(
+        False,
+        description="if enabled, will store references to the yt datasets of "
+        "each timestep.",
+    )
+    cache_policy: CachePolicy = Field(
+        _get_default_cache_policy(),
+        description="what to keep in memory when store_in_cache is enabled: "
+        "nothing (none), the yt dataset (dataset) or the dataset and the "
+        "sampled arrays (dataset+arrays).",
+    )
+    prefetch_depth: int = Field(
+        ytcfg.get("yt_napari", "timeseries_prefetch_depth"),
+        description="number of upcoming timesteps to open in a background "
+        "thread while the current one is sampled. 0 disables prefetching.",
+    )
+    process_in_parallel: bool = Field(
+        False,
+        description="If True, timesteps are loaded and sampled in a pool of "
+        "worker processes.",
+    )
+    num_workers: int = Field(
+        0,
+        description="the number of worker processes when process_in_parallel is "
+        "enabled. Values < 1 use the max_workers config option.",
+    )
 
 
 class InputModel(_ytBaseModel):
@@ -1,8 +1,13 @@
 import json
 import os.path
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from os import PathLike
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import yt
 
 from yt_napari import _special_loaders, _utilities
@@ -46,27 +51,149 @@ def get_sample_set_list() -> List[str]:
     return jdata["enabled"]
 
 
+def _sum_array_nbytes(values) -> int:
+    return sum(v.nbytes for v in values if isinstance(v, np.ndarray))
+
+
+def _estimate_ds_nbytes(ds) -> int:
+    # approximate memory held by a dataset: the arrays attached to its index
+    # plus any field data cached on its grids. The index is not built here,
+    # so a dataset that has not been sampled yet counts as 0 bytes.
+    index = getattr(ds, "_instantiated_index", None)
+    if index is None:
+        return 0
+    nbytes = _sum_array_nbytes(vars(index).values())
+    for grid in getattr(index, "grids", ()):
+        nbytes += _sum_array_nbytes(getattr(grid, "field_data", {}).values())
+    return nbytes
+
+
+_validation_policies = ("trust", "stat", "interval")
+
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[float, int, int]]:
+    # the (mtime, size, inode) of a file on disk, None if it cannot be found
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return stat.st_mtime, stat.st_size, stat.st_ino
+
+
+def _purge_yt_dataset_cache(ds):
+    # yt keeps its own weak cache of instantiated datasets by filename, so a
+    # stale dataset must be removed from it for yt.load to re-read the file.
+    from yt.data_objects.static_output import _cached_datasets
+
+    for key, cached_ds in list(_cached_datasets.items()):
+        if cached_ds is ds:
+            _cached_datasets.pop(key, None)
+
+
 class DatasetCache:
+    # an in-memory store of yt datasets with least-recently-used eviction.
+    # the maximum number of entries and the approximate memory budget (in
+    # bytes) are read from the yt_napari config on every insertion, a value
+    # of 0 for either disables that limit. The memory estimate of an entry is
+    # stored when it is added and refreshed once, when the next dataset is
+    # added (by which point it has usually been sampled), so insertions do not
+    # re-estimate every cached dataset.
+    #
+    # the (mtime, size, inode) of the file behind each dataset is recorded when
+    # it is cached and re-checked on lookup according to the cache_validation
+    # config option: "trust" never checks, "stat" checks on every access and
+    # "interval" checks at most every cache_validation_interval seconds.
+    #
+    # all access is guarded by a re-entrant lock so that the cache can be used
+    # from worker threads. Loading is single-flight: the first caller for a
+    # filename loads the dataset outside of the lock while concurrent callers
+    # for the same filename wait for and share the resulting dataset.
     def __init__(self):
-        self.available = {}
+        self.available = OrderedDict()
+        self._nbytes = {}
+        self._signatures = {}
+        self._last_validated = {}
         self._most_recent: str = None
+        self._lock = threading.RLock()
+        self._loading: Dict[str, Future] = {}
         self.sample_sets: List[str] = get_sample_set_list()
+        self.reset_stats()
+
+    def reset_stats(self):
+        # zero the hit, miss, load and eviction counters
+        with self._lock:
+            self._stats = {
+                "hits": 0,
+                "misses": 0,
+                "loads": 0,
+                "evictions": 0,
+                "load_time": 0.0,
+            }
+
+    def stats(self, reset: bool = False) -> dict:
+        """
+        return a snapshot of the cache statistics
+
+        Parameters
+        ----------
+        reset : bool
+            if True, the counters are zeroed after taking the snapshot
+
+        Returns
+        -------
+        dict
+            hits, misses, loads, evictions and load_time (seconds spent
+            loading datasets) since the last reset, plus the current number of
+            entries, the estimated bytes held by each entry (entry_nbytes) and
+            their total (nbytes).
+        """
+        with self._lock:
+            for name, ds in self.available.items():
+                self._nbytes[name] = _estimate_ds_nbytes(ds)
+            snapshot = dict(self._stats)
+            snapshot["n_entries"] = len(self.available)
+            snapshot["entry_nbytes"] = dict(self._nbytes)
+            snapshot["nbytes"] = self.nbytes
+            if reset:
+                self.reset_stats()
+        return snapshot
 
     def add_ds(self, ds, name: str):
-        if name in self.available:
-            ytnapari_log.warning(f"A dataset already exists for {name}. Overwriting.")
-        self.available[name] = ds
-        self._most_recent = name
+        with self._lock:
+            if name in self.available:
+                msg = f"A dataset already exists for {name}. Overwriting."
+                ytnapari_log.warning(msg)
+            previous = self._most_recent
+            if previous is not None and previous != name:
+                # its field caches have grown since it was added
+                self._nbytes[previous] = _estimate_ds_nbytes(self.available[previous])
+            self.available[name] = ds
+            self.available.move_to_end(name)
+            self._nbytes[name] = _estimate_ds_nbytes(ds)
+            self._record_signature(ds, name)
+            self._most_recent = name
+            self._evict()
 
     @property
     def most_recent(self):
-        if self._most_recent is not None:
-            return self.available[self._most_recent]
-        return None
+        with self._lock:
+            if self._most_recent is not None:
+                return self.available[self._most_recent]
+            return None
+
+    @property
+    def nbytes(self) -> int:
+        # the approximate memory held by all cached datasets
+        with self._lock:
+            return sum(self._nbytes.values())
 
     def get_ds(self, name: str):
-        if self.exists(name):
-            return self.available[name]
+        with self._lock:
+            if self.exists(name):
+                self.available.move_to_end(name)
+                return self.available[name]
         ytnapari_log.warning(f"{name} not found in cache.")
         return None
 
@@ -74,16 +201,89 @@ class DatasetCache:
         return name in self.available
 
     def rm_ds(self, name: str):
-        self.available.pop(name, None)
+        with self._lock:
+            self.available.pop(name, None)
+            self._nbytes.pop(name, None)
+            self._signatures.pop(name, None)
+            self._last_validated.pop(name, None)
+            if name == self._most_recent:
+                self._most_recent = None
 
     def rm_all(self):
-        self.available = {}
-        self._most_recent = None
+        with self._lock:
+            stats = self.stats()
+            ytnapari_log.info(
+                f"clearing the dataset cache: {stats['n_entries']} datasets "
+                f"(~{stats['nbytes']} bytes), {stats['hits']} hits, "
+                f"{stats['misses']} misses, {stats['loads']} loads "
+                f"({stats['load_time']:.2f} s), {stats['evictions']} evictions."
+            )
+            self.available = OrderedDict()
+            self._nbytes = {}
+            self._signatures = {}
+            self._last_validated = {}
+            self._most_recent = None
+
+    def _record_signature(self, ds, name: str):
+        # prefer the cache name when it is a path, fall back to the file yt read
+        path = name
+        if not os.path.isfile(name):
+            path = getattr(ds, "parameter_filename", None)
+        signature = _file_signature(path)
+        if signature is not None:
+            self._signatures[name] = (path, signature)
+            self._last_validated[name] = time.monotonic()
+
+    def is_stale(self, name: str) -> bool:
+        """
+        check if the file behind a cached dataset has changed since it was
+        cached, using at most one os.stat call.
+        """
+        with self._lock:
+            if name not in self._signatures:
+                # not backed by a file (in-memory, special or sample dataset)
+                return False
+
+            policy = ytcfg.get("yt_napari", "cache_validation")
+            if policy not in _validation_policies:
+                raise ValueError(
+                    f"cache_validation must be one of {_validation_policies}, "
+                    f"found {policy}"
+                )
+            if policy == "trust":
+                return False
+
+            now = time.monotonic()
+            if policy == "interval":
+                interval = ytcfg.get("yt_napari", "cache_validation_interval")
+                if now - self._last_validated[name] < interval:
+                    return False
 
-    def check_then_load(self, filename: str, cache_if_not_found: bool = True):
-        if self.exists(filename):
-            ytnapari_log.info(f"loading {filename} from cache.")
-            return self.get_ds(filename)
+            path, signature = self._signatures[name]
+            self._last_validated[name] = now
+            return _file_signature(path) != signature
+
+    def _evict(self):
+        # drop least-recently-used datasets until within the configured limits.
+        # the most recently used dataset is never evicted.
+        max_entries = ytcfg.get("yt_napari", "max_cached_datasets")
+        max_memory = ytcfg.get("yt_napari", "max_cache_memory")
+        while len(self.available) > 1:
+            over_count = max_entries > 0 and len(self.available) > max_entries
+            over_memory = max_memory > 0 and self.nbytes > max_memory
+            if not (over_count or over_memory):
+                break
+            name = next(iter(self.available))
+            nbytes = self._nbytes.get(name, 0)
+            self.rm_ds(name)
+            self._stats["evictions"] += 1
+            ytnapari_log.info(
+                f"evicted {name} from the dataset cache (~{nbytes} bytes)."
+            )
+
+    def _load(self, filename: str, loader: Optional[Callable] = None):
+        if loader is not None:
+            ds = loader(filename)
         elif callable_name := _check_for_special(filename):
             # the filename is actually a function handle! get it, call it
             # this allows yt-napari to use all the yt fake datasets in
@@ -95,9 +295,58 @@ class DatasetCache:
                 ds = _load_sample(filename)
             else:
                 ds = yt.load(filename)
+        return ds
+
+    def check_then_load(
+        self,
+        filename: str,
+        cache_if_not_found: Optional[bool] = None,
+        loader: Optional[Callable] = None,
+    ):
+        # return a cached dataset or load it. When cache_if_not_found is None,
+        # the in_memory_cache config option decides whether a newly loaded
+        # dataset is cached. loader, if provided, is called with the filename
+        # in place of the default loading logic.
+        with self._lock:
+            if self.exists(filename) and self.is_stale(filename):
+                ytnapari_log.info(f"{filename} changed on disk, reloading.")
+                _purge_yt_dataset_cache(self.available[filename])
+                self.rm_ds(filename)
+
+            if self.exists(filename):
+                ytnapari_log.info(f"loading {filename} from cache.")
+                self._stats["hits"] += 1
+                return self.get_ds(filename)
+
+            self._stats["misses"] += 1
+            pending = self._loading.get(filename, None)
+            is_first = pending is None
+            if is_first:
+                pending = Future()
+                self._loading[filename] = pending
+
+        if not is_first:
+            # another thread is already loading this file, share its result
+            ytnapari_log.info(f"waiting for {filename} to load in another thread.")
+            return pending.result()
 
-        if ytcfg.get("yt_napari", "in_memory_cache") and cache_if_not_found:
-            self.add_ds(ds, filename)
+        try:
+            t0 = time.perf_counter()
+            ds = self._load(filename, loader=loader)
+            with self._lock:
+                self._stats["loads"] += 1
+                self._stats["load_time"] += time.perf_counter() - t0
+            if cache_if_not_found is None:
+                cache_if_not_found = ytcfg.get("yt_napari", "in_memory_cache")
+            if cache_if_not_found:
+                self.add_ds(ds, filename)
+            pending.set_result(ds)
+        except BaseException as err:
+            pending.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(filename, None)
         return ds
 
 
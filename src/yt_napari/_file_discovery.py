@@ -0,0 +1,125 @@
+import fnmatch
+import os
+import re
+import threading
+from typing import List, Optional, Tuple
+
+_digits = re.compile(r"(\d+)")
+_magic = re.compile(r"[*?[]")
+
+
+def natural_sort_key(path: str) -> list:
+    # splits out runs of digits so that, e.g., DD10 sorts after DD9
+    return [int(tok) if tok.isdigit() else tok for tok in _digits.split(path)]
+
+
+class DirectoryListingCache:
+    # directory listings as naturally sorted (name, is_dir) tuples, keyed by
+    # directory. A listing is re-read with os.scandir only when the
+    # modification time of its directory changes. Access is guarded by a lock
+    # for use from worker threads.
+    def __init__(self):
+        self.listings = {}
+        self._lock = threading.Lock()
+
+    def get(self, directory: str) -> List[Tuple[str, bool]]:
+        directory = os.path.abspath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            cached = self.listings.get(directory, None)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with os.scandir(directory) as entries:
+                listing = [(entry.name, entry.is_dir()) for entry in entries]
+        except OSError:
+            return []
+        listing.sort(key=lambda entry: natural_sort_key(entry[0]))
+        with self._lock:
+            self.listings[directory] = (mtime, listing)
+        return listing
+
+    def rm_all(self):
+        with self._lock:
+            self.listings = {}
+
+
+directory_cache = DirectoryListingCache()
+
+
+def _match_part(base: str, part: str, is_last: bool) -> List[str]:
+    # the paths within base matching a single pattern component. As with
+    # glob, hidden entries only match patterns starting with a dot and
+    # intermediate components only match directories.
+    if _magic.search(part) is None:
+        path = os.path.join(base, part)
+        if os.path.isdir(path) or (is_last and os.path.exists(path)):
+            return [path]
+        return []
+
+    matches = []
+    for name, is_dir in directory_cache.get(base or os.curdir):
+        if name.startswith(".") and not part.startswith("."):
+            continue
+        if (is_dir or is_last) and fnmatch.fnmatch(name, part):
+            matches.append(os.path.join(base, name))
+    return matches
+
+
+def _split_pattern(pattern: str, pathmod=os.path) -> Tuple[str, List[str]]:
+    # splits a pattern into its root (the drive and root separator of
+    # absolute patterns, empty for relative patterns) and its components,
+    # separated by either of the separators of the path module (os.path by
+    # default), so that patterns written with "/" also work on Windows
+    drive, rest = pathmod.splitdrive(pattern)
+    seps = pathmod.sep + (pathmod.altsep or "")
+    root = drive
+    if rest[:1] != "" and rest[:1] in seps:
+        root = drive + pathmod.sep
+    parts = [part for part in re.split(f"[{re.escape(seps)}]", rest) if part != ""]
+    return root, parts
+
+
+def find_files(
+    pattern: str,
+    directory: Optional[str] = None,
+    file_range: Optional[Tuple[int, int, int]] = None,
+) -> List[str]:
+    """
+    return the paths matching a glob-style pattern in natural sort order.
+    Matching follows the case rules of the operating system, as with glob.
+
+    Parameters
+    ----------
+    pattern : str
+        the pattern to match, which may span directories, e.g., DD????/DD????
+    directory : str
+        the directory the pattern is relative to
+    file_range : Tuple[int, int, int]
+        (start, stop, step) of the matches to return
+
+    Returns
+    -------
+    List[str]
+        the matching paths
+    """
+    if directory is not None:
+        pattern = os.path.join(directory, pattern)
+
+    root, parts = _split_pattern(pattern)
+    paths = [root]
+    for ipart, part in enumerate(parts):
+        is_last = ipart == len(parts) - 1
+        paths = [match for path in paths for match in _match_part(path, part, is_last)]
+        if len(paths) == 0:
+            return []
+
+    paths.sort(key=natural_sort_key)
+    if file_range is not None:
+        paths = paths[slice(*file_range)]
+    return paths
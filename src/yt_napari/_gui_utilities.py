@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Callable, List, Optional, Union, get_args, get_origin
+from typing import Callable, List, Optional, Tuple, Union, get_args, get_origin
 
 import pydantic
 from magicgui import type_map, widgets
@@ -262,6 +262,19 @@ def handle_str_list_edit(widget_instance) -> List[str]:
     return widget_instance.value
 
 
+def get_resolution_widget(name: str):
+    # regions are sampled at a fixed resolution from the gui, the "auto"
+    # resolution is only available from json and the Scene
+    field_def = pydantic.fields.FieldInfo(
+        annotation=Tuple[int, int, int], default=(400, 400, 400)
+    )
+    return get_magicguidefault(name, field_def)
+
+
+def get_tuple_val(tuple_edit: widgets.TupleEdit) -> tuple:
+    return tuple_edit.value
+
+
 def _get_pydantic_model_field(
     py_model: pydantic.BaseModel, field: str
 ) -> pydantic.fields.Field:
@@ -316,6 +329,13 @@ def _register_yt_data_model(translator: MagicPydanticRegistry):
         pydantic_attr_factory=handle_str_list_edit,
     )
 
+    translator.register(
+        _data_model.Region,
+        "resolution",
+        magicgui_factory=get_resolution_widget,
+        magicgui_kwargs={"name": "resolution"},
+        pydantic_attr_factory=get_tuple_val,
+    )
     translator.register(
         _data_model.CoveringGrid,
         "level",
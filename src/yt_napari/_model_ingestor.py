@@ -1,17 +1,26 @@
+import itertools
+import json
 import os
+import queue
+import tempfile
+import threading
+import weakref
 from collections import defaultdict
-from typing import List, Optional, Tuple, Union
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, List, Optional, Tuple, Union, get_args
 
 import numpy as np
 import yt
 from unyt import unit_object, unit_registry, unyt_array, unyt_quantity
 
-from yt_napari import _special_loaders
+from yt_napari import _array_cache, _file_discovery, _parallel, _special_loaders
 from yt_napari._data_model import (
     CoveringGrid,
     DataContainer,
     InputModel,
     MetadataModel,
+    OrthoSlices,
+    OutputDtype,
     Region,
     SelectionObject,
     Slice,
@@ -20,6 +29,8 @@ from yt_napari._data_model import (
 )
 from yt_napari._ds_cache import dataset_cache
 from yt_napari._types import Layer, SpatialLayer
+from yt_napari.config import ytcfg
+from yt_napari.logging import ytnapari_log
 
 
 def _le_re_to_cen_wid(
@@ -31,22 +42,104 @@ def _le_re_to_cen_wid(
     return center, width
 
 
-def _get_covering_grid(
-    ds, left_edge, right_edge, level, num_ghost_zones, test_dims=None
-):
+# the cell widths of each refinement level, memoized by dataset
+_level_dds = weakref.WeakKeyDictionary()
+
+
+def _get_level_dds(ds, level: int) -> unyt_array:
+    # returns the cell widths of a uniform grid at a refinement level, matching
+    # the dds of a ds.covering_grid at that level
+    level_dds = _level_dds.setdefault(ds, {})
+    if level not in level_dds:
+        rdx = ds.domain_dimensions * ds.relative_refinement(0, level)
+        level_dds[level] = ds.domain_width / rdx.astype("float64")
+    return level_dds[level]
+
+
+def _get_finest_level(ds, left_edge: unyt_array, right_edge: unyt_array) -> int:
+    # the finest refinement level of the grids intersecting a box, falling
+    # back to the maximum level of the index for datasets without grids
+    index = ds.index
+    if not hasattr(index, "grid_levels"):
+        return int(getattr(index, "max_level", 0))
+    LE = left_edge.to("code_length").d
+    RE = right_edge.to("code_length").d
+    overlaps = np.all(
+        (index.grid_left_edge.to("code_length").d < RE)
+        & (index.grid_right_edge.to("code_length").d > LE),
+        axis=1,
+    )
+    if not np.any(overlaps):
+        return 0
+    return int(index.grid_levels[overlaps].max())
+
+
+def _get_auto_resolution(
+    ds, left_edge: unyt_array, right_edge: unyt_array
+) -> Tuple[int, int, int]:
+    # the resolution matching the finest cells within a box, reduced evenly
+    # along each axis to keep a float64 sample within the
+    # auto_resolution_max_memory config value (bytes, 0 for no limit)
+    level = _get_finest_level(ds, left_edge, right_edge)
+    dims = ((right_edge - left_edge) / _get_level_dds(ds, level)).d
+    res = np.maximum(np.ceil(np.round(dims, 6)), 1)
+
+    max_voxels = ytcfg.get("yt_napari", "auto_resolution_max_memory") // 8
+    n_voxels = np.prod(res)
+    if max_voxels > 0 and n_voxels > max_voxels:
+        res = np.maximum(np.floor(res * (max_voxels / n_voxels) ** (1.0 / 3)), 1)
+    res = tuple(int(r) for r in res)
+    ytnapari_log.info(f"sampling level {level} region at resolution {res}")
+    return res
+
+
+def _get_progressive_factors(coarsening: Optional[int] = None) -> List[int]:
+    # the per-axis reduction factors of a progressive load, from the
+    # progressive_coarsening config value halving down to 1
+    if coarsening is None:
+        coarsening = ytcfg.get("yt_napari", "progressive_coarsening")
+    factors = [max(int(coarsening), 1)]
+    while factors[-1] > 1:
+        factors.append(factors[-1] // 2)
+    return factors
+
+
+def _coarsen_resolution(resolution, factor: int) -> Tuple[int, ...]:
+    return tuple(max(int(res) // factor, 1) for res in resolution)
+
+
+def _get_progressive_resolutions(
+    resolution, coarsening: Optional[int] = None
+) -> List[Tuple[int, ...]]:
+    # the distinct resolutions of a progressive load, from coarse to fine
+    resolutions = []
+    for factor in _get_progressive_factors(coarsening):
+        res = _coarsen_resolution(resolution, factor)
+        if res not in resolutions:
+            resolutions.append(res)
+    return resolutions
+
+
+def _get_covering_grid_dims(ds, left_edge, right_edge, level) -> unyt_array:
+    # the resolution of a covering grid, without building the index
+    return (right_edge - left_edge) / _get_level_dds(ds, level)
+
+
+def _get_covering_grid(ds, left_edge, right_edge, level, num_ghost_zones):
     # returns a covering grid instance and the resolution of the covering grid
-    if test_dims is None:
-        test_dims = (4, 4, 4)
-    nghostzones = num_ghost_zones
-    temp_cg = ds.covering_grid(level, left_edge, test_dims, num_ghost_zones=nghostzones)
-    effective_dds = temp_cg.dds
-    dims = (right_edge - left_edge) / effective_dds
-    # get the actual covering grid
-    frb = ds.covering_grid(level, left_edge, dims, num_ghost_zones=nghostzones)
+    dims = _get_covering_grid_dims(ds, left_edge, right_edge, level)
+    frb = ds.covering_grid(level, left_edge, dims, num_ghost_zones=num_ghost_zones)
     return frb, dims
 
 
-def _get_region_frb(ds, LE, RE, res):
+def _get_region_frb(ds, LE, RE, res, tile_size=None, dtype=None):
+    # returns the arbitrary grid sampling a region, or a _TiledRegion when the
+    # resolution exceeds the tile size (defaulting to region_tile_size).
+    if tile_size is None:
+        tile_size = ytcfg.get("yt_napari", "region_tile_size")
+    if tile_size > 0 and any(r > tile_size for r in res):
+        return _TiledRegion(ds, LE, RE, res, tile_size, dtype=dtype)
+
     frb = ds.r[
         LE[0] : RE[0] : res[0] * 1j,  # noqa: E203
         LE[1] : RE[1] : res[1] * 1j,  # noqa: E203
@@ -55,6 +148,75 @@ def _get_region_frb(ds, LE, RE, res):
     return frb
 
 
+def _allocate_array(shape, dtype, dir_setting: str) -> np.ndarray:
+    # returns an empty array, memory-mapped to a file in the directory set by
+    # the dir_setting config option when that option is not empty
+    directory = ytcfg.get("yt_napari", dir_setting)
+    if not directory:
+        return np.empty(shape, dtype=dtype)
+
+    directory = os.path.expanduser(directory)
+    os.makedirs(directory, exist_ok=True)
+    fd, fname = tempfile.mkstemp(suffix=".dat", dir=directory)
+    os.close(fd)
+    output = np.memmap(fname, dtype=dtype, mode="w+", shape=shape)
+    try:
+        # the mapping remains valid, the space is freed with the array
+        os.remove(fname)
+    except OSError:
+        pass
+    return output
+
+
+class _TiledRegion:
+    # samples a region in tiles, standing in for the single arbitrary grid
+    # from ds.r. Tiles are aligned with the output pixel grid, so the result
+    # matches sampling the whole region at once while the memory used by yt
+    # is bounded by the tile size. Each field is written to a preallocated
+    # output array: an np.memmap in the region_tile_dir config directory if
+    # set, an in-memory array otherwise.
+    def __init__(self, ds, left_edge, right_edge, resolution, tile_size, dtype=None):
+        self.ds = ds
+        self.left_edge = left_edge
+        self.right_edge = right_edge
+        self.resolution = tuple(int(r) for r in resolution)
+        self.tile_size = tile_size
+        self.dtype = np.float64 if dtype is None else dtype
+        self.field_data = {}
+
+    def _tiles(self):
+        # yields the output slices, left edge, right edge and dimensions of
+        # each tile
+        dx = (self.right_edge - self.left_edge) / np.array(self.resolution)
+        starts = [range(0, n, self.tile_size) for n in self.resolution]
+        for i0 in itertools.product(*starts):
+            i1 = [min(i + self.tile_size, n) for i, n in zip(i0, self.resolution)]
+            slcs = tuple(slice(i, j) for i, j in zip(i0, i1))
+            LE = self.left_edge + dx * np.array(i0)
+            RE = self.left_edge + dx * np.array(i1)
+            yield slcs, LE, RE, [j - i for i, j in zip(i0, i1)]
+
+    def _allocate(self) -> np.ndarray:
+        return _allocate_array(self.resolution, self.dtype, "region_tile_dir")
+
+    def get_data(self, fields: List[Tuple[str, str]]):
+        # sample all of the fields together, one tile at a time
+        new_fields = [field for field in fields if field not in self.field_data]
+        if len(new_fields) == 0:
+            return
+        output = {field: self._allocate() for field in new_fields}
+        for slcs, LE, RE, dims in self._tiles():
+            tile = _get_region_frb(self.ds, LE, RE, dims, tile_size=0)
+            tile.get_data(new_fields)
+            for field in new_fields:
+                output[field][slcs] = np.asarray(tile[field])
+        self.field_data.update(output)
+
+    def __getitem__(self, field: Tuple[str, str]) -> np.ndarray:
+        self.get_data([field])
+        return self.field_data[field]
+
+
 class LayerDomain:
     # container for domain info for a single layer
     # left_edge, right_edge, resolution, n_d are all self explanatory.
@@ -221,27 +383,61 @@ def selections_match(sel_1: Union[Slice, Region], sel_2: Union[Slice, Region]) -
     return True
 
 
+def _selection_key(
+    selection: Union[Slice, Region], current_field: Tuple[str, str]
+) -> str:
+    # a canonical key for a selection and field, matching selections_match:
+    # selections of the same type with the same attributes (ignoring the list
+    # of fields) share a key
+    contents = [
+        type(selection).__name__,
+        selection.model_dump(mode="json", exclude={"fields"}),
+        list(current_field),
+    ]
+    return json.dumps(contents, sort_keys=True, default=str)
+
+
 class TimeseriesContainer:
-    # for storing image layers across timesteps by selections
-    def __init__(self):
+    # for storing image layers across timesteps by selections. When the number
+    # of timesteps is known up front, the images of each selection are copied
+    # into a preallocated (n_steps, ...) stack as they are added (memory-mapped
+    # when the timeseries_stack_dir config option is set) rather than kept
+    # as separate layers.
+    def __init__(self, n_steps: Optional[int] = None):
+        self.n_steps = n_steps
         self.layers_in_selections = defaultdict(lambda: [])
         self.selection_objs = {}
         self.selection_field = {}
+        self.selection_ids = {}
+        self.stacks = {}
+        self.stack_layers = defaultdict(lambda: [])
 
     def check_for_selection(
         self, selection: Union[Slice, Region], current_field: Tuple[str, str]
     ) -> int:
-        for sel_id, sel_obj in self.selection_objs.items():
-            sel_field = self.selection_field[sel_id]
-            if selections_match(sel_obj, selection) and current_field == sel_field:
-                return sel_id
+        key = _selection_key(selection, current_field)
+        if key in self.selection_ids:
+            return self.selection_ids[key]
 
         # does not exist yet, add it
         sel_id = len(self.selection_objs)
+        self.selection_ids[key] = sel_id
         self.selection_objs[sel_id] = selection
         self.selection_field[sel_id] = current_field
         return sel_id
 
+    def _add_to_stack(self, sel_id: int, new_layer: SpatialLayer):
+        # copies the image into the stack, keeping the rest of the layer
+        im, im_kwargs, im_label, layer_domain = new_layer
+        step = len(self.stack_layers[sel_id])
+        if sel_id not in self.stacks:
+            shape = (self.n_steps,) + im.shape
+            self.stacks[sel_id] = _allocate_array(
+                shape, im.dtype, "timeseries_stack_dir"
+            )
+        self.stacks[sel_id][step] = im
+        self.stack_layers[sel_id].append((None, im_kwargs, im_label, layer_domain))
+
     def add(
         self,
         selection: Union[Slice, Region],
@@ -255,9 +451,32 @@ class TimeseriesContainer:
             im_kwargs["scale"] = 1.0 / layer_domain.aspect_ratio
             new_layer = (im, im_kwargs, im_label, layer_domain)
 
-        self.layers_in_selections[sel_id].append(new_layer)
+        if self.n_steps is None:
+            self.layers_in_selections[sel_id].append(new_layer)
+        else:
+            self._add_to_stack(sel_id, new_layer)
+
+    def _concat_stack(self, id: int) -> Layer:
+        the_layers = self.stack_layers[id]
+        im = self.stacks[id][: len(the_layers)]
+        _, im_kwargs, layer_type, _ = the_layers[0]
+        if im_kwargs.get("metadata", {}).get("_quantization") is not None:
+            quantizations = [lyr[1]["metadata"]["_quantization"] for lyr in the_layers]
+            data_range, new_quantization = _get_shared_quantization(
+                quantizations, str(im.dtype)
+            )
+            for step, quantization in enumerate(quantizations):
+                im[step] = _requantize(im[step], quantization, new_quantization)
+            im_kwargs = im_kwargs.copy()
+            im_kwargs["metadata"] = im_kwargs["metadata"].copy()
+            im_kwargs["metadata"]["_data_range"] = data_range
+            im_kwargs["metadata"]["_quantization"] = new_quantization
+        return im, im_kwargs, layer_type
 
     def concat_by_selection_id(self, id: int) -> Layer:
+        if id in self.stacks:
+            return self._concat_stack(id)
+
         the_layers = self.layers_in_selections[id]
         if len(the_layers) == 1:
             return the_layers[0]
@@ -267,6 +486,8 @@ class TimeseriesContainer:
         # assuming that im_kwargs, layer_type do not change. also dr
         _, im_kwargs, layer_type, domain = the_layers[0]
         im_arrays = [im[0] for im in the_layers]
+        if im_kwargs.get("metadata", {}).get("_quantization") is not None:
+            im_arrays, im_kwargs = _unify_quantization(the_layers)
         im = np.stack(im_arrays, axis=0)  # this operation will preserve dask arrays
         return im, im_kwargs, layer_type
 
@@ -282,11 +503,46 @@ class TimeseriesContainer:
         return layer_list
 
 
+def _get_shared_quantization(
+    quantizations: List[Tuple[float, float]], dtype: str
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    # the data range covered by a set of quantizations and the quantization
+    # of that range
+    imax = np.iinfo(dtype).max
+    data_range = (
+        min(offset + scale for scale, offset in quantizations),
+        max(offset + scale * imax for scale, offset in quantizations),
+    )
+    return data_range, _get_quantization(data_range, dtype)
+
+
+def _unify_quantization(layers: List[SpatialLayer]) -> Tuple[List[np.ndarray], dict]:
+    # quantized timesteps each have their own (scale, offset). Returns the
+    # arrays re-quantized to the range covering all timesteps along with
+    # image kwargs carrying the shared metadata.
+    quantizations = [layer[1]["metadata"]["_quantization"] for layer in layers]
+    data_range, new_quantization = _get_shared_quantization(
+        quantizations, str(layers[0][0].dtype)
+    )
+    im_arrays = [
+        _requantize(layer[0], quantization, new_quantization)
+        for layer, quantization in zip(layers, quantizations)
+    ]
+
+    im_kwargs = layers[0][1].copy()
+    im_kwargs["metadata"] = im_kwargs["metadata"].copy()
+    im_kwargs["metadata"]["_data_range"] = data_range
+    im_kwargs["metadata"]["_quantization"] = new_quantization
+    return im_arrays, im_kwargs
+
+
 def create_metadata_dict(
     data: np.ndarray,
     layer_domain: LayerDomain,
     is_log: bool,
     reference_layer: Optional[ReferenceLayer] = None,
+    data_range: Optional[Tuple[float, float]] = None,
+    quantization: Optional[Tuple[float, float]] = None,
     **kwargs,
 ) -> dict:
     """
@@ -301,6 +557,14 @@ def create_metadata_dict(
         the LayerDomain object of the new layer
     is_log :
         True if the data has been logged
+    reference_layer :
+        the ReferenceLayer object used in aligning this layer
+    data_range :
+        the (min, max) of the data, if already known. Computed from the data
+        when not provided, unless the data is a lazy (e.g., dask) array.
+    quantization :
+        the (scale, offset) of data stored as a quantized integer dtype, such
+        that value = stored_value * scale + offset.
     kwargs :
         any additional keyword arguments will be added to the dict
 
@@ -310,7 +574,7 @@ def create_metadata_dict(
         a metadata dict for napari with some consistent key-value pairs, will
         always include the following:
         _data_range : Tuple(float, float)
-            the min/max value of the supplied data
+            the min/max value of the supplied data, None for lazy arrays
         _layer_domain :
             the LayerDomain object of the new layer
         _is_log :
@@ -319,13 +583,18 @@ def create_metadata_dict(
             bool, always True.
         _reference_layer :
             the ReferenceLayer object used in aligning this layer
+        _quantization :
+            the (scale, offset) of quantized data, None otherwise
     """
     md = {}
-    md["_data_range"] = (data.min(), data.max())
+    if data_range is None and isinstance(data, np.ndarray):
+        data_range = (data.min(), data.max())
+    md["_data_range"] = data_range
     md["_layer_domain"] = layer_domain
     md["_is_log"] = is_log
     md["_yt_napari_layer"] = True
     md["_reference_layer"] = reference_layer
+    md["_quantization"] = quantization
     for ky, val in kwargs.items():
         md[ky] = val
     return md
@@ -449,61 +718,161 @@ class PhysicalDomainTracker:
         self.center, self.width = center_wid
 
 
-def _load_3D_regions(
-    ds,
-    selections: SelectionObject,
-    layer_list: list,
-    timeseries_container: Optional[TimeseriesContainer] = None,
-) -> list:
+def _get_region_edges(
+    ds, sel: Union[Region, CoveringGrid]
+) -> Tuple[unyt_array, unyt_array]:
+    # get the left, right edge as a unitful array, defaulting to the domain
+    if sel.left_edge is None:
+        LE = ds.domain_left_edge
+    else:
+        LE = ds.arr(sel.left_edge.value, sel.left_edge.unit)
 
-    sels = []
-    for seltype in ("regions", "covering_grids"):
-        if getattr(selections, seltype) is not None:
-            sels += [sel for sel in getattr(selections, seltype)]
-
-    for sel in sels:
-        # get the left, right edge as a unitful array, initialize the layer
-        # domain tracking for this layer and update the global domain extent
-        if sel.left_edge is None:
-            LE = ds.domain_left_edge
-        else:
-            LE = ds.arr(sel.left_edge.value, sel.left_edge.unit)
+    if sel.right_edge is None:
+        RE = ds.domain_right_edge
+    else:
+        RE = ds.arr(sel.right_edge.value, sel.right_edge.unit)
+    return LE, RE
 
-        if sel.right_edge is None:
-            RE = ds.domain_right_edge
-        else:
-            RE = ds.arr(sel.right_edge.value, sel.right_edge.unit)
 
-        if isinstance(sel, Region):
-            res = sel.resolution
-            frb = _get_region_frb(ds, LE, RE, res)
-        elif isinstance(sel, CoveringGrid):
-            frb, dims = _get_covering_grid(ds, LE, RE, sel.level, sel.num_ghost_zones)
-            res = dims
+def _resolve_resolution(
+    ds, sel: Region, left_edge: unyt_array, right_edge: unyt_array
+) -> Region:
+    # replaces an "auto" resolution with the chosen one, so that sampled
+    # arrays are cached by their actual resolution
+    if sel.resolution != "auto":
+        return sel
+    res = _get_auto_resolution(ds, left_edge, right_edge)
+    return sel.model_copy(update={"resolution": res})
+
 
-        layer_domain = LayerDomain(left_edge=LE, right_edge=RE, resolution=res)
-        for field_container in sel.fields:
-            field = (field_container.field_type, field_container.field_name)
+def _load_3D_region(
+    ds, sel: Union[Region, CoveringGrid], cache_arrays: Optional[bool] = True
+) -> List[SpatialLayer]:
+    if isinstance(sel, CoveringGrid) and sel.multiscale:
+        return _load_multiscale_grid(ds, sel, cache_arrays)
 
-            data = frb[field]  # extract the field (the slow part)
-            if field_container.take_log:
-                data = np.log10(data)
+    # the yt data object is only built if a field is missing from the caches
+    LE, RE = _get_region_edges(ds, sel)
+    if isinstance(sel, Region):
+        sel = _resolve_resolution(ds, sel, LE, RE)
+        res = sel.resolution
+        # sample tiled regions straight into float32 outputs when possible
+        dtype = np.float32 if sel.dtype == "float32" else None
 
-            if sel.rescale:
-                data = _linear_rescale(data)
+        def get_frb():
+            return _get_region_frb(ds, LE, RE, res, dtype=dtype)
 
-            # create a metadata dict and set a name
-            fieldname = ":".join(field)
-            md = create_metadata_dict(data, layer_domain, field_container.take_log)
-            add_kwargs = {"name": fieldname, "metadata": md}
-            layer_type = "image"
+    elif isinstance(sel, CoveringGrid):
+        res = _get_covering_grid_dims(ds, LE, RE, sel.level)
 
-            new_layer = (data, add_kwargs, layer_type, layer_domain)
-            layer_list.append(new_layer)
-            if timeseries_container is not None:
-                timeseries_container.add(sel, field, new_layer)
+        def get_frb():
+            return _get_covering_grid(ds, LE, RE, sel.level, sel.num_ghost_zones)[0]
 
-    return layer_list
+    layer_domain = LayerDomain(left_edge=LE, right_edge=RE, resolution=res)
+    sampled = _sample_fields(ds, get_frb, sel, layer_domain, cache_arrays)
+    return _build_layers(sel, layer_domain, sampled)
+
+
+def _load_multiscale_grid(
+    ds, sel: CoveringGrid, cache_arrays: Optional[bool] = True
+) -> List[SpatialLayer]:
+    # samples a covering grid at every level from 0 to sel.level, coarsest
+    # first, and returns one multiscale layer per field with the arrays
+    # ordered from finest to coarsest as napari expects. Each level is sampled
+    # (and cached) as a separate covering grid, the layer domain is that of
+    # the finest level. Levels coarser than the selection are skipped.
+    # Every level is sampled before returning, since the levels share a data
+    # range and quantization: the layer does not appear progressively (see
+    # Scene.add_region(..., progressive=True) for progressive regions).
+    LE, RE = _get_region_edges(ds, sel)
+    level_domains = []
+    level_samples = []
+    for level in range(sel.level + 1):
+        dims = _get_covering_grid_dims(ds, LE, RE, level)
+        if np.any(dims < 1):
+            continue
+
+        def get_frb(level=level):
+            return _get_covering_grid(ds, LE, RE, level, sel.num_ghost_zones)[0]
+
+        level_domain = LayerDomain(left_edge=LE, right_edge=RE, resolution=dims)
+        # levels are rescaled together below
+        level_sel = sel.model_copy(
+            update={"level": level, "multiscale": False, "rescale": False}
+        )
+        level_domains.append(level_domain)
+        level_samples.append(
+            _sample_fields(ds, get_frb, level_sel, level_domain, cache_arrays)
+        )
+    if len(level_domains) == 0:
+        raise ValueError(
+            f"the multiscale covering grid from {LE} to {RE} has no cells at "
+            f"any level up to level {sel.level}, enlarge the region or increase "
+            "the level."
+        )
+
+    sampled = []
+    for ifield in range(len(sel.fields)):
+        levels = [samples[ifield] for samples in level_samples[::-1]]
+        sampled.append(_combine_levels(levels, sel.rescale))
+    return _build_layers(sel, level_domains[-1], sampled, multiscale=True)
+
+
+def _combine_levels(
+    levels: List[Tuple[np.ndarray, Tuple[float, float], Optional[tuple]]],
+    rescale: bool,
+) -> Tuple[List[np.ndarray], Tuple[float, float], Optional[tuple]]:
+    # combines the sampled levels of a field into a single multiscale entry
+    # with a shared data range and, for quantized dtypes, a shared
+    # quantization. Rescaling of quantized data only changes the quantization.
+    data = [level[0] for level in levels]
+    data_range = (
+        float(np.nanmin([level[1][0] for level in levels])),
+        float(np.nanmax([level[1][1] for level in levels])),
+    )
+    quantization = levels[0][2]
+    if quantization is not None:
+        quantization = _get_quantization(data_range, str(data[0].dtype))
+        data = [_requantize(level[0], level[2], quantization) for level in levels]
+
+    if rescale and data_range[1] > data_range[0]:
+        data_min = data_range[0]
+        width = data_range[1] - data_min
+        if quantization is None:
+            data = [(level_data - data_min) / width for level_data in data]
+        else:
+            scale, offset = quantization
+            quantization = (scale / width, (offset - data_min) / width)
+        data_range = (0.0, 1.0)
+    return data, data_range, quantization
+
+
+def _build_layers(
+    sel: Union[Region, CoveringGrid, Slice],
+    layer_domain: LayerDomain,
+    sampled: List[Tuple[np.ndarray, Tuple[float, float], Optional[tuple]]],
+    multiscale: Optional[bool] = False,
+) -> List[SpatialLayer]:
+    # assemble an image layer for each sampled field of a selection
+    layers = []
+    for field_container, (data, data_range, quantization) in zip(sel.fields, sampled):
+        field = (field_container.field_type, field_container.field_name)
+
+        # create a metadata dict and set a name
+        fieldname = ":".join(field)
+        md = create_metadata_dict(
+            data,
+            layer_domain,
+            field_container.take_log,
+            data_range=data_range,
+            quantization=quantization,
+        )
+        add_kwargs = {"name": fieldname, "metadata": md}
+        if multiscale:
+            add_kwargs["multiscale"] = True
+        layer_type = "image"
+        layers.append((data, add_kwargs, layer_type, layer_domain))
+    return layers
 
 
 def _process_slice(
@@ -514,10 +883,40 @@ def _process_slice(
     height: Optional[unyt_quantity] = None,
     resolution: Optional[Tuple[int, int]] = (400, 400),
     periodic: Optional[bool] = False,
+    slc=None,
+) -> tuple:
+    # returns a slice frb and a LayerDomain for a slice. The frb is pixelized
+    # from slc when provided (see _get_shared_slices), otherwise from a new
+    # yt slice object.
+    center, width, height, layer_domain = _get_slice_domain(
+        ds, normal, center, width, height, resolution
+    )
+
+    if slc is None:
+        normal_ax = ds.coordinates.axis_id[normal]
+        slc = ds.slice(normal_ax, center[normal_ax])
+    frb = slc.to_frb(
+        width=width,
+        height=height,
+        center=center,
+        resolution=resolution,
+        periodic=periodic,
+    )
+
+    return frb, layer_domain
+
+
+def _get_slice_domain(
+    ds,
+    normal: Union[str, int],
+    center: Optional[unyt_array] = None,
+    width: Optional[unyt_quantity] = None,
+    height: Optional[unyt_quantity] = None,
+    resolution: Optional[Tuple[int, int]] = (400, 400),
 ) -> tuple:
-    # returns a slice frb and a LayerDomain for a slice
+    # returns the center, width and height of a slice with the domain defaults
+    # filled in, along with its LayerDomain. Does not build the index.
     axis_id = ds.coordinates.axis_id
-    normal_ax = axis_id[normal]
     x_axis = axis_id[ds.coordinates.image_axis_name[normal][0]]
     y_axis = axis_id[ds.coordinates.image_axis_name[normal][1]]
 
@@ -535,15 +934,6 @@ def _process_slice(
     LE[1] = center[y_axis] - height / 2.0
     RE[1] = center[y_axis] + height / 2.0
 
-    slc = ds.slice(normal_ax, center[normal_ax])
-    frb = slc.to_frb(
-        width=width,
-        height=height,
-        center=center,
-        resolution=resolution,
-        periodic=periodic,
-    )
-
     layer_domain = LayerDomain(
         left_edge=LE,
         right_edge=RE,
@@ -552,42 +942,415 @@ def _process_slice(
         new_dim_axis=2,
         new_dim_value=0.0,
     )
+    return center, width, height, layer_domain
 
-    return frb, layer_domain
 
+def _orient_slice_in_3D(
+    ds,
+    normal: Union[str, int],
+    center: Optional[unyt_array],
+    layer_domain: LayerDomain,
+    images: list,
+) -> Tuple[LayerDomain, list]:
+    # returns a 3D LayerDomain for a slice, one pixel thick along the normal
+    # and centered on the slice coordinate, along with views of its (y, x)
+    # images indexed by domain axis, so that the slice lines up with 3D
+    # selections.
+    axis_id = ds.coordinates.axis_id
+    normal_ax = axis_id[normal]
+    x_axis = axis_id[ds.coordinates.image_axis_name[normal][0]]
+    y_axis = axis_id[ds.coordinates.image_axis_name[normal][1]]
+    if center is None:
+        center = ds.domain_center
 
-def _linear_rescale(data, fill_inf=True):
-    # rescales an array between 0, 1 handling nans and infs
-    if fill_inf:
-        data[np.isinf(data)] = np.nan
-    data_max = np.nanmax(data)
-    data_min = np.nanmin(data)
-    return (data - data_min) / (data_max - data_min)
+    coord = center[normal_ax].to("code_length").d
+    half_width = layer_domain.grid_width[0].to("code_length").d / 2.0
+    LE = np.zeros(3)
+    RE = np.zeros(3)
+    LE[[x_axis, y_axis]] = layer_domain.left_edge.to("code_length").d
+    RE[[x_axis, y_axis]] = layer_domain.right_edge.to("code_length").d
+    LE[normal_ax] = coord - half_width
+    RE[normal_ax] = coord + half_width
+    resolution = [1, 1, 1]
+    resolution[x_axis] = int(layer_domain.resolution[0])
+    resolution[y_axis] = int(layer_domain.resolution[1])
+
+    domain_3D = LayerDomain(
+        left_edge=ds.arr(LE, "code_length"),
+        right_edge=ds.arr(RE, "code_length"),
+        resolution=tuple(resolution),
+    )
+    # as in upgrade_to_3D, the new axis does not distort the slice
+    aspect_ratio = np.ones(3)
+    aspect_ratio[y_axis] = layer_domain.aspect_ratio[1]
+    domain_3D.aspect_ratio = unyt_array(aspect_ratio, "")
+    domain_3D.requires_scale = layer_domain.requires_scale
+    order = np.argsort([y_axis, x_axis, normal_ax])
+    images = [np.transpose(im[..., np.newaxis], order) for im in images]
+    return domain_3D, images
+
+
+# the number of elements finalized at a time, 512 kB of float64
+_finalize_chunk_size = 65536
+
+
+def _chunks(flat: np.ndarray):
+    # yields consecutive views of a 1D array
+    for start in range(0, flat.size, _finalize_chunk_size):
+        yield flat[start : start + _finalize_chunk_size]  # noqa: E203
+
+
+def _finalize_data(
+    data, take_log: bool, rescale: Optional[bool] = False
+) -> Tuple[np.ndarray, Tuple[float, float]]:
+    # applies the final log10, inf to nan (when rescaling) and linear rescale
+    # steps to a freshly sampled array, returning the array along with its
+    # (min, max) ignoring nans. The work happens in place, so data must not be
+    # shared, and in cache-sized chunks: a single pass over the array plus a
+    # second one when rescaling. Only non-float, non-contiguous or read-only
+    # inputs are copied.
+    buffer = np.asarray(data)
+    if not np.issubdtype(buffer.dtype, np.floating):
+        buffer = buffer.astype(np.float64)
+    elif not buffer.flags.c_contiguous or not buffer.flags.writeable:
+        buffer = np.array(buffer, order="C")
+    flat = buffer.reshape(-1)
+
+    data_min = np.inf
+    data_max = -np.inf
+    for chunk in _chunks(flat):
+        if take_log:
+            np.log10(chunk, out=chunk)
+        if rescale:
+            chunk[np.isinf(chunk)] = np.nan
+        # fmin/fmax ignore nans, min/max below ignore all-nan chunks
+        data_min = min(data_min, np.fmin.reduce(chunk))
+        data_max = max(data_max, np.fmax.reduce(chunk))
+
+    if data_min > data_max:
+        # no values or all nan
+        return buffer, (np.nan, np.nan)
+
+    if rescale:
+        width = data_max - data_min
+        for chunk in _chunks(flat):
+            chunk -= data_min
+            chunk /= width
+        data_range = (0.0, 1.0)
+    else:
+        data_range = (data_min, data_max)
+    return buffer, (float(data_range[0]), float(data_range[1]))
+
+
+_quantized_dtypes = ("uint8", "uint16")
+
+
+def _validate_dtype(dtype: Optional[str]):
+    if dtype is not None and dtype not in get_args(OutputDtype):
+        raise ValueError(f"dtype must be one of {get_args(OutputDtype)}, found {dtype}")
+
+
+def _get_quantization(
+    data_range: Tuple[float, float], dtype: str
+) -> Tuple[float, float]:
+    # returns the (scale, offset) that maps the data range onto 1, ..., max
+    # of an unsigned integer dtype, such that value = stored * scale + offset.
+    # 0 is reserved for nan values.
+    imax = np.iinfo(dtype).max
+    dmin, dmax = data_range
+    scale = (dmax - dmin) / (imax - 1) if dmax > dmin else 1.0
+    return float(scale), float(dmin - scale)
+
+
+def _finite_range(data) -> Tuple[float, float]:
+    # the (min, max) of the finite values of an array
+    data = np.asarray(data)
+    finite = data[np.isfinite(data)]
+    if finite.size == 0:
+        return 0.0, 0.0
+    return float(finite.min()), float(finite.max())
+
+
+def _cast_to_dtype(
+    data,
+    dtype: Optional[str],
+    data_range: Optional[Tuple[float, float]] = None,
+    quantization: Optional[Tuple[float, float]] = None,
+) -> Tuple[np.ndarray, Optional[Tuple[float, float]]]:
+    # returns the final image array in the output dtype and, for quantized
+    # dtypes, the (scale, offset) used. data is unchanged for float64 (or
+    # None). Quantized arrays map the data range (or the finite range of the
+    # data) to 1, ..., max unless an existing quantization is given; nans are
+    # stored as 0 and out of range values are clipped.
+    _validate_dtype(dtype)
+    if dtype is None or dtype == "float64":
+        return data, None
+    if dtype not in _quantized_dtypes:
+        return np.asarray(data, dtype=dtype), None
+
+    if quantization is None:
+        if data_range is None or not np.all(np.isfinite(data_range)):
+            data_range = _finite_range(data)
+        quantization = _get_quantization(data_range, dtype)
+    scale, offset = quantization
+
+    # quantize in chunks to avoid full-size temporaries
+    values = np.ascontiguousarray(data).reshape(-1)
+    qdata = np.empty(values.shape, dtype=dtype)
+    imax = np.iinfo(dtype).max
+    for chunk, qchunk in zip(_chunks(values), _chunks(qdata)):
+        scaled = (chunk - offset) / scale
+        nans = np.isnan(scaled)
+        np.clip(scaled, 1, imax, out=scaled)
+        scaled[nans] = 0
+        np.rint(scaled, out=scaled)
+        qchunk[:] = scaled
+    return qdata.reshape(np.shape(data)), quantization
+
+
+def _requantize(
+    data: np.ndarray,
+    quantization: Tuple[float, float],
+    new_quantization: Tuple[float, float],
+) -> np.ndarray:
+    # maps quantized data onto a different (scale, offset), preserving nans
+    if tuple(quantization) == tuple(new_quantization):
+        return data
+    scale, offset = quantization
+    values = data * scale + offset
+    values[data == 0] = np.nan
+    new_data, _ = _cast_to_dtype(
+        values, str(data.dtype), quantization=tuple(new_quantization)
+    )
+    return new_data
 
 
-def _load_2D_slices(
+def _cacheable_metadata(
+    data_range: Tuple[float, float],
+    layer_domain: LayerDomain,
+    is_log: bool,
+    quantization: Optional[Tuple[float, float]] = None,
+) -> dict:
+    # a json-compatible version of the create_metadata_dict contents
+    units = str(layer_domain.left_edge.units)
+    if quantization is not None:
+        quantization = list(quantization)
+    return {
+        "_data_range": list(data_range),
+        "_is_log": is_log,
+        "_quantization": quantization,
+        "_layer_domain": {
+            "left_edge": layer_domain.left_edge.to(units).d.tolist(),
+            "right_edge": layer_domain.right_edge.to(units).d.tolist(),
+            "units": units,
+            "resolution": layer_domain.resolution.d.tolist(),
+            "n_d": layer_domain.n_d,
+        },
+    }
+
+
+def _read_fields(frb, fields: List[Tuple[str, str]]):
+    # reads a list of fields in a single pass over the grids rather than one
+    # pass per field. Slice frbs pixelize from the field data of the
+    # underlying slice object, so it is the slice that gets read.
+    data_source = getattr(frb, "data_source", frb)
+    data_source.get_data(fields)
+
+
+def _sample_fields(
     ds,
-    selections: SelectionObject,
-    layer_list: list,
-    timeseries_container: Optional[TimeseriesContainer] = None,
-) -> list:
-    for slice in selections.slices:
-        if slice.center is None:
-            c = None
-        else:
-            c = ds.arr(slice.center.value, slice.center.unit)
+    get_frb: Callable,
+    sel: Union[Region, CoveringGrid, Slice],
+    layer_domain: LayerDomain,
+    cache_arrays: Optional[bool] = True,
+) -> List[Tuple[np.ndarray, Tuple[float, float], Optional[tuple]]]:
+    # returns the final image array, data range and quantization (see
+    # _cast_to_dtype) for every field of a selection, in order. Arrays
+    # previously sampled from the same file, selection and field are pulled
+    # from the array caches without touching the dataset: get_frb, which
+    # builds the yt data object to sample, is only called if a field is
+    # missing from the caches. The missing fields are read together before
+    # the per-field processing. New arrays are only kept in memory if
+    # cache_arrays is True.
+    cache_keys = [_array_cache.get_cache_key(ds, sel, fc) for fc in sel.fields]
+    cached = [_array_cache.get_cached_array(key) for key in cache_keys]
+
+    to_read = []
+    for field_container, cached_array in zip(sel.fields, cached):
+        field = (field_container.field_type, field_container.field_name)
+        if cached_array is None and field not in to_read:
+            to_read.append(field)
+    frb = get_frb() if len(to_read) > 0 else None
+    if len(to_read) > 1:
+        _read_fields(frb, to_read)  # extract the fields (the slow part)
+
+    all_fields = [(fc.field_type, fc.field_name) for fc in sel.fields]
+    repeated = {fld for fld in all_fields if all_fields.count(fld) > 1}
+
+    sampled = []
+    for field_container, cache_key, cached_array in zip(sel.fields, cache_keys, cached):
+        if cached_array is not None:
+            data, md = cached_array
+            quantization = md.get("_quantization", None)
+            if quantization is not None:
+                quantization = tuple(quantization)
+            sampled.append((data, tuple(md["_data_range"]), quantization))
+            continue
+
+        field = (field_container.field_type, field_container.field_name)
+        data = frb[field]
+        if field in repeated:
+            # finalizing happens in place, so copy fields that are used twice
+            data = np.array(data)
+        data, data_range = _finalize_data(data, field_container.take_log, sel.rescale)
+        data, quantization = _cast_to_dtype(data, sel.dtype, data_range)
+        md = _cacheable_metadata(
+            data_range, layer_domain, field_container.take_log, quantization
+        )
+        _array_cache.cache_array(cache_key, data, md, in_memory=cache_arrays)
+        sampled.append((data, data_range, quantization))
+    return sampled
 
-        if slice.slice_width is None:
-            w = None
-        else:
-            w = ds.quan(slice.slice_width.value, slice.slice_width.unit)
 
-        if slice.slice_height is None:
-            h = None
-        else:
-            h = ds.quan(slice.slice_height.value, slice.slice_height.unit)
+class _OrthoSlice(Slice):
+    # one of the three slices of an OrthoSlices selection, normal to the axis
+    # with index normal. Sampled as a Slice, then oriented in 3D.
+    normal: int = 0
+
+
+def _get_orthoslices(sel: OrthoSlices) -> List[_OrthoSlice]:
+    # the slices normal to each domain axis of an OrthoSlices selection
+    kwargs = sel.model_dump(exclude_none=True)
+    if "slice_width" in kwargs:
+        kwargs["slice_height"] = kwargs["slice_width"]
+    return [_OrthoSlice(normal=normal, **kwargs) for normal in range(3)]
+
 
-        frb, layer_domain = _process_slice(
+def _get_slice_center(ds, slice: Slice) -> Optional[unyt_array]:
+    if slice.center is None:
+        return None
+    return ds.arr(slice.center.value, slice.center.unit)
+
+
+def _get_cell_keys(dobj) -> np.ndarray:
+    # the position and width of every cell of a data object as a structured
+    # array, which sorts and compares cell by cell
+    pos = np.column_stack([dobj["index", ax].d for ax in ("x", "y", "z", "dx")])
+    return np.ascontiguousarray(pos).view([("", pos.dtype)] * 4).ravel()
+
+
+def _read_orthoslices(ds, center: Optional[unyt_array], fields: list) -> list:
+    # returns the yt slice objects normal to each axis through center (the
+    # domain center by default). The fields are read in a single traversal of
+    # the cells intersecting any of the three planes, and split between the
+    # slices by cell position, so that the grids shared by the planes are
+    # only read once. Slices of datasets without cartesian cells (or whose
+    # cells do not match) read their own fields when accessed.
+    if center is None:
+        center = ds.domain_center
+    slcs = [ds.slice(ax, center[ax]) for ax in range(3)]
+    if len(fields) == 0:
+        return slcs
+    if ds.geometry != "cartesian" or len(getattr(ds, "_sph_ptypes", ())) > 0:
+        return slcs
+
+    union = ds.union(slcs)
+    union.get_data(fields)
+    union_keys = _get_cell_keys(union)
+    order = np.argsort(union_keys)
+    union_keys = union_keys[order]
+    for slc in slcs:
+        keys = _get_cell_keys(slc)
+        icells = np.searchsorted(union_keys, keys).clip(0, len(union_keys) - 1)
+        if len(union_keys) == 0 or not np.all(union_keys[icells] == keys):
+            continue
+        for field in union._determine_fields(fields):
+            slc.field_data[field] = union[field][order[icells]]
+    return slcs
+
+
+def _get_shared_slices(ds, sels: List[Union[Region, CoveringGrid, Slice]]) -> list:
+    # returns a yt slice object for every slice selection that shares its
+    # normal and coordinate with another slice selection, and for the slices
+    # of orthoslices (None otherwise), so that each group is read from the
+    # grids once and pixelized per selection. The fields of a group missing
+    # from the array caches are read together, the three planes of
+    # orthoslices through the same point are read in one traversal (see
+    # _read_orthoslices).
+    def _uncached_fields(isels):
+        to_read = []
+        for isel in isels:
+            for fc in sels[isel].fields:
+                field = (fc.field_type, fc.field_name)
+                key = _array_cache.get_cache_key(ds, sels[isel], fc)
+                if not _is_cached(key) and field not in to_read:
+                    to_read.append(field)
+        return to_read
+
+    groups = defaultdict(list)
+    ortho_groups = defaultdict(list)
+    for isel, sel in enumerate(sels):
+        if isinstance(sel, Slice):
+            normal_ax = ds.coordinates.axis_id[sel.normal]
+            center = _get_slice_center(ds, sel)
+            if center is None:
+                center = ds.domain_center
+            coord = float(center[normal_ax].to("code_length"))
+            groups[(normal_ax, coord)].append(isel)
+            if isinstance(sel, _OrthoSlice):
+                point = tuple(center.to("code_length").d.tolist())
+                ortho_groups[point].append(isel)
+
+    shared = [None] * len(sels)
+    plane_slices = {}
+    for point, isels in ortho_groups.items():
+        to_read = _uncached_fields(isels)
+        if len(to_read) == 0:
+            continue
+        slcs = _read_orthoslices(ds, ds.arr(point, "code_length"), to_read)
+        for normal_ax, slc in enumerate(slcs):
+            plane_slices[(normal_ax, point[normal_ax])] = slc
+        for isel in isels:
+            shared[isel] = slcs[ds.coordinates.axis_id[sels[isel].normal]]
+
+    for (normal_ax, coord), isels in groups.items():
+        slc = plane_slices.get((normal_ax, coord), None)
+        if len(isels) < 2 and slc is None:
+            continue
+        to_read = _uncached_fields(isels)
+        if len(to_read) == 0:
+            # every field is cached, no slice object is needed
+            continue
+        if slc is None:
+            slc = ds.slice(normal_ax, ds.quan(coord, "code_length"))
+        slc.get_data(to_read)
+        for isel in isels:
+            shared[isel] = slc
+    return shared
+
+
+def _load_2D_slice(
+    ds, slice: Slice, cache_arrays: Optional[bool] = True, slc=None
+) -> List[SpatialLayer]:
+    c = _get_slice_center(ds, slice)
+
+    if slice.slice_width is None:
+        w = None
+    else:
+        w = ds.quan(slice.slice_width.value, slice.slice_width.unit)
+
+    if slice.slice_height is None:
+        h = None
+    else:
+        h = ds.quan(slice.slice_height.value, slice.slice_height.unit)
+
+    # the yt slice is only built if a field is missing from the caches
+    _, _, _, layer_domain = _get_slice_domain(
+        ds, slice.normal, c, w, h, slice.resolution
+    )
+
+    def get_frb():
+        frb, _ = _process_slice(
             ds,
             slice.normal,
             center=c,
@@ -595,29 +1358,125 @@ def _load_2D_slices(
             height=h,
             resolution=slice.resolution,
             periodic=slice.periodic,
+            slc=slc,
         )
+        return frb
+
+    sampled = _sample_fields(ds, get_frb, slice, layer_domain, cache_arrays)
+    if isinstance(slice, _OrthoSlice):
+        # the 2D images are cached, the 3D views are built on every load
+        images = [data for data, _, _ in sampled]
+        layer_domain, images = _orient_slice_in_3D(
+            ds, slice.normal, c, layer_domain, images
+        )
+        sampled = [(im, dr, q) for im, (_, dr, q) in zip(images, sampled)]
+    return _build_layers(slice, layer_domain, sampled)
 
-        for field_container in slice.fields:
-            field = (field_container.field_type, field_container.field_name)
 
-            data = frb[field]  # extract the field (the slow part)
-            if field_container.take_log:
-                data = np.log10(data)
+def _load_selection(
+    ds,
+    sel: Union[Region, CoveringGrid, Slice],
+    cache_arrays: Optional[bool] = True,
+    slc=None,
+) -> List[SpatialLayer]:
+    # returns the layers of a single selection, one per field. Slices are
+    # pixelized from slc when provided.
+    if isinstance(sel, Slice):
+        return _load_2D_slice(ds, sel, cache_arrays, slc=slc)
+    return _load_3D_region(ds, sel, cache_arrays)
 
-            if slice.rescale:
-                data = _linear_rescale(data)
 
-            # create a metadata dict and set a name
-            fieldname = ":".join(field)
-            md = create_metadata_dict(data, layer_domain, field_container.take_log)
-            add_kwargs = {"name": fieldname, "metadata": md}
-            layer_type = "image"
-            new_layer = (data, add_kwargs, layer_type, layer_domain)
-            layer_list.append(new_layer)
-            if timeseries_container is not None:
-                timeseries_container.add(slice, field, new_layer)
+def _load_selection_in_worker(
+    filename: str, sel: Union[Region, CoveringGrid, Slice]
+) -> List[SpatialLayer]:
+    # process pool target: samples a selection from a dataset opened (and
+    # cached) within the worker process. New arrays are only stored in the
+    # disk cache, since the in-memory cache of a worker does not outlive it.
+    ds = dataset_cache.check_then_load(filename, cache_if_not_found=True)
+    return _load_selection(ds, sel, cache_arrays=False)
 
-    return layer_list
+
+def _is_cached(key: Optional[str]) -> bool:
+    # True if a key is in the in-memory or the disk array cache
+    return _array_cache.array_cache.exists(key) or _array_cache.disk_cache.exists(key)
+
+
+def _is_in_array_cache(ds, sel: Union[Region, CoveringGrid, Slice]) -> bool:
+    # True if every field of the selection is in the in-memory array cache
+    array_cache = _array_cache.array_cache
+    return all(
+        array_cache.exists(_array_cache.get_cache_key(ds, sel, fc)) for fc in sel.fields
+    )
+
+
+def _load_selections_in_processes(
+    ds,
+    sels: List[Union[Region, CoveringGrid, Slice]],
+    cache_arrays: Optional[bool] = True,
+) -> List[List[SpatialLayer]]:
+    # samples the selections in a process pool, with each worker re-opening
+    # the dataset from its file. Selections that are already in the in-memory
+    # array cache are pulled from it directly, the arrays returned by the
+    # workers are added to it when cache_arrays is True. "auto" resolutions
+    # are resolved here, so that the cache keys match those of the serial path.
+    filename = os.path.abspath(ds.parameter_filename)
+    sels = [
+        (
+            _resolve_resolution(ds, sel, *_get_region_edges(ds, sel))
+            if isinstance(sel, Region)
+            else sel
+        )
+        for sel in sels
+    ]
+    results = [None] * len(sels)
+    to_sample = []
+    for isel, sel in enumerate(sels):
+        if _is_in_array_cache(ds, sel):
+            results[isel] = _load_selection(ds, sel, cache_arrays)
+        else:
+            to_sample.append(isel)
+
+    sampled = _parallel.ordered_map(
+        _load_selection_in_worker,
+        [filename] * len(to_sample),
+        [sels[isel] for isel in to_sample],
+        kind="process",
+    )
+    for isel, layers in zip(to_sample, sampled):
+        results[isel] = layers
+        if not cache_arrays or getattr(sels[isel], "multiscale", False):
+            # the levels of multiscale grids are cached individually
+            continue
+        if isinstance(sels[isel], _OrthoSlice):
+            # orthoslices are cached as 2D images, before orienting in 3D
+            continue
+        sel = sels[isel]
+        for fc, (data, add_kwargs, _, layer_domain) in zip(sel.fields, layers):
+            layer_md = add_kwargs["metadata"]
+            md = _cacheable_metadata(
+                layer_md["_data_range"],
+                layer_domain,
+                fc.take_log,
+                layer_md["_quantization"],
+            )
+            key = _array_cache.get_cache_key(ds, sel, fc)
+            _array_cache.array_cache.add(key, data, md)
+    return results
+
+
+def _get_selection_list(
+    selections: SelectionObject,
+) -> List[Union[Region, CoveringGrid, Slice]]:
+    # the selections in load order: regions, covering grids, slices then
+    # orthoslices, which are expanded to their three slices
+    sels = []
+    for seltype in ("regions", "covering_grids", "slices", "orthoslices"):
+        for sel in getattr(selections, seltype) or []:
+            if isinstance(sel, OrthoSlices):
+                sels += _get_orthoslices(sel)
+            else:
+                sels.append(sel)
+    return sels
 
 
 def _load_selections_from_ds(
@@ -625,23 +1484,171 @@ def _load_selections_from_ds(
     selections: SelectionObject,
     layer_list: List[SpatialLayer],
     timeseries_container: Optional[TimeseriesContainer] = None,
+    cache_arrays: Optional[bool] = True,
+    executor: Optional[str] = None,
 ) -> List[SpatialLayer]:
-    if selections.regions is not None or selections.covering_grids is not None:
-        layer_list = _load_3D_regions(
-            ds, selections, layer_list, timeseries_container=timeseries_container
+    # samples every selection, appending the layers in a fixed order: regions,
+    # covering grids, slices then orthoslices. The executor ("serial", "thread" or
+    # "process", defaulting to the selection_executor config) sets how the
+    # selections are sampled. Datasets that are not loaded from a file are
+    # sampled in threads instead of processes.
+    sels = _get_selection_list(selections)
+    executor = _parallel.get_executor_kind(executor)
+    if len(sels) < 2:
+        executor = "serial"
+    elif executor == "process" and _array_cache._dataset_identity(ds) is None:
+        executor = "thread"
+
+    if executor == "process":
+        results = _load_selections_in_processes(ds, sels, cache_arrays)
+    else:
+        if executor == "thread" and not all(
+            _is_cached(_array_cache.get_cache_key(ds, sel, fc))
+            for sel in sels
+            for fc in sel.fields
+        ):
+            # build the index up front rather than racing to build it
+            _ = ds.index
+        # slices sharing a normal and coordinate are read once, up front
+        shared_slices = _get_shared_slices(ds, sels)
+        results = _parallel.ordered_map(
+            _load_selection,
+            [ds] * len(sels),
+            sels,
+            [cache_arrays] * len(sels),
+            shared_slices,
+            kind=executor,
         )
-    if selections.slices is not None:
-        layer_list = _load_2D_slices(
-            ds, selections, layer_list, timeseries_container=timeseries_container
+
+    for sel, layers in zip(sels, results):
+        for fc, new_layer in zip(sel.fields, layers):
+            layer_list.append(new_layer)
+            if timeseries_container is not None:
+                field = (fc.field_type, fc.field_name)
+                timeseries_container.add(sel, field, new_layer)
+    return layer_list
+
+
+def _sample_slab(
+    ds,
+    sel: Union[Region, CoveringGrid],
+    field_container,
+    left_edge: unyt_array,
+    right_edge: unyt_array,
+    dims: Tuple[int, int, int],
+) -> np.ndarray:
+    # samples and finalizes a single field over a slab of a 3D selection
+    field = (field_container.field_type, field_container.field_name)
+    if isinstance(sel, CoveringGrid):
+        frb = ds.covering_grid(
+            sel.level, left_edge, dims, num_ghost_zones=sel.num_ghost_zones
         )
+    else:
+        frb = _get_region_frb(ds, left_edge, right_edge, dims)
+    data, _ = _finalize_data(frb[field], field_container.take_log)
+    data, _ = _cast_to_dtype(data, sel.dtype)
+    return data
+
+
+def _is_lazy_compatible(sel: Union[Region, CoveringGrid, Slice]) -> bool:
+    # rescaling and quantizing need the full data range, so those selections
+    # (along with slices and multiscale grids) are always sampled eagerly
+    if isinstance(sel, Slice) or sel.rescale:
+        return False
+    if isinstance(sel, CoveringGrid) and sel.multiscale:
+        return False
+    return sel.dtype not in _quantized_dtypes
+
+
+def _load_lazy_3D_region(ds, sel: Union[Region, CoveringGrid]) -> List[SpatialLayer]:
+    # returns layers backed by dask arrays that are chunked along the first
+    # axis. Each chunk samples its own slab of the selection from ds when it
+    # is computed. The slabs of covering grids are aligned with the cells of
+    # the grid level, the slabs of regions with the output pixels.
+    try:
+        from dask import array as da, delayed
+    except ImportError:
+        msg = "Lazy loading requires dask: " 'pip install "dask[distributed, array]"'
+        raise ImportError(msg)
+
+    LE, RE = _get_region_edges(ds, sel)
+    if isinstance(sel, CoveringGrid):
+        dims = (RE - LE) / _get_level_dds(ds, sel.level)
+        res = np.array(dims, dtype="int32")  # as in ds.covering_grid
+        dx = _get_level_dds(ds, sel.level)
+    else:
+        sel = _resolve_resolution(ds, sel, LE, RE)
+        dims = sel.resolution
+        res = np.array(sel.resolution)
+        dx = (RE - LE) / res
+    layer_domain = LayerDomain(left_edge=LE, right_edge=RE, resolution=dims)
+
+    # build the index up front rather than in each chunk
+    _ = ds.index
+    chunk_size = max(ytcfg.get("yt_napari", "lazy_chunk_size"), 1)
+    dtype = np.dtype(sel.dtype)
+    sampled = []
+    for field_container in sel.fields:
+        chunks = []
+        for i0 in range(0, res[0], chunk_size):
+            i1 = min(i0 + chunk_size, res[0])
+            slab_le = LE.copy()
+            slab_re = RE.copy()
+            slab_le[0] = LE[0] + dx[0] * i0
+            slab_re[0] = LE[0] + dx[0] * i1
+            slab_dims = (i1 - i0, int(res[1]), int(res[2]))
+            slab = delayed(_sample_slab)(
+                ds, sel, field_container, slab_le, slab_re, slab_dims
+            )
+            chunks.append(da.from_delayed(slab, shape=slab_dims, dtype=dtype))
+        sampled.append((da.concatenate(chunks, axis=0), None, None))
+    return _build_layers(sel, layer_domain, sampled)
+
+
+def _load_lazy_selections(
+    ds,
+    selections: SelectionObject,
+    layer_list: List[SpatialLayer],
+    cache_arrays: Optional[bool] = True,
+) -> List[SpatialLayer]:
+    # loads regions and covering grids as lazy dask arrays, in the same order
+    # as _load_selections_from_ds. Other selections are sampled immediately.
+    for sel in _get_selection_list(selections):
+        if _is_lazy_compatible(sel):
+            layer_list += _load_lazy_3D_region(ds, sel)
+        else:
+            layer_list += _load_selection(ds, sel, cache_arrays)
     return layer_list
 
 
+def _get_cache_policy(m_data: Union[DataContainer, Timeseries]) -> str:
+    # the effective cache policy of a request: store_in_cache=False disables
+    # all in-memory caching regardless of the cache_policy value.
+    if not m_data.store_in_cache:
+        return "none"
+    return m_data.cache_policy
+
+
 def _load_dataset_selections(
     m_data: DataContainer, layer_list: List[SpatialLayer]
 ) -> List[SpatialLayer]:
-    ds = dataset_cache.check_then_load(m_data.filename)
-    return _load_selections_from_ds(ds, m_data.selections, layer_list)
+    policy = _get_cache_policy(m_data)
+    ds = dataset_cache.check_then_load(
+        m_data.filename, cache_if_not_found=policy != "none"
+    )
+    if m_data.lazy:
+        return _load_lazy_selections(
+            ds,
+            m_data.selections,
+            layer_list,
+            cache_arrays=policy == "dataset+arrays",
+        )
+    return _load_selections_from_ds(
+        ds,
+        m_data.selections,
+        layer_list,
+        cache_arrays=policy == "dataset+arrays",
+    )
 
 
 def _validate_files(files):
@@ -656,20 +1663,19 @@ def _validate_files(files):
     return valid_files
 
 
-def _generate_file_list(fpat, fdir=None):
-    import glob
-
-    # try with
+def _generate_file_list(fpat, fdir=None, frange=None):
+    # the naturally sorted files matching a pattern, limited by frange. Falls
+    # back to the yt test_data_dir when nothing matches.
     match_this = fpat
     if fdir is not None:
         match_this = os.path.join(fdir, match_this)
 
-    files = glob.glob(match_this)
-    if len(files) == 0:
+    files = _file_discovery.find_files(match_this, file_range=frange)
+    if len(files) == 0 and not os.path.isabs(match_this):
         yt_data_dir = yt.config.ytcfg.get("yt", "test_data_dir")
-        files = glob.glob(os.path.join(yt_data_dir, match_this))
-
-    files.sort()
+        files = _file_discovery.find_files(
+            match_this, directory=yt_data_dir, file_range=frange
+        )
     return files
 
 
@@ -688,36 +1694,246 @@ def _find_timeseries_files(file_selection: TimeSeriesFileSelection):
     if fpat is None:
         fpat = "*"
 
-    files = _generate_file_list(fpat, fdir)
-    if frange is not None:
-        # limit the selected files
-        f1, f2, f3 = frange
-        if f2 > len(files):
-            f2 = len(files)
-        picked_files = [files[fileid] for fileid in range(f1, f2, f3)]
-        return picked_files
+    return _generate_file_list(fpat, fdir, frange)
 
-    return files
+
+def _load_timeseries_ds(file: str, policy: str):
+    # load a single timestep, going through the dataset cache unless the
+    # cache policy is "none"
+    if policy == "none":
+        return _load_with_timeseries_specials_check(file)
+    return dataset_cache.check_then_load(
+        file,
+        cache_if_not_found=True,
+        loader=_load_with_timeseries_specials_check,
+    )
+
+
+_end_of_files = object()
+
+
+def _iter_timeseries_datasets(files: List[str], policy: str, prefetch_depth: int):
+    # yields (file, ds) in order. When prefetch_depth > 0, a background thread
+    # opens up to prefetch_depth upcoming datasets and builds their indices
+    # while the caller samples the current one. The bounded queue limits the
+    # datasets held in memory to prefetch_depth + 2.
+    if prefetch_depth <= 0:
+        for file in files:
+            yield file, _load_timeseries_ds(file, policy)
+        return
+
+    ds_queue = queue.Queue(maxsize=prefetch_depth)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # block until there is room in the queue, or the consumer has stopped
+        while not stop.is_set():
+            try:
+                ds_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _prefetch():
+        for file in files:
+            try:
+                ds = _load_timeseries_ds(file, policy)
+                _ = ds.index
+                item = (file, ds, None)
+            except Exception as err:
+                item = (file, None, err)
+            if not _put(item) or item[2] is not None:
+                return
+        _put(_end_of_files)
+
+    prefetcher = threading.Thread(target=_prefetch, daemon=True)
+    prefetcher.start()
+    try:
+        while True:
+            item = ds_queue.get()
+            if item is _end_of_files:
+                break
+            file, ds, err = item
+            if err is not None:
+                raise err
+            yield file, ds
+    finally:
+        stop.set()
+        prefetcher.join()
+
+
+def _share_array(data: np.ndarray) -> Tuple[str, tuple, str]:
+    # copies an array into a new shared memory block, returning the name,
+    # shape and dtype needed to attach to it. The block is released by
+    # _attach_shared_array in the receiving process.
+    data = np.asarray(data)
+    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    shared = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+    shared[...] = data
+    del shared
+    shm.close()
+    # the receiving process frees the block, so this one must not track it
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm.name, data.shape, data.dtype.str
+
+
+def _load_timestep_in_worker(
+    file: str, selections: SelectionObject
+) -> List[SpatialLayer]:
+    # process pool target: samples the selections of a single timestep,
+    # returning the layers with their images replaced by a list of shared
+    # memory references (see _share_array), one per level of multiscale
+    # images, so that the images are not pickled
+    ds = _load_with_timeseries_specials_check(file)
+    layers = _load_selections_from_ds(
+        ds, selections, [], cache_arrays=False, executor="serial"
+    )
+    shared = []
+    try:
+        for im, im_kwargs, layer_type, layer_domain in layers:
+            levels = im if im_kwargs.get("multiscale", False) else [im]
+            blocks = []
+            shared.append((blocks, im_kwargs, layer_type, layer_domain))
+            for level in levels:
+                blocks.append(_share_array(level))
+    except BaseException:
+        _release_shared_layers(shared)
+        raise
+    return shared
+
+
+def _attach_shared_array(
+    shared: Tuple[str, tuple, str], consume: Callable[[np.ndarray], None]
+):
+    # hands an array in shared memory to consume, then frees the block
+    name, shape, dtype = shared
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        consume(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _release_shared_layers(layers: list, attached: Optional[set] = None):
+    # frees the shared memory blocks of the layers from _load_timestep_in_worker
+    # that have not been attached (see _attach_shared_array), by name
+    for layer in layers:
+        for shared in layer[0]:
+            if attached is not None and shared[0] in attached:
+                continue
+            try:
+                _attach_shared_array(shared, lambda im: None)
+            except FileNotFoundError:
+                pass
+
+
+def _load_timesteps_in_processes(
+    files: List[str],
+    selections: SelectionObject,
+    tc: TimeseriesContainer,
+    num_workers: Optional[int] = 0,
+):
+    # samples each timestep in a process pool with num_workers processes
+    # (defaulting to the max_workers config value when < 1), adding the
+    # layers to tc in timestep order as they arrive. Stacked images are copied
+    # from shared memory straight into their stack, others (including every
+    # level of multiscale images, which are never stacked) are copied out.
+    max_workers = num_workers if num_workers > 0 else _parallel.get_max_workers()
+    sels = _get_selection_list(selections)
+    sel_fields = [
+        (sel, (fc.field_type, fc.field_name)) for sel in sels for fc in sel.fields
+    ]
+
+    attached = set()
+    with _parallel.get_executor("process", max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_load_timestep_in_worker, file, selections)
+            for file in files
+        ]
+        try:
+            for future in futures:
+                for (sel, field), layer in zip(sel_fields, future.result()):
+                    blocks, im_kwargs, layer_type, layer_domain = layer
+
+                    def _add(im):
+                        tc.add(sel, field, (im, im_kwargs, layer_type, layer_domain))
+
+                    levels = []
+                    for shared in blocks:
+                        attached.add(shared[0])
+                        if tc.n_steps is None:
+                            _attach_shared_array(
+                                shared, lambda im: levels.append(np.array(im))
+                            )
+                        else:
+                            _attach_shared_array(shared, _add)
+                    if tc.n_steps is None:
+                        multiscale = im_kwargs.get("multiscale", False)
+                        _add(levels if multiscale else levels[0])
+        finally:
+            # after an error, wait for the timesteps that are still running
+            # and free every block that was not attached, since the workers no
+            # longer track them
+            for future in futures:
+                if future.cancel():
+                    continue
+                try:
+                    layers = future.result()
+                except Exception:
+                    continue
+                _release_shared_layers(layers, attached)
+
+
+def _resolve_timeseries_selections(ds, selections: SelectionObject) -> SelectionObject:
+    # replaces "auto" region resolutions with those chosen for ds, so that
+    # every timestep of a stack is sampled at the same resolution even as the
+    # refinement changes over time
+    regions = selections.regions or []
+    if not any(isinstance(reg.resolution, str) for reg in regions):
+        return selections
+    regions = [
+        _resolve_resolution(ds, reg, *_get_region_edges(ds, reg)) for reg in regions
+    ]
+    return selections.model_copy(update={"regions": regions})
 
 
 def _load_timeseries(m_data: Timeseries, layer_list: list) -> list:
     files = _find_timeseries_files(m_data.file_selection)
-
-    # process_in_parallel = False  # future model attribute
-
-    tc = TimeseriesContainer()
-    temp_list = []
-    for file in files:
-        # note: managing the files independently makes parallel approaches
-        # without MPI feasible. in some limited testing, this actually
-        # was thread safe with logging disabled, so it is possible to
-        # build dask arrays pretty easily for single regions and single
-        # fields.
-        ds = _load_with_timeseries_specials_check(file)
-        sels = m_data.selections
-        temp_list = _load_selections_from_ds(
-            ds, sels, temp_list, timeseries_container=tc
-        )
+    policy = _get_cache_policy(m_data)
+    if m_data.load_as_stack and any(
+        cg.multiscale for cg in m_data.selections.covering_grids or []
+    ):
+        raise ValueError("multiscale covering grids cannot be loaded as a stack.")
+
+    # preallocate the stacks when stacking more than one timestep
+    n_steps = None
+    if m_data.load_as_stack and len(files) > 1:
+        n_steps = len(files)
+    tc = TimeseriesContainer(n_steps=n_steps)
+    selections = m_data.selections
+    if m_data.process_in_parallel and len(files) > 1:
+        if n_steps is not None:
+            # stacked "auto" resolutions are chosen from the first timestep
+            ds = _load_timeseries_ds(files[0], policy)
+            selections = _resolve_timeseries_selections(ds, selections)
+        _load_timesteps_in_processes(files, selections, tc, m_data.num_workers)
+    else:
+        timesteps = _iter_timeseries_datasets(files, policy, m_data.prefetch_depth)
+        for istep, (_, ds) in enumerate(timesteps):
+            if istep == 0 and n_steps is not None:
+                # stacked "auto" resolutions are chosen from the first timestep
+                selections = _resolve_timeseries_selections(ds, selections)
+            # the layers are held by tc, so that stacked images can be released
+            # once copied into their stack
+            _load_selections_from_ds(
+                ds,
+                selections,
+                [],
+                timeseries_container=tc,
+                cache_arrays=policy == "dataset+arrays",
+            )
 
     if m_data.load_as_stack is False:
         new_layers = tc.layer_list
@@ -729,42 +1945,66 @@ def _load_timeseries(m_data: Timeseries, layer_list: list) -> list:
     return layer_list
 
 
-def _process_validated_model(
-    model: InputModel,
-) -> Tuple[List[SpatialLayer], List[Layer]]:
-    # return a list of layer tuples with domain information
+def _load_model_entry(m_data: Union[DataContainer, Timeseries]) -> list:
+    # returns the layers of a single dataset or timeseries entry of a model
+    if isinstance(m_data, Timeseries):
+        return _load_timeseries(m_data, [])
+    return _load_dataset_selections(m_data, [])
 
-    if model.datasets is None:
-        model.datasets = []
 
-    if model.timeseries is None:
-        model.timeseries = []
-
-    layer_list = []
-    # our model is already validated, so we can assume the field exist with
+def _process_validated_models(
+    models: List[InputModel], executor: Optional[str] = None
+) -> Tuple[List[SpatialLayer], List[Layer]]:
+    # return the layer tuples with domain information and the timeseries
+    # layers across models. The dataset and timeseries entries are independent,
+    # so they are loaded with the executor ("serial", "thread" or "process",
+    # defaulting to the ingestion_executor config). Layers are always returned
+    # in the order of the entries.
+    datasets = []
+    timeseries = []
+    for model in models:
+        if model.datasets is None:
+            model.datasets = []
+        if model.timeseries is None:
+            model.timeseries = []
+        datasets += model.datasets
+        timeseries += model.timeseries
+
+    entries = datasets + timeseries
+    executor = _parallel.get_executor_kind(executor, setting="ingestion_executor")
+    if len(entries) < 2:
+        executor = "serial"
+
+    # our models are already validated, so we can assume the field exist with
     # their correct types. This is all the yt-specific code required to load a
     # dataset and return a plain numpy array
-    for m_data in model.datasets:
-        layer_list = _load_dataset_selections(m_data, layer_list)
+    results = _parallel.ordered_map(_load_model_entry, entries, kind=executor)
+
+    layer_list = []
+    for layers in results[: len(datasets)]:
+        layer_list += layers
 
     timeseries_layers = []
-    for m_data in model.timeseries:
-        timeseries_layers = _load_timeseries(m_data, timeseries_layers)
+    for layers in results[len(datasets) :]:  # noqa: E203
+        timeseries_layers += layers
 
     return layer_list, timeseries_layers
 
 
+def _process_validated_model(
+    model: InputModel,
+) -> Tuple[List[SpatialLayer], List[Layer]]:
+    # return a list of layer tuples with domain information
+    return _process_validated_models([model])
+
+
 def load_from_json_strs(json_strs: List[str]) -> List[Layer]:
-    layer_lists = []  # we will concatenate layers across json paths
-    timeseries_layers = []  # timeseries layers handled separately
-    for json_str in json_strs:
-        # InputModel is a pydantic class, the following will validate the json
-        model = InputModel.model_validate_json(json_str)
-        # now that we have a validated model, we can use the model attributes
-        # to execute the code that will return our array for the image
-        layer_lists_j, timeseries_layers_j = _process_validated_model(model)
-        timeseries_layers += timeseries_layers_j
-        layer_lists += layer_lists_j
+    # InputModel is a pydantic class, the following will validate the json
+    models = [InputModel.model_validate_json(json_str) for json_str in json_strs]
+    # now that we have validated models, we can use the model attributes
+    # to execute the code that will return our array for the image. The
+    # entries of all the models are loaded together.
+    layer_lists, timeseries_layers = _process_validated_models(models)
 
     # now we need to align all our layers!
     # choose a reference layer -- using the first in the list at present, could
@@ -0,0 +1,178 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, List, Optional
+
+from yt_napari.config import ytcfg
+
+_executor_kinds = ("serial", "thread", "process")
+
+
+def get_executor_kind(
+    kind: Optional[str] = None, setting: Optional[str] = "selection_executor"
+) -> str:
+    # the executor kind to use, defaulting to the value of a config setting
+    if kind is None:
+        kind = ytcfg.get("yt_napari", setting)
+    if kind not in _executor_kinds:
+        raise ValueError(f"executor must be one of {_executor_kinds}, found {kind}")
+    return kind
+
+
+def get_max_workers() -> Optional[int]:
+    # the max_workers config value, with values < 1 deferring to the
+    # concurrent.futures default (based on the number of cpus)
+    max_workers = ytcfg.get("yt_napari", "max_workers")
+    if max_workers < 1:
+        return None
+    return max_workers
+
+
+def _get_config_settings() -> dict:
+    # the current values of the yt_napari config section
+    return ytcfg.get("yt_napari").as_dict()
+
+
+def _apply_config_settings(settings: dict):
+    # process pool initializer: spawned workers re-read the config file, so
+    # the values set at runtime in the parent are applied again
+    for setting, value in settings.items():
+        ytcfg.set("yt_napari", setting, value)
+
+
+def get_executor(kind: str, max_workers: Optional[int] = None) -> Executor:
+    """
+    return a new thread or process pool executor. Worker processes are
+    spawned rather than forked, since forking a process with running threads
+    (e.g., napari's) can deadlock the children on locks held at fork time.
+    The yt_napari config values of the calling process are applied in each
+    worker process when it starts.
+
+    Parameters
+    ----------
+    kind : str
+        "thread" or "process"
+    max_workers : int
+        the number of workers. Defaults to the max_workers config value.
+
+    Returns
+    -------
+    Executor
+    """
+    if max_workers is None:
+        max_workers = get_max_workers()
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    elif kind == "process":
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_apply_config_settings,
+            initargs=(_get_config_settings(),),
+        )
+    raise ValueError(f"no executor for {kind}, must be one of ('thread', 'process')")
+
+
+# a process pool shared across calls to ordered_map, along with its max_workers
+# and the config values applied in its workers
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers: Optional[int] = None
+_process_pool_settings: Optional[dict] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    return the process pool shared across loads, creating it on first use.
+    Spawning workers (and importing yt in them) is slow and each worker keeps
+    the datasets it opens in its own dataset cache, so reusing the workers
+    avoids paying the start up and dataset loading costs on every load. The
+    pool is re-created when max_workers or any yt_napari config value changes.
+
+    Parameters
+    ----------
+    max_workers : int
+        the number of workers. Defaults to the max_workers config value.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+    """
+    global _process_pool, _process_pool_workers, _process_pool_settings
+    if max_workers is None:
+        max_workers = get_max_workers()
+    settings = _get_config_settings()
+    with _process_pool_lock:
+        if _process_pool is not None and (
+            _process_pool_workers != max_workers or _process_pool_settings != settings
+        ):
+            _process_pool.shutdown()
+            _process_pool = None
+        if _process_pool is None:
+            _process_pool = get_executor("process", max_workers=max_workers)
+            _process_pool_workers = max_workers
+            _process_pool_settings = settings
+        return _process_pool
+
+
+def shutdown_process_pool():
+    """
+    shut down the shared process pool, if running, freeing the datasets and
+    arrays cached in its workers. Called by the "Clear cache" button of the
+    reader widget and at interpreter exit.
+    """
+    global _process_pool, _process_pool_workers, _process_pool_settings
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown()
+        _process_pool = None
+        _process_pool_workers = None
+        _process_pool_settings = None
+
+
+atexit.register(shutdown_process_pool)
+
+
+def ordered_map(
+    func: Callable,
+    *iterables: Iterable,
+    kind: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List:
+    """
+    apply func to the items of the iterables with the given executor kind,
+    returning the results in input order. Exceptions raised by func are
+    re-raised in the calling thread. Thread pools are created per call, the
+    process pool is shared across calls (see get_process_pool).
+
+    Parameters
+    ----------
+    func : Callable
+        the function to apply. Must be picklable for the process executor.
+    iterables :
+        the arguments, as for the builtin map
+    kind : str
+        "serial", "thread" or "process". Defaults to the selection_executor
+        config value.
+    max_workers : int
+        the number of workers. Defaults to the max_workers config value.
+
+    Returns
+    -------
+    list
+        the results of each call, in order
+    """
+    kind = get_executor_kind(kind)
+    if kind == "serial":
+        return list(map(func, *iterables))
+    if kind == "process":
+        try:
+            return list(get_process_pool(max_workers).map(func, *iterables))
+        except BrokenProcessPool:
+            # a worker died, start over with a new pool on the next call
+            shutdown_process_pool()
+            raise
+    with get_executor(kind, max_workers=max_workers) as executor:
+        return list(executor.map(func, *iterables))
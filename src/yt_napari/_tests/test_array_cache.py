@@ -0,0 +1,193 @@
+import logging
+
+import numpy as np
+import pytest
+from yt import testing as yt_testing
+
+from yt_napari import _data_model as _dm, _model_ingestor as _mi
+from yt_napari._array_cache import (
+    ArrayCache,
+    array_cache,
+    disk_cache,
+    get_cache_key,
+)
+from yt_napari._ds_cache import dataset_cache
+from yt_napari._schema_version import schema_name
+from yt_napari.config import ytcfg
+
+
+def _region(resolution=(10, 10, 10)):
+    return _dm.Region(
+        fields=[{"field_type": "gas", "field_name": "density"}],
+        resolution=resolution,
+    )
+
+
+def test_cache_key(yt_ugrid_ds_fn):
+    ds = dataset_cache.check_then_load(yt_ugrid_ds_fn)
+    reg = _region()
+    fld = reg.fields[0]
+
+    key = get_cache_key(ds, reg, fld)
+    assert key is not None
+    assert key == get_cache_key(ds, _region(), fld)
+    assert key != get_cache_key(ds, _region(resolution=(10, 10, 12)), fld)
+
+    fld_nolog = _dm.ytField(field_type="gas", field_name="density", take_log=False)
+    assert key != get_cache_key(ds, reg, fld_nolog)
+
+    # in-memory datasets have no file to key on
+    ds_mem = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    assert get_cache_key(ds_mem, reg, fld) is None
+
+
+def test_array_cache_eviction(caplog):
+    max_memory = ytcfg.get("yt_napari", "max_array_cache_memory")
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    cache = ArrayCache()
+    arr = np.zeros((10, 10))
+    ytcfg.set("yt_napari", "max_array_cache_memory", int(arr.nbytes * 1.5))
+
+    # disabled by default
+    ytcfg.set("yt_napari", "in_memory_array_cache", False)
+    cache.add("a", arr, {})
+    assert cache.exists("a") is False
+    ytcfg.set("yt_napari", "in_memory_array_cache", True)
+
+    cache.add("a", arr, {})
+    cache.add("b", arr.copy(), {})
+    assert cache.exists("a") is False
+    assert cache.get("b") is not None
+    assert "evicted array a" in caplog.text
+
+    cache.add(None, arr, {})
+    assert len(cache.available) == 1
+
+    ytcfg.set("yt_napari", "max_array_cache_memory", max_memory)
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+
+
+def test_ingestor_uses_array_cache(yt_ugrid_ds_fn, caplog):
+    # silence yt info messages from sampling the saved dataset
+    caplog.set_level(logging.WARNING, logger="yt")
+    array_cache.rm_all()
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    ytcfg.set("yt_napari", "in_memory_array_cache", True)
+    jdict = {
+        "$schema": schema_name,
+        "datasets": [
+            {
+                "filename": yt_ugrid_ds_fn,
+                "selections": {"regions": [_region().model_dump(exclude_none=True)]},
+                "cache_policy": "dataset+arrays",
+            }
+        ],
+    }
+
+    model = _dm.InputModel.model_validate(jdict)
+    layers, _ = _mi._process_validated_model(model)
+    assert len(array_cache.available) == 1
+
+    model = _dm.InputModel.model_validate(jdict)
+    layers_2, _ = _mi._process_validated_model(model)
+    assert layers_2[0][0] is layers[0][0]
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+
+
+def test_disk_cache(tmp_path, caplog):
+    max_size = ytcfg.get("yt_napari", "max_disk_cache_size")
+    assert disk_cache.directory is None
+    disk_cache.add("a", np.ones((4, 4)), {})
+    assert disk_cache.exists("a") is False
+
+    ytcfg.set("yt_napari", "disk_cache_dir", str(tmp_path / "cache"))
+    arr = np.arange(16.0).reshape((4, 4))
+    disk_cache.add("a", arr, {"_data_range": [0.0, 15.0]})
+    data, md = disk_cache.get("a")
+    assert isinstance(data, np.memmap)
+    assert np.all(data == arr)
+    assert md["_data_range"] == [0.0, 15.0]
+
+    # a single entry fits, adding another exceeds the budget
+    nbytes = sum(f.stat().st_size for f in (tmp_path / "cache").iterdir())
+    ytcfg.set("yt_napari", "max_disk_cache_size", int(nbytes * 1.5))
+    disk_cache.add("b", arr, {})
+    assert disk_cache.exists("a") is False
+    assert disk_cache.exists("b")
+    assert "evicted array a from the disk cache" in caplog.text
+
+    disk_cache.rm_all()
+    assert disk_cache.exists("b") is False
+    ytcfg.set("yt_napari", "max_disk_cache_size", max_size)
+    ytcfg.set("yt_napari", "disk_cache_dir", "")
+
+
+def test_ingestor_uses_disk_cache(yt_ugrid_ds_fn, tmp_path, caplog):
+    caplog.set_level(logging.WARNING, logger="yt")
+    array_cache.rm_all()
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    ytcfg.set("yt_napari", "disk_cache_dir", str(tmp_path))
+    ytcfg.set("yt_napari", "in_memory_array_cache", False)
+
+    jdict = {
+        "$schema": schema_name,
+        "datasets": [
+            {
+                "filename": yt_ugrid_ds_fn,
+                "selections": {"regions": [_region().model_dump(exclude_none=True)]},
+            }
+        ],
+    }
+    model = _dm.InputModel.model_validate(jdict)
+    layers, _ = _mi._process_validated_model(model)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    model = _dm.InputModel.model_validate(jdict)
+    layers_2, _ = _mi._process_validated_model(model)
+    assert isinstance(layers_2[0][0], np.memmap)
+    assert np.all(layers_2[0][0] == layers[0][0])
+    assert layers_2[0][1]["metadata"]["_data_range"] == pytest.approx(
+        layers[0][1]["metadata"]["_data_range"]
+    )
+
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+    ytcfg.set("yt_napari", "disk_cache_dir", "")
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_cache_hit_skips_index(tmp_path, monkeypatch, executor):
+    from yt_napari import _array_cache
+
+    # in-memory datasets standing in for the same file loaded in new sessions
+    monkeypatch.setattr(
+        _array_cache, "_dataset_identity", lambda ds: ("fake_amr", "", 0.0, 0)
+    )
+
+    def _get_ds():
+        return yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[{"fields": fields, "resolution": (4, 4, 4)}],
+        covering_grids=[{"fields": fields, "level": 0}],
+        slices=[
+            {"fields": fields, "normal": "x", "resolution": (8, 8)},
+            {"fields": fields, "normal": "x", "resolution": (4, 4)},
+        ],
+        orthoslices=[{"fields": fields, "resolution": (6, 6)}],
+    )
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "disk_cache_dir", str(tmp_path / "cache"))
+    layers = _mi._load_selections_from_ds(_get_ds(), selections, [])
+
+    # hits from the disk cache never build the index of the new dataset
+    array_cache.rm_all()
+    ds = _get_ds()
+    layers_2 = _mi._load_selections_from_ds(ds, selections, [], executor=executor)
+    assert ds._instantiated_index is None
+    for layer, layer_2 in zip(layers, layers_2):
+        assert np.allclose(layer[0], layer_2[0])
+
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "disk_cache_dir", "")
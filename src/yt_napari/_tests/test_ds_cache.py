@@ -1,3 +1,4 @@
+import pytest
 from yt import testing as yt_testing
 
 from yt_napari._ds_cache import dataset_cache
@@ -50,3 +51,171 @@ def test_config_option(yt_ugrid_ds_fn):
     _ = dataset_cache.check_then_load(yt_ugrid_ds_fn)
     assert yt_ugrid_ds_fn not in dataset_cache.available
     ytcfg.set("yt_napari", "in_memory_cache", True)
+
+
+def test_ds_cache_lru_eviction(caplog):
+    dataset_cache.rm_all()
+    max_entries = ytcfg.get("yt_napari", "max_cached_datasets")
+    ytcfg.set("yt_napari", "max_cached_datasets", 2)
+
+    for name in ("ds_a", "ds_b"):
+        dataset_cache.add_ds(get_new_ds(), name)
+
+    # touching ds_a makes ds_b the least recently used
+    _ = dataset_cache.get_ds("ds_a")
+    dataset_cache.add_ds(get_new_ds(), "ds_c")
+    assert dataset_cache.exists("ds_b") is False
+    assert dataset_cache.exists("ds_a")
+    assert dataset_cache.exists("ds_c")
+    assert "evicted ds_b" in caplog.text
+
+    ytcfg.set("yt_napari", "max_cached_datasets", max_entries)
+    dataset_cache.rm_all()
+
+
+def test_ds_cache_memory_budget():
+    dataset_cache.rm_all()
+    max_memory = ytcfg.get("yt_napari", "max_cache_memory")
+
+    ds = get_new_ds()
+    _ = ds.r[:, :, :]["gas", "density"]  # builds the index
+    dataset_cache.add_ds(ds, "ds_a")
+    assert dataset_cache.nbytes > 0
+
+    ytcfg.set("yt_napari", "max_cache_memory", 1)
+    ds_b = get_new_ds()
+    _ = ds_b.r[:, :, :]["gas", "density"]
+    dataset_cache.add_ds(ds_b, "ds_b")
+    # the newest entry is always kept
+    assert dataset_cache.exists("ds_a") is False
+    assert dataset_cache.exists("ds_b")
+
+    ytcfg.set("yt_napari", "max_cache_memory", max_memory)
+    dataset_cache.rm_all()
+
+
+def test_ds_cache_estimates_per_entry(monkeypatch):
+    from yt_napari import _ds_cache
+
+    dataset_cache.rm_all()
+    max_memory = ytcfg.get("yt_napari", "max_cache_memory")
+    ytcfg.set("yt_napari", "max_cache_memory", 2**40)
+
+    estimated = []
+    estimate = _ds_cache._estimate_ds_nbytes
+
+    def _counting_estimate(ds):
+        estimated.append(ds)
+        return estimate(ds)
+
+    monkeypatch.setattr(_ds_cache, "_estimate_ds_nbytes", _counting_estimate)
+    n_ds = 5
+    for ids in range(n_ds):
+        dataset_cache.add_ds(get_new_ds(), f"ds_{ids}")
+    # each entry is estimated when added and once more when the next is added,
+    # rather than every entry on every insertion
+    assert len(estimated) == 2 * n_ds - 1
+
+    ytcfg.set("yt_napari", "max_cache_memory", max_memory)
+    dataset_cache.rm_all()
+
+
+def test_stale_dataset_reload(yt_ugrid_ds_fn, caplog):
+    dataset_cache.rm_all()
+    ds = dataset_cache.check_then_load(yt_ugrid_ds_fn)
+    assert dataset_cache.is_stale(yt_ugrid_ds_fn) is False
+    assert dataset_cache.check_then_load(yt_ugrid_ds_fn) is ds
+
+    # fake an in-place overwrite of the output
+    path, (mtime, size, ino) = dataset_cache._signatures[yt_ugrid_ds_fn]
+    dataset_cache._signatures[yt_ugrid_ds_fn] = (path, (mtime - 10, size, ino))
+
+    ytcfg.set("yt_napari", "cache_validation", "trust")
+    assert dataset_cache.is_stale(yt_ugrid_ds_fn) is False
+
+    ytcfg.set("yt_napari", "cache_validation", "interval")
+    assert dataset_cache.is_stale(yt_ugrid_ds_fn) is False  # checked recently
+    ytcfg.set("yt_napari", "cache_validation_interval", 0.0)
+    assert dataset_cache.is_stale(yt_ugrid_ds_fn)
+
+    ytcfg.set("yt_napari", "cache_validation", "stat")
+    ds_new = dataset_cache.check_then_load(yt_ugrid_ds_fn)
+    assert "changed on disk, reloading" in caplog.text
+    assert ds_new is not ds
+    assert dataset_cache.get_ds(yt_ugrid_ds_fn) is ds_new
+
+    ytcfg.set("yt_napari", "cache_validation", "not_a_policy")
+    with pytest.raises(ValueError, match="cache_validation must be one of"):
+        dataset_cache.is_stale(yt_ugrid_ds_fn)
+
+    ytcfg.set("yt_napari", "cache_validation", "stat")
+    ytcfg.set("yt_napari", "cache_validation_interval", 10.0)
+    dataset_cache.rm_all()
+
+
+def test_single_flight_loading():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    dataset_cache.rm_all()
+    n_loads = []
+    started = threading.Event()
+
+    def slow_loader(filename):
+        n_loads.append(filename)
+        started.set()
+        time.sleep(0.2)
+        return get_new_ds()
+
+    def load(_):
+        return dataset_cache.check_then_load("slow_ds", loader=slow_loader)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(load, range(4)))
+
+    assert len(n_loads) == 1
+    assert all(ds is results[0] for ds in results)
+    assert dataset_cache.exists("slow_ds")
+
+    # errors in the loading thread propagate to every waiting caller
+    def bad_loader(filename):
+        started.wait()
+        time.sleep(0.1)
+        raise OSError("could not load")
+
+    dataset_cache.rm_all()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(dataset_cache.check_then_load, "bad_ds", None, bad_loader)
+            for _ in range(2)
+        ]
+        for future in futures:
+            with pytest.raises(OSError, match="could not load"):
+                future.result()
+    assert dataset_cache._loading == {}
+    dataset_cache.rm_all()
+
+
+def test_cache_stats(caplog):
+    import yt_napari
+
+    dataset_cache.rm_all()
+    _ = yt_napari.cache_stats(reset=True)
+
+    _ = dataset_cache.check_then_load("_ytnapari_load_grid")
+    _ = dataset_cache.check_then_load("_ytnapari_load_grid")
+    stats = yt_napari.cache_stats()
+    assert stats["misses"] == 1
+    assert stats["loads"] == 1
+    assert stats["hits"] == 1
+    assert stats["load_time"] > 0
+    assert stats["n_entries"] == 1
+    assert "_ytnapari_load_grid" in stats["entry_nbytes"]
+
+    stats = yt_napari.cache_stats(reset=True)
+    assert stats["hits"] == 1
+    assert yt_napari.cache_stats()["hits"] == 0
+
+    dataset_cache.rm_all()
+    assert "clearing the dataset cache: 1 datasets" in caplog.text
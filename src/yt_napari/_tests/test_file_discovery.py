@@ -0,0 +1,98 @@
+import os
+
+from yt_napari import _file_discovery as _fd
+
+
+def _touch_outputs(fdir, nums):
+    # enzo-style outputs, DD0001/DD0001
+    for num in nums:
+        name = f"DD{num}"
+        os.makedirs(fdir / name, exist_ok=True)
+        (fdir / name / name).touch()
+
+
+def test_natural_sort_key():
+    names = ["out_10", "out_9", "out_100", "out_1"]
+    assert sorted(names, key=_fd.natural_sort_key) == [
+        "out_1",
+        "out_9",
+        "out_10",
+        "out_100",
+    ]
+
+
+def test_find_files(tmp_path):
+    _touch_outputs(tmp_path, [1, 2, 10, 20, 100])
+    (tmp_path / ".hidden").touch()
+    (tmp_path / "notes.txt").touch()
+
+    files = _fd.find_files("DD*/DD*", directory=str(tmp_path))
+    expected = [str(tmp_path / f"DD{i}" / f"DD{i}") for i in (1, 2, 10, 20, 100)]
+    assert files == expected
+
+    # directories are matched by the last component
+    assert _fd.find_files("DD?", directory=str(tmp_path)) == [
+        str(tmp_path / "DD1"),
+        str(tmp_path / "DD2"),
+    ]
+    assert _fd.find_files("*", directory=str(tmp_path))[-1] == str(
+        tmp_path / "notes.txt"
+    )
+    assert str(tmp_path / ".hidden") in _fd.find_files(".*", directory=str(tmp_path))
+
+    ranged = _fd.find_files("DD*/DD*", directory=str(tmp_path), file_range=(1, 100, 2))
+    assert ranged == expected[1::2]
+    assert _fd.find_files("nothing_*", directory=str(tmp_path)) == []
+    assert _fd.find_files("DD1/DD1", directory=str(tmp_path)) == expected[:1]
+
+
+def test_find_files_absolute(tmp_path, monkeypatch):
+    _touch_outputs(tmp_path, [1, 2])
+    expected = [str(tmp_path / f"DD{i}" / f"DD{i}") for i in (1, 2)]
+
+    # absolute patterns, with either separator
+    assert _fd.find_files(os.path.join(str(tmp_path), "DD?", "DD?")) == expected
+    assert _fd.find_files(str(tmp_path) + "/DD?/DD?") == expected
+
+    # relative patterns without a directory are relative to the working dir
+    monkeypatch.chdir(tmp_path)
+    assert _fd.find_files("DD?/DD?") == [
+        os.path.join(f"DD{i}", f"DD{i}") for i in (1, 2)
+    ]
+
+
+def test_split_pattern():
+    import ntpath
+    import posixpath
+
+    assert _fd._split_pattern("/data/DD????/DD????", posixpath) == (
+        "/",
+        ["data", "DD????", "DD????"],
+    )
+    assert _fd._split_pattern("DD????/DD????", posixpath) == ("", ["DD????", "DD????"])
+
+    # Windows drives and roots, with either separator
+    assert _fd._split_pattern("C:\\Users\\DD????/DD????", ntpath) == (
+        "C:\\",
+        ["Users", "DD????", "DD????"],
+    )
+    assert _fd._split_pattern("DD????/DD????", ntpath) == ("", ["DD????", "DD????"])
+    assert _fd._split_pattern("C:DD????", ntpath) == ("C:", ["DD????"])
+
+
+def test_directory_listing_cache(tmp_path):
+    cache = _fd.DirectoryListingCache()
+    (tmp_path / "a_1").touch()
+    listing = cache.get(str(tmp_path))
+    assert listing == [("a_1", False)]
+    assert cache.get(str(tmp_path)) is listing
+
+    # a new entry changes the directory mtime
+    mtime = os.stat(tmp_path).st_mtime_ns
+    (tmp_path / "a_2").mkdir()
+    os.utime(tmp_path, ns=(mtime + 1000, mtime + 1000))
+    assert cache.get(str(tmp_path)) == [("a_1", False), ("a_2", True)]
+
+    cache.rm_all()
+    assert len(cache.listings) == 0
+    assert cache.get(str(tmp_path / "missing")) == []
@@ -495,26 +495,787 @@ def test_yt_data_dir_check(tmp_path):
     ytcfg.set("yt", "test_data_dir", init_dir)
 
 
-def test_linear_rescale():
-    rng = np.random.default_rng()
-    data = 10 * rng.random((5, 5))
-    rsc = _mi._linear_rescale(data)
-    assert rsc.min() == 0.0
-    assert rsc.max() == 1.0
+@pytest.mark.parametrize(
+    "store_in_cache,cache_policy,ds_cached,array_cached",
+    [
+        (False, "dataset+arrays", False, False),
+        (True, "none", False, False),
+        (True, "dataset", True, False),
+        (True, "dataset+arrays", True, True),
+    ],
+)
+def test_cache_policy(
+    yt_ugrid_ds_fn, caplog, store_in_cache, cache_policy, ds_cached, array_cached
+):
+    import logging
+
+    from yt_napari._array_cache import array_cache
+    from yt_napari._ds_cache import dataset_cache
+
+    caplog.set_level(logging.WARNING, logger="yt")
+    dataset_cache.rm_all()
+    array_cache.rm_all()
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    ytcfg.set("yt_napari", "in_memory_array_cache", True)
+
+    reg = {"fields": [{"field_type": "gas", "field_name": "density"}]}
+    reg["resolution"] = (4, 4, 4)
+    m_data = _dm.DataContainer(
+        filename=yt_ugrid_ds_fn,
+        selections={"regions": [reg]},
+        store_in_cache=store_in_cache,
+        cache_policy=cache_policy,
+    )
+    _ = _mi._load_dataset_selections(m_data, [])
+    assert dataset_cache.exists(yt_ugrid_ds_fn) is ds_cached
+    assert (len(array_cache.available) == 1) is array_cached
+
+    dataset_cache.rm_all()
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+
+
+def test_timeseries_cache_policy(tmp_path):
+    from yt_napari._ds_cache import dataset_cache
+    from yt_napari._special_loaders import _construct_ugrid_timeseries
+
+    dataset_cache.rm_all()
+    file_dir, flist = _construct_ugrid_timeseries(tmp_path, 3)
+    reg = {"fields": [{"field_type": "gas", "field_name": "density"}]}
+    reg["resolution"] = (4, 4, 4)
+    m_data = _dm.Timeseries(
+        file_selection={"directory": file_dir, "file_pattern": "_ytnapari*"},
+        selections={"regions": [reg]},
+    )
+    _ = _mi._load_timeseries(m_data, [])
+    assert len(dataset_cache.available) == 0
+
+    m_data.store_in_cache = True
+    m_data.cache_policy = "dataset"
+    _ = _mi._load_timeseries(m_data, [])
+    assert all(dataset_cache.exists(fi) for fi in flist)
+    dataset_cache.rm_all()
+
+
+def test_timeseries_stack_auto_resolution(monkeypatch):
+    import yt
+
+    # the refinement of the timesteps increases over time
+    def _load_step(file):
+        dims = {"step_0": 8, "step_1": 16}[file]
+        arr = np.random.default_rng().random(size=(dims,) * 3)
+        return yt.load_uniform_grid({"density": (arr, "g/cm**3")}, arr.shape)
+
+    monkeypatch.setattr(
+        _mi, "_find_timeseries_files", lambda fsel: ["step_0", "step_1"]
+    )
+    monkeypatch.setattr(_mi, "_load_with_timeseries_specials_check", _load_step)
+    reg = {"fields": [{"field_type": "gas", "field_name": "density"}]}
+    reg["resolution"] = "auto"
+    m_data = _dm.Timeseries(
+        file_selection={"directory": "", "file_pattern": "step_*"},
+        selections={"regions": [reg]},
+        load_as_stack=True,
+        store_in_cache=False,
+    )
+    layers = _mi._load_timeseries(m_data, [])
+    # every step is sampled at the resolution chosen for the first one
+    assert layers[0][0].shape == (2, 8, 8, 8)
+
+
+@pytest.mark.parametrize("seltype", ["regions", "slices"])
+def test_multi_field_single_read(monkeypatch, seltype):
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(
+        fields=("density", "temperature"), units=("g/cm**3", "K")
+    )
+    fields = [
+        {"field_type": "stream", "field_name": "density"},
+        {"field_type": "stream", "field_name": "temperature"},
+    ]
+    if seltype == "regions":
+        sel = {"fields": fields, "resolution": (8, 8, 8)}
+    else:
+        sel = {"fields": fields, "normal": "z", "resolution": (8, 8)}
+    selections = _dm.SelectionObject(**{seltype: [sel]})
+
+    reads = []
+    read_fields = _mi._read_fields
+
+    def _counting_read(frb, fields):
+        reads.append(fields)
+        read_fields(frb, fields)
+
+    monkeypatch.setattr(_mi, "_read_fields", _counting_read)
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    assert reads == [[("stream", "density"), ("stream", "temperature")]]
+    assert [layer[1]["name"] for layer in layers] == [
+        "stream:density",
+        "stream:temperature",
+    ]
+    # matches sampling each field on its own
+    for layer, field in zip(layers, fields):
+        sel_1 = _dm.SelectionObject(**{seltype: [dict(sel, fields=[field])]})
+        single = _mi._load_selections_from_ds(ds, sel_1, [])
+        assert np.allclose(single[0][0], layer[0])
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_shared_slices(monkeypatch, executor):
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(
+        fields=("density", "temperature"), units=("g/cm**3", "K")
+    )
+    density = [{"field_type": "stream", "field_name": "density"}]
+    temperature = [{"field_type": "stream", "field_name": "temperature"}]
+    slices = [
+        {"fields": density, "normal": "z", "resolution": (8, 8)},
+        {
+            "fields": temperature,
+            "normal": "z",
+            "resolution": (16, 12),
+            "slice_width": {"value": 0.5},
+            "slice_height": {"value": 0.5},
+        },
+        {"fields": density, "normal": "x", "resolution": (8, 8)},
+    ]
+    selections = _dm.SelectionObject(slices=slices)
+
+    # every slice sampled on its own
+    expected = [
+        _mi._load_selections_from_ds(ds, _dm.SelectionObject(slices=[sel]), [])[0]
+        for sel in slices
+    ]
+
+    n_slices = []
+    ds_slice = ds.slice
+
+    def _counting_slice(*args, **kwargs):
+        n_slices.append(args[0])
+        return ds_slice(*args, **kwargs)
+
+    monkeypatch.setattr(ds, "slice", _counting_slice)
+    layers = _mi._load_selections_from_ds(ds, selections, [], executor=executor)
+    # the two z slices share a single slice object
+    assert sorted(n_slices) == [0, 2]
+    assert [layer[0].shape for layer in layers] == [(8, 8), (12, 16), (8, 8)]
+    for layer, single in zip(layers, expected):
+        assert np.allclose(layer[0], single[0])
+
+    shared = _mi._get_shared_slices(ds, selections.slices)
+    assert shared[0] is shared[1]
+    assert shared[2] is None
+
+
+def test_orthoslices():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [
+        {"field_type": "index", "field_name": ax, "take_log": False} for ax in "xyz"
+    ]
+    selections = _dm.SelectionObject(
+        regions=[{"fields": fields, "resolution": (8, 8, 8)}],
+        orthoslices=[{"fields": fields, "resolution": (8, 8)}],
+    )
+    assert len(_mi._get_selection_list(selections)) == 4
+
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    assert len(layers) == 12
+    regions, planes = layers[:3], layers[3:]
+    for iplane, (data, _, _, layer_domain) in enumerate(planes):
+        normal = iplane // 3
+        expected_shape = [8, 8, 8]
+        expected_shape[normal] = 1
+        assert data.shape == tuple(expected_shape)
+        assert layer_domain.n_d == 3
+        assert layer_domain.center.to("code_length").d == pytest.approx(0.5)
+        # in-plane coordinates match the region through the same cells
+        ax = iplane % 3
+        if ax != normal:
+            region = regions[ax][0]
+            assert np.allclose(data, np.take(region, [4], axis=normal))
+
+    # the planes line up with the region
+    ref = _mi._choose_ref_layer(layers)
+    aligned = ref.align_sanitize_layers(layers)
+    for normal in range(3):
+        translate = aligned[3 + 3 * normal][1]["translate"]
+        assert translate[normal] == pytest.approx(3.5)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_orthoslices_single_read(monkeypatch, executor):
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(
+        fields=("density", "temperature"), units=("g/cm**3", "K")
+    )
+    fields = [
+        {"field_type": "stream", "field_name": "density"},
+        {"field_type": "stream", "field_name": "temperature"},
+    ]
+    center = {"value": (0.3, 0.45, 0.6), "unit": "code_length"}
+    sel = {"fields": fields, "resolution": (16, 16), "center": center}
+    selections = _dm.SelectionObject(orthoslices=[sel])
+
+    # every plane read from its own yt slice
+    with monkeypatch.context() as m:
+        m.setattr(
+            _mi,
+            "_read_orthoslices",
+            lambda ds, c, fields: [ds.slice(ax, c[ax]) for ax in range(3)],
+        )
+        expected = _mi._load_selections_from_ds(ds, selections, [])
+
+    n_reads = []
+    io = ds.index.io
+    read_fluid_selection = io._read_fluid_selection
+
+    def _counting_read(chunks, selector, fields, *args, **kwargs):
+        n_reads.append(fields)
+        return read_fluid_selection(chunks, selector, fields, *args, **kwargs)
+
+    monkeypatch.setattr(io, "_read_fluid_selection", _counting_read)
+    layers = _mi._load_selections_from_ds(ds, selections, [], executor=executor)
+    # the cells of the three planes are read in a single pass
+    assert len(n_reads) == 1
+    assert len(layers) == 6
+    for layer, single in zip(layers, expected):
+        assert np.allclose(layer[0], single[0])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_selections(tmp_path, caplog, executor):
+    import logging
+
+    from yt import testing as yt_testing
+
+    from yt_napari._array_cache import array_cache
+    from yt_napari._ds_cache import dataset_cache
+
+    caplog.set_level(logging.WARNING, logger="yt")
+    array_cache.rm_all()
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    ytcfg.set("yt_napari", "in_memory_array_cache", True)
+
+    # a grid dataset on disk that worker processes can re-open
+    ds = yt_testing.fake_random_ds(16)
+    cg = ds.covering_grid(0, ds.domain_left_edge, ds.domain_dimensions)
+    fn = cg.save_as_dataset(str(tmp_path / "grid.h5"), fields=[("gas", "density")])
+    ds = dataset_cache.check_then_load(fn, cache_if_not_found=False)
+
+    fields = [{"field_type": "grid", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[
+            {"fields": fields, "resolution": (4, 4, 4)},
+            {"fields": fields, "resolution": (6, 6, 6)},
+        ],
+        slices=[
+            {"fields": fields, "normal": "x", "resolution": (8, 8)},
+            {"fields": fields, "normal": "y", "resolution": (10, 10)},
+        ],
+    )
+    tc = _mi.TimeseriesContainer()
+    layers = _mi._load_selections_from_ds(
+        ds, selections, [], timeseries_container=tc, executor=executor
+    )
+    shapes = [layer[0].shape for layer in layers]
+    assert shapes == [(4, 4, 4), (6, 6, 6), (8, 8), (10, 10)]
+    assert len(tc.layers_in_selections) == 4
+    # the arrays from workers end up in the main array cache
+    assert len(array_cache.available) == 4
+
+    array_cache.rm_all()
+    serial = _mi._load_selections_from_ds(ds, selections, [], executor="serial")
+    for layer, layer_serial in zip(layers, serial):
+        assert np.allclose(layer[0], layer_serial[0])
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+
+
+def test_parallel_selections_runtime_config(tmp_path):
+    from yt import testing as yt_testing
+
+    from yt_napari import _array_cache
+    from yt_napari._ds_cache import dataset_cache
+
+    ds = yt_testing.fake_random_ds(16)
+    cg = ds.covering_grid(0, ds.domain_left_edge, ds.domain_dimensions)
+    fn = cg.save_as_dataset(str(tmp_path / "grid.h5"), fields=[("gas", "density")])
+    ds = dataset_cache.check_then_load(fn, cache_if_not_found=False)
+
+    fields = [{"field_type": "grid", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[
+            {"fields": fields, "resolution": (4, 4, 4)},
+            {"fields": fields, "resolution": (6, 6, 6)},
+        ],
+    )
+    # a config value set at runtime is used by the worker processes
+    ytcfg.set("yt_napari", "disk_cache_dir", str(tmp_path / "disk_cache"))
+    _ = _mi._load_selections_from_ds(
+        ds, selections, [], cache_arrays=False, executor="process"
+    )
+    for sel in selections.regions:
+        key = _array_cache.get_cache_key(ds, sel, sel.fields[0])
+        assert _array_cache.disk_cache.exists(key)
+    ytcfg.set("yt_napari", "disk_cache_dir", "")
+
+
+def test_parallel_selections_auto_resolution(tmp_path):
+    from yt import testing as yt_testing
 
+    from yt_napari._array_cache import array_cache
+    from yt_napari._ds_cache import dataset_cache
+
+    enabled = ytcfg.get("yt_napari", "in_memory_array_cache")
+    ytcfg.set("yt_napari", "in_memory_array_cache", True)
+    array_cache.rm_all()
+
+    ds = yt_testing.fake_random_ds(16)
+    cg = ds.covering_grid(0, ds.domain_left_edge, ds.domain_dimensions)
+    fn = cg.save_as_dataset(str(tmp_path / "grid.h5"), fields=[("gas", "density")])
+    ds = dataset_cache.check_then_load(fn, cache_if_not_found=False)
+
+    fields = [{"field_type": "grid", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[
+            {"fields": fields, "resolution": "auto"},
+            {"fields": fields, "resolution": (6, 6, 6)},
+        ],
+    )
+    serial = _mi._load_selections_from_ds(ds, selections, [], executor="serial")
+    # the entries cached by the serial load are hit by the process load
+    layers = _mi._load_selections_from_ds(ds, selections, [], executor="process")
+    for layer, layer_serial in zip(layers, serial):
+        assert layer[0] is layer_serial[0]
+
+    array_cache.rm_all()
+    ytcfg.set("yt_napari", "in_memory_array_cache", enabled)
+
+
+def test_parallel_selections_in_memory():
+    # in-memory datasets cannot be re-opened by worker processes, so they
+    # fall back to threads
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[{"fields": fields, "resolution": (4, 4, 4)}],
+        slices=[
+            {"fields": fields, "normal": nrm, "resolution": (8, 8)}
+            for nrm in ("x", "y", "z")
+        ],
+    )
+    layers = _mi._load_selections_from_ds(ds, selections, [], executor="process")
+    assert [layer[0].shape for layer in layers] == [(4, 4, 4)] + [(8, 8)] * 3
+
+    with pytest.raises(ValueError, match="executor must be one of"):
+        _ = _mi._load_selections_from_ds(ds, selections, [], executor="mpi")
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_ingestion(tmp_path, caplog, executor):
+    import json
+    import logging
+
+    from yt_napari._schema_version import schema_name
+    from yt_napari._special_loaders import _construct_ugrid_timeseries
+
+    caplog.set_level(logging.WARNING, logger="yt")
+    file_dir, _ = _construct_ugrid_timeseries(tmp_path, 3)
+    fields = [{"field_type": "gas", "field_name": "density"}]
+    json_strs = []
+    for res in (4, 6, 8):
+        jdict = {
+            "$schema": schema_name,
+            "datasets": [
+                {
+                    "filename": "_ytnapari_load_grid",
+                    "selections": {
+                        "regions": [{"fields": fields, "resolution": (res,) * 3}]
+                    },
+                }
+            ],
+            "timeseries": [
+                {
+                    "file_selection": {
+                        "directory": file_dir,
+                        "file_pattern": "_ytnapari*",
+                    },
+                    "selections": {
+                        "slices": [
+                            {"fields": fields, "normal": "z", "resolution": (res, res)}
+                        ]
+                    },
+                    "load_as_stack": True,
+                }
+            ],
+        }
+        json_strs.append(json.dumps(jdict))
+
+    models = [_dm.InputModel.model_validate_json(js) for js in json_strs]
+    layers, ts_layers = _mi._process_validated_models(models, executor=executor)
+    assert [layer[0].shape for layer in layers] == [(r, r, r) for r in (4, 6, 8)]
+    assert [layer[0].shape for layer in ts_layers] == [(3, r, r) for r in (4, 6, 8)]
+
+    ytcfg.set("yt_napari", "ingestion_executor", executor)
+    out_layers = _mi.load_from_json_strs(json_strs)
+    ytcfg.set("yt_napari", "ingestion_executor", "serial")
+    serial_layers = _mi.load_from_json_strs(json_strs)
+    assert len(out_layers) == len(serial_layers) == 6
+    for layer, serial_layer in zip(out_layers, serial_layers):
+        assert layer[1]["name"] == serial_layer[1]["name"]
+        # the special loader datasets are random, so only compare shapes
+        assert layer[0].shape == serial_layer[0].shape
+        scale = layer[1].get("scale", 1.0)
+        assert np.allclose(scale, serial_layer[1].get("scale", 1.0))
+
+
+def test_covering_grid_dds():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    for level in range(3):
+        cg = ds.covering_grid(level, ds.domain_left_edge, (4, 4, 4))
+        assert np.allclose(_mi._get_level_dds(ds, level), cg.dds)
+    assert _mi._get_level_dds(ds, 1) is _mi._get_level_dds(ds, 1)
+
+    # only the final covering grid is built
+    n_grids = []
+    covering_grid = ds.covering_grid
+
+    def _counting_covering_grid(*args, **kwargs):
+        n_grids.append(args)
+        return covering_grid(*args, **kwargs)
+
+    ds.covering_grid = _counting_covering_grid
+    LE = ds.domain_left_edge
+    RE = ds.domain_left_edge + ds.domain_width / 2
+    cg, dims = _mi._get_covering_grid(ds, LE, RE, 1, 0)
+    assert len(n_grids) == 1
+    assert np.all(cg.ActiveDimensions == ds.domain_dimensions)
+
+
+def test_cast_to_dtype():
+    data = np.linspace(0.0, 10.0, 12).reshape((3, 4))
     data[0, 0] = np.nan
-    rsc = _mi._linear_rescale(data)
-    assert np.nanmin(rsc) == 0.0
-    assert np.nanmax(rsc) == 1.0
-
-    data[1, 1] = np.inf
-    rsc = _mi._linear_rescale(data)
-    assert np.nanmin(rsc) == 0.0
-    assert np.nanmax(rsc) == 1.0
-
-    data = 10 * rng.random((5, 5))
-    data[1, 1] = np.inf
-    with pytest.warns(RuntimeWarning, match="invalid value"):
-        rsc = _mi._linear_rescale(data, fill_inf=False)
-        assert np.nanmin(rsc) == 0.0
-        assert np.nanmax(rsc) == 0.0
+
+    data_32, quantization = _mi._cast_to_dtype(data, "float32")
+    assert data_32.dtype == np.float32
+    assert quantization is None
+    assert _mi._cast_to_dtype(data, None)[0] is data
+
+    data_range = (float(np.nanmin(data)), float(np.nanmax(data)))
+    for dtype in ("uint8", "uint16"):
+        qdata, (scale, offset) = _mi._cast_to_dtype(data, dtype, data_range)
+        assert qdata.dtype == np.dtype(dtype)
+        finite = np.isfinite(data)
+        assert qdata[0, 0] == 0  # nan
+        assert qdata[finite].min() == 1
+        assert qdata.max() == np.iinfo(dtype).max
+        values = qdata[finite] * scale + offset
+        assert np.allclose(values, data[finite], atol=scale)
+
+        # re-quantizing onto a wider range keeps the values
+        new_q = _mi._get_quantization((-10.0, 10.0), dtype)
+        rdata = _mi._requantize(qdata, (scale, offset), new_q)
+        assert rdata[0, 0] == 0
+        values = rdata[finite] * new_q[0] + new_q[1]
+        assert np.allclose(values, data[finite], atol=scale + new_q[0])
+
+    with pytest.raises(ValueError, match="dtype must be one of"):
+        _ = _mi._cast_to_dtype(data, "int8")
+
+
+def test_selection_dtype():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    layers = []
+    for dtype in ("float64", "float32", "uint16"):
+        selections = _dm.SelectionObject(
+            regions=[{"fields": fields, "resolution": (8, 8, 8), "dtype": dtype}],
+            slices=[{"fields": fields, "normal": "z", "dtype": dtype}],
+        )
+        layers.append(_mi._load_selections_from_ds(ds, selections, []))
+
+    for layer_64, layer_32, layer_16 in zip(*layers):
+        assert layer_32[0].dtype == np.float32
+        assert layer_16[0].dtype == np.uint16
+        md = layer_16[1]["metadata"]
+        assert md["_data_range"] == layer_64[1]["metadata"]["_data_range"]
+        scale, offset = md["_quantization"]
+        values = layer_16[0] * scale + offset
+        assert np.allclose(values, layer_64[0], atol=scale)
+
+
+def test_timeseries_quantized_stack(tmp_path):
+    from yt_napari._special_loaders import _construct_ugrid_timeseries
+
+    file_dir, _ = _construct_ugrid_timeseries(tmp_path, 3)
+    reg = {"fields": [{"field_type": "gas", "field_name": "density"}]}
+    reg["resolution"] = (4, 4, 4)
+    reg["dtype"] = "uint8"
+    m_data = _dm.Timeseries(
+        file_selection={"directory": file_dir, "file_pattern": "_ytnapari*"},
+        selections={"regions": [reg]},
+        load_as_stack=True,
+    )
+    im, im_kwargs, _ = _mi._load_timeseries(m_data, [])[0]
+    assert im.shape == (3, 4, 4, 4)
+    assert im.dtype == np.uint8
+    # the stack shares a single quantization covering every timestep
+    scale, offset = im_kwargs["metadata"]["_quantization"]
+    data_range = im_kwargs["metadata"]["_data_range"]
+    assert im.min() >= 1
+    assert (im.min() * scale + offset) >= data_range[0] - scale
+    assert (im.max() * scale + offset) <= data_range[1] + scale
+
+
+def test_finalize_data(monkeypatch):
+    # use small chunks to cover chunk boundaries
+    monkeypatch.setattr(_mi, "_finalize_chunk_size", 7)
+    rng = np.random.default_rng()
+    data = 10 * rng.random((5, 6)) + 1.0
+    expected = np.log10(data)
+
+    buffer = data.copy()
+    result, data_range = _mi._finalize_data(buffer, True)
+    assert np.shares_memory(result, buffer)
+    assert np.allclose(result, expected)
+    assert data_range == (expected.min(), expected.max())
+
+    buffer = data.copy()
+    buffer[0, 0] = 0.0  # -inf after log
+    buffer[1, 1] = np.nan
+    result, data_range = _mi._finalize_data(buffer, True, rescale=True)
+    expected[0, 0] = np.nan
+    expected[1, 1] = np.nan
+    expected_min, expected_max = np.nanmin(expected), np.nanmax(expected)
+    expected = (expected - expected_min) / (expected_max - expected_min)
+    assert np.allclose(result, expected, equal_nan=True)
+    assert data_range == (0.0, 1.0)
+
+    # non-float input is converted, all-nan input has no range
+    result, data_range = _mi._finalize_data(np.arange(10), False)
+    assert result.dtype == np.float64
+    assert data_range == (0.0, 9.0)
+    _, data_range = _mi._finalize_data(np.full((3, 3), np.nan), False)
+    assert np.all(np.isnan(data_range))
+
+
+def test_repeated_field_finalize():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [
+        {"field_type": "stream", "field_name": "density", "take_log": True},
+        {"field_type": "stream", "field_name": "density", "take_log": False},
+    ]
+    selections = _dm.SelectionObject(
+        regions=[{"fields": fields, "resolution": (6, 6, 6)}]
+    )
+    log_layer, lin_layer = _mi._load_selections_from_ds(ds, selections, [])
+    assert np.allclose(log_layer[0], np.log10(lin_layer[0]))
+
+
+@pytest.mark.parametrize("use_memmap", [False, True])
+def test_tiled_region(tmp_path, use_memmap):
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density", "mass"), units=("g/cm**3", "g"))
+    LE = ds.domain_left_edge + ds.domain_width / 10
+    RE = ds.domain_right_edge - ds.domain_width / 5
+    res = (8, 7, 5)
+    field = ("stream", "density")
+    expected = np.asarray(_mi._get_region_frb(ds, LE, RE, res)[field])
+
+    if use_memmap:
+        ytcfg.set("yt_napari", "region_tile_dir", str(tmp_path))
+    frb = _mi._get_region_frb(ds, LE, RE, res, tile_size=3)
+    assert isinstance(frb, _mi._TiledRegion)
+    assert len(list(frb._tiles())) == 3 * 3 * 2
+    data = frb[field]
+    assert isinstance(data, np.memmap) is use_memmap
+    assert np.allclose(data, expected)
+    # the backing file is removed once mapped
+    assert len(list(tmp_path.iterdir())) == 0
+
+    # through the ingestor with a configured tile size and several fields
+    ytcfg.set("yt_napari", "region_tile_size", 4)
+    fields = [
+        {"field_type": "stream", "field_name": "density"},
+        {"field_type": "stream", "field_name": "mass"},
+    ]
+    selections = _dm.SelectionObject(
+        regions=[{"fields": fields, "resolution": res, "dtype": "float32"}]
+    )
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    ytcfg.set("yt_napari", "region_tile_size", 0)
+    ytcfg.set("yt_napari", "region_tile_dir", "")
+
+    untiled = _mi._load_selections_from_ds(ds, selections, [])
+    for layer, untiled_layer in zip(layers, untiled):
+        assert layer[0].dtype == np.float32
+        assert np.allclose(layer[0], untiled_layer[0])
+
+
+def test_lazy_selections():
+    pytest.importorskip("dask")
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    selections = _dm.SelectionObject(
+        regions=[
+            {"fields": fields, "resolution": (10, 6, 5)},
+            {"fields": fields, "resolution": (10, 6, 5), "rescale": True},
+        ],
+        covering_grids=[{"fields": fields, "level": 1, "dtype": "float32"}],
+    )
+    ytcfg.set("yt_napari", "lazy_chunk_size", 4)
+    lazy = _mi._load_lazy_selections(ds, selections, [])
+    ytcfg.set("yt_napari", "lazy_chunk_size", 8)
+    eager = _mi._load_selections_from_ds(ds, selections, [])
+
+    assert len(lazy) == len(eager) == 3
+    region, rescaled, cg = lazy
+    assert region[0].chunks[0] == (4, 4, 2)
+    assert region[1]["metadata"]["_data_range"] is None
+    # rescaled selections need the full range and are sampled eagerly
+    assert isinstance(rescaled[0], np.ndarray)
+    assert cg[0].dtype == np.float32
+    for lazy_layer, eager_layer in zip(lazy, eager):
+        assert lazy_layer[0].shape == eager_layer[0].shape
+        assert np.allclose(np.asarray(lazy_layer[0]), eager_layer[0])
+
+
+def test_multiscale_grid_no_cells():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    edges = {"left_edge": {"value": (0.5, 0.5, 0.5)}}
+    edges["right_edge"] = {"value": (0.5001, 0.5001, 0.5001)}
+    sel = {"fields": fields, "level": 1, "multiscale": True, **edges}
+    selections = _dm.SelectionObject(covering_grids=[sel])
+    with pytest.raises(ValueError, match="has no cells at any level up to level 1"):
+        _ = _mi._load_selections_from_ds(ds, selections, [])
+
+
+@pytest.mark.parametrize("dtype", ["float64", "uint8"])
+def test_multiscale_grid(dtype):
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    sel = {"fields": fields, "level": 1, "multiscale": True, "dtype": dtype}
+    selections = _dm.SelectionObject(covering_grids=[sel])
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    assert len(layers) == 1
+    data, im_kwargs, _, layer_domain = layers[0]
+    assert im_kwargs["multiscale"] is True
+    assert len(data) == 2
+    # finest level first, matching the layer domain
+    assert data[0].shape == tuple(2 * np.array(data[1].shape))
+    assert np.all(layer_domain.resolution.d == data[0].shape)
+
+    # each level matches a single covering grid, with a shared range
+    level_0 = {"fields": fields, "level": 0}
+    selections = _dm.SelectionObject(covering_grids=[level_0])
+    expected, expected_kwargs = _mi._load_selections_from_ds(ds, selections, [])[0][:2]
+    md = im_kwargs["metadata"]
+    assert md["_data_range"][0] <= expected_kwargs["metadata"]["_data_range"][0]
+    assert md["_data_range"][1] >= expected_kwargs["metadata"]["_data_range"][1]
+    if dtype == "uint8":
+        scale, offset = md["_quantization"]
+        values = data[1] * scale + offset
+        assert np.allclose(values, expected, atol=scale)
+    else:
+        assert np.allclose(data[1], expected)
+
+    # levels are rescaled by the combined range
+    sel["rescale"] = True
+    selections = _dm.SelectionObject(covering_grids=[sel])
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    md = layers[0][1]["metadata"]
+    assert md["_data_range"] == (0.0, 1.0)
+    if dtype == "float64":
+        assert min(np.nanmin(d) for d in layers[0][0]) == 0.0
+        assert max(np.nanmax(d) for d in layers[0][0]) == 1.0
+
+
+def test_auto_resolution():
+    from yt import testing as yt_testing
+
+    ds = yt_testing.fake_amr_ds(fields=("density",), units=("g/cm**3",))
+    # the corner is only covered by the root grid
+    LE = ds.domain_left_edge
+    RE = ds.domain_left_edge + ds.domain_width / 8
+    assert _mi._get_finest_level(ds, LE, RE) == 0
+
+    LE = ds.domain_center - ds.domain_width / 8
+    RE = ds.domain_center + ds.domain_width / 8
+    level = _mi._get_finest_level(ds, LE, RE)
+    assert level == ds.index.grid_levels.max()
+    expected = (RE - LE) / _mi._get_level_dds(ds, level)
+    assert _mi._get_auto_resolution(ds, LE, RE) == tuple(expected.d.astype(int))
+
+    # capped by the memory budget
+    max_memory = ytcfg.get("yt_napari", "auto_resolution_max_memory")
+    ytcfg.set("yt_napari", "auto_resolution_max_memory", 8 * 1000)
+    res = _mi._get_auto_resolution(ds, ds.domain_left_edge, ds.domain_right_edge)
+    assert np.prod(res) <= 1000
+
+    fields = [{"field_type": "stream", "field_name": "density"}]
+    selections = _dm.SelectionObject(regions=[{"fields": fields, "resolution": "auto"}])
+    layers = _mi._load_selections_from_ds(ds, selections, [])
+    ytcfg.set("yt_napari", "auto_resolution_max_memory", max_memory)
+    assert layers[0][0].shape == res
+    assert tuple(layers[0][1]["metadata"]["_layer_domain"].resolution.d) == res
+
+
+def test_progressive_resolutions():
+    assert _mi._get_progressive_factors(8) == [8, 4, 2, 1]
+    assert _mi._get_progressive_factors(1) == [1]
+    res = _mi._get_progressive_resolutions((64, 32, 4), coarsening=8)
+    assert res == [(8, 4, 1), (16, 8, 1), (32, 16, 2), (64, 32, 4)]
+    res = _mi._get_progressive_resolutions((2, 2, 2), coarsening=8)
+    assert res == [(1, 1, 1), (2, 2, 2)]
+
+
+@pytest.mark.parametrize("use_memmap", [False, True])
+def test_timeseries_container_stack(selection_objs, tmp_path, use_memmap):
+    slc_1, slc_2, slc_3, reg_1, reg_2, reg_3 = selection_objs
+    if use_memmap:
+        ytcfg.set("yt_napari", "timeseries_stack_dir", str(tmp_path))
+    tc = _mi.TimeseriesContainer(n_steps=3)
+    shp = (10, 10)
+    domain = _mi.LayerDomain(
+        unyt.unyt_array([0, 0], "m"),
+        unyt.unyt_array([1.0, 1.0], "m"),
+        shp,
+        n_d=2,
+    )
+    rng = np.random.default_rng()
+    ims = [rng.random(shp) for _ in range(3)]
+    for im in ims:
+        # slc_1 and slc_3 match, so only a single stack per field is built
+        tc.add(slc_1, ("enzo", "temperature"), (im, {}, "image", domain))
+        tc.add(slc_3, ("enzo", "density"), (2 * im, {}, "image", domain))
+    ytcfg.set("yt_napari", "timeseries_stack_dir", "")
+
+    assert len(tc.layers_in_selections) == 0
+    assert tc.check_for_selection(slc_3, ("enzo", "temperature")) == 0
+    concatd = tc.concat_by_selection()
+    assert len(concatd) == 2
+    assert isinstance(concatd[0][0], np.memmap) is use_memmap
+    assert np.all(concatd[0][0] == np.stack(ims))
+    assert np.all(concatd[1][0] == 2 * np.stack(ims))
+    assert len(list(tmp_path.iterdir())) == 0
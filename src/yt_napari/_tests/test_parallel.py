@@ -0,0 +1,53 @@
+import pytest
+
+from yt_napari import _parallel
+from yt_napari.config import ytcfg
+
+
+@pytest.mark.parametrize("kind", ["serial", "thread", "process"])
+def test_ordered_map(kind):
+    result = _parallel.ordered_map(pow, range(6), [2] * 6, kind=kind, max_workers=2)
+    assert result == [i**2 for i in range(6)]
+
+
+def test_ordered_map_errors():
+    with pytest.raises(ValueError, match="executor must be one of"):
+        _ = _parallel.ordered_map(abs, [1], kind="gpu")
+
+    with pytest.raises(TypeError):
+        _ = _parallel.ordered_map(abs, [1, "a"], kind="thread")
+
+
+def test_max_workers():
+    max_workers = ytcfg.get("yt_napari", "max_workers")
+    ytcfg.set("yt_napari", "max_workers", 0)
+    assert _parallel.get_max_workers() is None
+    ytcfg.set("yt_napari", "max_workers", 3)
+    assert _parallel.get_max_workers() == 3
+    ytcfg.set("yt_napari", "max_workers", max_workers)
+
+
+def test_process_pool_reuse():
+    pool = _parallel.get_process_pool(max_workers=2)
+    assert pool._mp_context.get_start_method() == "spawn"
+    result = _parallel.ordered_map(pow, [3], [2], kind="process", max_workers=2)
+    assert result == [9]
+    assert _parallel.get_process_pool(max_workers=2) is pool
+
+    # a new max_workers value replaces the pool
+    assert _parallel.get_process_pool(max_workers=1) is not pool
+    _parallel.shutdown_process_pool()
+    assert _parallel._process_pool is None
+
+
+def test_process_pool_config():
+    pool = _parallel.get_process_pool(max_workers=1)
+    tile_size = ytcfg.get("yt_napari", "region_tile_size")
+    ytcfg.set("yt_napari", "region_tile_size", tile_size + 7)
+    # workers start with the config values of the calling process
+    new_pool = _parallel.get_process_pool(max_workers=1)
+    assert new_pool is not pool
+    settings = new_pool.submit(_parallel._get_config_settings).result()
+    assert settings["region_tile_size"] == tile_size + 7
+    ytcfg.set("yt_napari", "region_tile_size", tile_size)
+    _parallel.shutdown_process_pool()
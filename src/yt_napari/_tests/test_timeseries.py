@@ -128,6 +128,36 @@ def test_slice(yt_ds_0):
     assert np.all(data3 == data)
 
 
+def test_selection_dtype(tmp_path, yt_ds_0):
+    reg = ts.Region(_field, resolution=(8, 8, 8))
+    data = reg.sample_ds(yt_ds_0)
+
+    reg_32 = ts.Region(_field, resolution=(8, 8, 8), dtype="float32")
+    assert reg_32.sample_ds(yt_ds_0).dtype == np.float32
+
+    with pytest.raises(ValueError, match="requires a quantize_range"):
+        _ = ts.Slice(_field, "x", dtype="uint8")
+
+    qrange = (float(data.min()), float(data.max()))
+    reg_8 = ts.Region(
+        _field, resolution=(8, 8, 8), dtype="uint8", quantize_range=qrange
+    )
+    data_8 = reg_8.sample_ds(yt_ds_0)
+    assert data_8.dtype == np.uint8
+    scale, offset = reg_8._quantization
+    assert np.allclose(data_8 * scale + offset, data, atol=scale)
+
+    file_dir, _ = _construct_ugrid_timeseries(tmp_path, 3)
+    im_data, im_kwargs, _ = ts._get_im_data(
+        reg_8,
+        file_dir=file_dir,
+        file_pattern="_ytnapari_load_grid-????",
+        load_as_stack=True,
+    )
+    assert im_data.dtype == np.uint8
+    assert im_kwargs["metadata"]["_quantization"] == reg_8._quantization
+
+
 @pytest.mark.parametrize(
     "selection",
     [
@@ -265,3 +295,108 @@ def test_dask_missing(tmp_path, monkeypatch):
             load_as_stack=False,
             use_dask=True,
         )
+
+
+def test_load_and_sample_disk_cache(yt_ugrid_ds_fn, tmp_path, caplog):
+    import logging
+
+    caplog.set_level(logging.WARNING, logger="yt")
+    ytcfg.set("yt_napari", "disk_cache_dir", str(tmp_path))
+
+    reg = ts.Region(("gas", "density"), resolution=(4, 4, 4))
+    data = ts._load_and_sample(yt_ugrid_ds_fn, reg, False)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    # a new selection with the same geometry hits the cache and still sets
+    # the aspect ratio from the dataset
+    reg_2 = ts.Region(("gas", "density"), resolution=(4, 4, 4))
+    data_2 = ts._load_and_sample(yt_ugrid_ds_fn, reg_2, False)
+    assert isinstance(data_2, np.memmap)
+    assert np.allclose(data_2, data)
+    assert np.allclose(reg_2._aspect_ratio, reg._aspect_ratio)
+
+    ytcfg.set("yt_napari", "disk_cache_dir", "")
+
+
+def test_load_and_sample_no_disk_cache(yt_ugrid_ds_fn, monkeypatch, caplog):
+    import logging
+
+    from yt_napari import _array_cache
+
+    caplog.set_level(logging.WARNING, logger="yt")
+
+    def _no_key(*args):
+        raise AssertionError("no cache key without a disk cache")
+
+    monkeypatch.setattr(_array_cache, "get_cache_key", _no_key)
+    reg = ts.Region(("gas", "density"), resolution=(4, 4, 4))
+    data = ts._load_and_sample(yt_ugrid_ds_fn, reg, False)
+    assert np.allclose(data, reg.sample_ds(yt.load(yt_ugrid_ds_fn)))
+
+
+def test_frame_buffer():
+    frames = np.zeros((2, 3, 3))
+    buffer = ts._FrameBuffer(frames)
+    for step in range(3):
+        buffer.append(np.full((3, 3), step + 1.0))
+    assert buffer.size == 5
+    assert buffer.data.shape == (5, 3, 3)
+    assert np.all(buffer.data[:, 0, 0] == [0.0, 0.0, 1.0, 2.0, 3.0])
+    # capacity doubles rather than growing by one frame
+    assert buffer._frames.shape[0] == 8
+
+
+@pytest.mark.parametrize("load_as_stack", [True, False])
+def test_follower(tmp_path, load_as_stack):
+    from napari.components import ViewerModel
+
+    nfiles = 2
+    file_dir, _ = _construct_ugrid_timeseries(tmp_path, nfiles)
+    file_pat = "_ytnapari_load_grid-????"
+    sel = ts.Slice(_field, "x", resolution=(10, 10))
+    viewer = ViewerModel()
+
+    tfs = ts._get_file_selection(file_dir, file_pat)
+    im_data, im_kwargs, files = ts._get_im_data(
+        sel, file_dir=file_dir, file_pattern=file_pat, load_as_stack=load_as_stack
+    )
+    layer = None
+    if load_as_stack:
+        layer = viewer.add_image(im_data, **im_kwargs)
+    follower = ts.TimeseriesFollower(
+        viewer, sel, tfs, files, layer=layer, layer_kwargs=im_kwargs
+    )
+    assert follower.poll() == []
+
+    # new files are only sampled once unchanged between polls
+    new_file = os.path.join(file_dir, "_ytnapari_load_grid-0002")
+    open(new_file, "w").close()
+    assert follower.poll() == []
+    new_frames = follower.poll()
+    assert [new_file] == [file for file, _ in new_frames]
+    assert follower.poll() == []
+
+    follower.add_frame(new_frames[0])
+    if load_as_stack:
+        assert len(viewer.layers) == 1
+        assert viewer.layers[0].data.shape == (nfiles + 1, 10, 10)
+        assert np.all(viewer.layers[0].data[:nfiles] == im_data)
+    else:
+        assert len(viewer.layers) == 1
+        assert viewer.layers[0].data.shape == (10, 10)
+    assert follower.n_frames == nfiles + 1
+
+
+def test_follow_requires_pattern(tmp_path, monkeypatch):
+    from napari.components import ViewerModel
+
+    file_dir, flist = _construct_ugrid_timeseries(tmp_path, 2)
+    sel = ts.Slice(_field, "x", resolution=(10, 10))
+
+    # the arguments are checked before any file is loaded
+    def _no_loading(*args, **kwargs):
+        raise AssertionError("files were loaded")
+
+    monkeypatch.setattr(ts, "_get_im_data", _no_loading)
+    with pytest.raises(ValueError, match="requires a file_pattern"):
+        ts.add_to_viewer(ViewerModel(), sel, file_list=flist, follow=True)
@@ -1,3 +1,6 @@
+import copy
+import os
+
 import numpy as np
 import pytest
 
@@ -155,3 +158,133 @@ def test_aspect_rat(tmp_path):
     for _, im_kwargs, _ in ts_layers:
         print(im_kwargs)
         assert np.sum(im_kwargs["scale"] != 1.0) > 0
+
+
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_iter_timeseries_datasets(tmp_path, prefetch_depth):
+    nfiles = 4
+    fdir, flist = _construct_ugrid_timeseries(tmp_path, nfiles)
+
+    timesteps = mi._iter_timeseries_datasets(flist, "none", prefetch_depth)
+    loaded = [file for file, ds in timesteps if hasattr(ds, "domain_center")]
+    assert loaded == flist
+
+    # errors raised while prefetching are re-raised in order
+    bad_list = flist[:2] + ["_ytnapari_load_what-01"]
+    timesteps = mi._iter_timeseries_datasets(bad_list, "none", prefetch_depth)
+    with pytest.raises(AttributeError, match="The special loader"):
+        _ = [file for file, _ in timesteps]
+
+    # stopping early shuts down the prefetcher
+    timesteps = mi._iter_timeseries_datasets(flist, "none", prefetch_depth)
+    file, _ = next(timesteps)
+    timesteps.close()
+    assert file == flist[0]
+
+
+def test_prefetched_load(tmp_path):
+    nfiles = 4
+    fdir, flist = _construct_ugrid_timeseries(tmp_path, nfiles)
+
+    f_dict = {"directory": fdir, "file_pattern": "_ytnapari_load_grid-????"}
+    jdict_new = copy.deepcopy(jdicts[0])
+    jdict_new["timeseries"][0]["file_selection"] = f_dict
+    jdict_new["timeseries"][0]["load_as_stack"] = True
+    jdict_new["timeseries"][0]["prefetch_depth"] = 2
+
+    im = InputModel.model_validate(jdict_new)
+    _, ts_layers = mi._process_validated_model(im)
+    assert ts_layers[0][0].shape == (nfiles, 10, 10)
+
+
+@pytest.mark.parametrize("load_as_stack", [True, False])
+def test_parallel_load(tmp_path, load_as_stack):
+    nfiles = 4
+    fdir, flist = _construct_ugrid_timeseries(tmp_path, nfiles)
+
+    f_dict = {"directory": fdir, "file_pattern": "_ytnapari_load_grid-????"}
+    jdict_new = copy.deepcopy(jdicts[0])
+    jdict_new["timeseries"][0]["file_selection"] = f_dict
+    jdict_new["timeseries"][0]["selections"]["regions"] = [reg_dict]
+    jdict_new["timeseries"][0]["load_as_stack"] = load_as_stack
+    jdict_new["timeseries"][0]["process_in_parallel"] = True
+    jdict_new["timeseries"][0]["num_workers"] = 2
+
+    im = InputModel.model_validate(jdict_new)
+    _, ts_layers = mi._process_validated_model(im)
+
+    jdict_new["timeseries"][0]["process_in_parallel"] = False
+    im = InputModel.model_validate(jdict_new)
+    _, serial_layers = mi._process_validated_model(im)
+
+    # regions then slices, one layer per field (and timestep when not stacked)
+    assert len(ts_layers) == len(serial_layers)
+    for layer, serial_layer in zip(ts_layers, serial_layers):
+        assert layer[0].shape == serial_layer[0].shape
+        assert layer[1]["name"] == serial_layer[1]["name"]
+    if load_as_stack:
+        assert ts_layers[0][0].shape == (nfiles, 10, 10, 10)
+
+
+def test_parallel_multiscale_load(tmp_path):
+    nfiles = 2
+    fdir, flist = _construct_ugrid_timeseries(tmp_path, nfiles)
+
+    f_dict = {"directory": fdir, "file_pattern": "_ytnapari_load_grid-????"}
+    cg_dict = {"fields": fields_to_load[:1], "level": 1, "multiscale": True}
+    jdict_new = copy.deepcopy(jdicts[0])
+    jdict_new["timeseries"][0]["file_selection"] = f_dict
+    jdict_new["timeseries"][0]["selections"] = {"covering_grids": [cg_dict]}
+    jdict_new["timeseries"][0]["load_as_stack"] = False
+    jdict_new["timeseries"][0]["process_in_parallel"] = True
+    jdict_new["timeseries"][0]["num_workers"] = 2
+
+    im = InputModel.model_validate(jdict_new)
+    _, ts_layers = mi._process_validated_model(im)
+
+    jdict_new["timeseries"][0]["process_in_parallel"] = False
+    im = InputModel.model_validate(jdict_new)
+    _, serial_layers = mi._process_validated_model(im)
+
+    assert len(ts_layers) == nfiles
+    for layer, serial_layer in zip(ts_layers, serial_layers):
+        assert layer[1]["multiscale"] is True
+        assert len(layer[0]) == len(serial_layer[0]) == 2
+        for level, serial_level in zip(layer[0], serial_layer[0]):
+            assert level.shape == serial_level.shape
+
+
+def test_shared_array():
+    data = np.arange(12.0).reshape((3, 4))
+    shared = mi._share_array(data)
+    received = []
+    mi._attach_shared_array(shared, lambda arr: received.append(np.array(arr)))
+    assert np.all(received[0] == data)
+    # the block is freed once received
+    with pytest.raises(FileNotFoundError):
+        mi.shared_memory.SharedMemory(name=shared[0])
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+@pytest.mark.parametrize("failure", ["worker", "add"])
+def test_parallel_load_failure_frees_shared_memory(tmp_path, failure):
+    nfiles = 4
+    fdir, flist = _construct_ugrid_timeseries(tmp_path, nfiles)
+    selections = InputModel.model_validate(jdicts[1]).timeseries[0].selections
+
+    class _FailingContainer(mi.TimeseriesContainer):
+        def add(self, *args, **kwargs):
+            raise RuntimeError("could not add")
+
+    if failure == "worker":
+        flist = flist[:1] + [str(tmp_path / "not_a_file")] + flist[1:]
+        tc = mi.TimeseriesContainer()
+        err = Exception
+    else:
+        tc = _FailingContainer()
+        err = RuntimeError
+
+    shm_before = set(os.listdir("/dev/shm"))
+    with pytest.raises(err):
+        mi._load_timesteps_in_processes(flist, selections, tc, num_workers=2)
+    assert set(os.listdir("/dev/shm")) - shm_before == set()
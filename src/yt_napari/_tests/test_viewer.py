@@ -4,6 +4,7 @@ from napari.layers import Layer
 from napari.layers.utils._link_layers import get_linked_layers
 from yt import testing as yt_testing
 
+from yt_napari.config import ytcfg
 from yt_napari.viewer import Scene
 
 
@@ -153,3 +154,86 @@ def test_viewer_slices(make_napari_viewer, yt_ds):
     sc.add_slice(viewer, yt_ds, "x", ("gas", "density"), resolution=res)
 
     assert len(viewer.layers) == 1
+
+
+def test_viewer_array_resolution(make_napari_viewer, yt_ds):
+    viewer = make_napari_viewer()
+    sc = Scene()
+    sc.add_region(viewer, yt_ds, ("gas", "density"), resolution=np.array([4, 5, 6]))
+    assert viewer.layers[0].data.shape == (4, 5, 6)
+
+
+def test_viewer_orthoslices(make_napari_viewer, yt_ds):
+    viewer = make_napari_viewer()
+    sc = Scene()
+    sc.add_region(viewer, yt_ds, ("gas", "density"), resolution=(10, 10, 10))
+    sc.add_orthoslices(viewer, yt_ds, ("gas", "density"), resolution=(20, 20))
+
+    assert len(viewer.layers) == 4
+    names = [layer.name for layer in viewer.layers[1:]]
+    assert names == ["gas_density_x", "gas_density_y", "gas_density_z"]
+    shapes = [layer.data.shape for layer in viewer.layers[1:]]
+    assert shapes == [(1, 20, 20), (20, 1, 20), (20, 20, 1)]
+    # each plane passes through the domain center of the region
+    for normal, layer in enumerate(viewer.layers[1:]):
+        assert layer.scale[normal] == pytest.approx(0.5)
+        assert layer.translate[normal] == pytest.approx(4.75)
+
+
+def test_viewer_orthoslices_single_read(make_napari_viewer, yt_ds, monkeypatch):
+    viewer = make_napari_viewer()
+    n_reads = []
+    io = yt_ds.index.io
+    read_fluid_selection = io._read_fluid_selection
+
+    def _counting_read(*args, **kwargs):
+        n_reads.append(args)
+        return read_fluid_selection(*args, **kwargs)
+
+    monkeypatch.setattr(io, "_read_fluid_selection", _counting_read)
+    center = yt_ds.arr([0.3, 0.45, 0.6], "code_length")
+    sc = Scene()
+    sc.add_orthoslices(viewer, yt_ds, ("gas", "density"), center=center)
+    # the cells of the three planes are read in a single pass
+    assert len(n_reads) == 1
+    assert len(viewer.layers) == 3
+
+
+def test_viewer_dtype(make_napari_viewer, yt_ds):
+    viewer = make_napari_viewer()
+    sc = Scene()
+    res = (10, 10, 10)
+    sc.add_region(viewer, yt_ds, ("gas", "density"), resolution=res, name="d64")
+    sc.add_region(
+        viewer, yt_ds, ("gas", "density"), resolution=res, dtype="uint16", name="d16"
+    )
+    assert viewer.layers["d16"].data.dtype == np.uint16
+    md_64 = viewer.layers["d64"].metadata
+    md_16 = viewer.layers["d16"].metadata
+    assert md_16["_data_range"] == pytest.approx(md_64["_data_range"])
+
+    # contrast limits are set in the stored values of the quantized layer
+    sc.normalize_color_limits(["d64", "d16"], viewer.layers)
+    scale, offset = md_16["_quantization"]
+    clims = np.array(viewer.layers["d16"].contrast_limits) * scale + offset
+    assert clims == pytest.approx(viewer.layers["d64"].contrast_limits)
+
+
+def test_viewer_progressive(make_napari_viewer, yt_ds, qtbot):
+    viewer = make_napari_viewer()
+    sc = Scene()
+    res = (16, 16, 16)
+    ytcfg.set("yt_napari", "progressive_coarsening", 4)
+    worker = sc.add_region(
+        viewer, yt_ds, ("gas", "density"), resolution=res, progressive=True
+    )
+    ytcfg.set("yt_napari", "progressive_coarsening", 8)
+    layer = viewer.layers[0]
+    assert layer.data.shape == (4, 4, 4)
+    width = np.array(layer.data.shape) * layer.scale
+
+    qtbot.waitUntil(lambda: layer.data.shape == res, timeout=10000)
+    worker.quit()
+    # the refined layer covers the same region
+    assert np.allclose(np.array(layer.data.shape) * layer.scale, width)
+    assert layer.metadata["_layer_domain"].resolution.d.tolist() == list(res)
@@ -9,12 +9,13 @@ from unittest.mock import patch
 
 import numpy as np
 
-from yt_napari import _widget_reader as _wr
+from yt_napari import _parallel, _widget_reader as _wr
 from yt_napari._data_model import InputModel
 from yt_napari._ds_cache import dataset_cache
 
 # import ReaderWidget, SelectionEntry, TimeSeriesReader
 from yt_napari._special_loaders import _construct_ugrid_timeseries
+from yt_napari.config import ytcfg
 
 
 def test_widget_reader_add_selections(make_napari_viewer, yt_ugrid_ds_fn):
@@ -153,8 +154,10 @@ def test_subsequent_load(make_napari_viewer, yt_ugrid_ds_fn):
     temp_layer = viewer.layers[1]
     assert temp_layer.metadata["_yt_napari_layer"] is True
 
+    _ = _parallel.get_process_pool(max_workers=1)
     r.clear_cache()
     assert len(dataset_cache.available) == 0
+    assert _parallel._process_pool is None
 
     r.deleteLater()
 
@@ -262,3 +265,46 @@ def test_covering_grid_selection(make_napari_viewer, yt_ugrid_ds_fn):
     r._post_load_function = rebuild
     r.load_data()
     r.deleteLater()
+
+
+def test_progressive_models(yt_ugrid_ds_fn):
+    region = {"fields": [{"field_type": "gas", "field_name": "density"}]}
+    slc = {"fields": region["fields"], "normal": "x"}
+    region["resolution"] = (16, 16, 8)
+    py_kwargs = {
+        "datasets": [
+            {
+                "filename": yt_ugrid_ds_fn,
+                "selections": {"regions": [region], "slices": [slc]},
+            }
+        ]
+    }
+    ytcfg.set("yt_napari", "progressive_coarsening", 4)
+    first_pass, refinements = _wr._get_progressive_models(py_kwargs)
+    ytcfg.set("yt_napari", "progressive_coarsening", 8)
+
+    assert len(first_pass) == 2
+    coarse_sels = first_pass[0]["datasets"][0]["selections"]
+    assert list(coarse_sels.keys()) == ["regions"]
+    assert coarse_sels["regions"][0]["resolution"] == (4, 4, 2)
+    assert first_pass[1]["datasets"][0]["selections"] == {"slices": [slc]}
+    assert "cache_policy" not in first_pass[1]["datasets"][0]
+    assert len(refinements) == 2
+    for refinement, res in zip(refinements, [(8, 8, 4), (16, 16, 8)]):
+        sels = refinement["datasets"][0]["selections"]
+        assert list(sels.keys()) == ["regions"]
+        assert sels["regions"][0]["resolution"] == res
+        _ = InputModel.model_validate(refinement)
+
+    # only the final pass keeps its arrays in memory
+    policies = [kw["datasets"][0].get("cache_policy") for kw in refinements]
+    assert first_pass[0]["datasets"][0]["cache_policy"] == "dataset"
+    assert policies == ["dataset", None]
+
+    py_kwargs["datasets"][0]["cache_policy"] = "none"
+    first_pass, refinements = _wr._get_progressive_models(py_kwargs)
+    assert first_pass[0]["datasets"][0]["cache_policy"] == "none"
+    _ = py_kwargs["datasets"][0].pop("cache_policy")
+
+    # the input is unchanged
+    assert region["resolution"] == (16, 16, 8)
@@ -1,3 +1,4 @@
+import copy
 import json
 from collections import defaultdict
 from typing import Callable, Optional
@@ -15,10 +16,11 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
-from yt_napari import _data_model, _gui_utilities, _model_ingestor
+from yt_napari import _data_model, _gui_utilities, _model_ingestor, _parallel
+from yt_napari._array_cache import array_cache
 from yt_napari._ds_cache import dataset_cache
 from yt_napari._schema_version import schema_name
-from yt_napari.viewer import _check_for_reference_layer
+from yt_napari.viewer import _check_for_reference_layer, _refine_layer
 
 
 class YTReader(QWidget):
@@ -121,6 +123,9 @@ class ReaderWidget(YTReader):
         ss.clicked.connect(self.save_selection)
         load_group.addWidget(ss.native)
 
+        self.progressive = widgets.CheckBox(text="Progressive", value=False)
+        self.layout().addWidget(self.progressive.native)
+
     def save_selection(self):
         py_kwargs = self._validate_data_model()
 
@@ -138,6 +143,9 @@ class ReaderWidget(YTReader):
 
     def clear_cache(self):
         dataset_cache.rm_all()
+        array_cache.rm_all()
+        # worker processes hold their own caches, free them with the workers
+        _parallel.shutdown_process_pool()
 
     def load_data(self):
         # this function semi-automatically extracts the arguments needed to
@@ -145,23 +153,46 @@ class ReaderWidget(YTReader):
         # same data ingestion function as the json loader.
 
         py_kwargs = self._validate_data_model()
-        model = _data_model.InputModel.model_validate(py_kwargs)
+        models_kwargs, refinements = [py_kwargs], []
+        if self.progressive.value:
+            models_kwargs, refinements = _get_progressive_models(py_kwargs)
+        models = [_data_model.InputModel.model_validate(kw) for kw in models_kwargs]
 
         # process each layer
-        layer_list, _ = _model_ingestor._process_validated_model(model)
+        layer_list, _ = _model_ingestor._process_validated_models(models)
         # align all layers after checking for or setting the reference layer
         ref_layer = _check_for_reference_layer(self.viewer.layers)
         if ref_layer is None:
             ref_layer = _model_ingestor._choose_ref_layer(layer_list)
         layer_list = ref_layer.align_sanitize_layers(layer_list)
 
+        new_layers = []
         for new_layer in layer_list:
             im_arr, im_kwargs, _ = new_layer
             if self._post_load_function is not None:
                 im_arr = self._post_load_function(im_arr)
 
             # add the new layer
-            self.viewer.add_image(im_arr, **im_kwargs)
+            new_layers.append(self.viewer.add_image(im_arr, **im_kwargs))
+
+        if len(refinements) > 0:
+            # regions are loaded first, so they are the leading layers
+            def _on_refined(refined_layers):
+                self._refine_layers(new_layers, ref_layer, refined_layers)
+
+            worker = progressive_load(refinements)
+            worker.yielded.connect(_on_refined)
+            if _use_threading:  # pragma: no cover
+                worker.start()
+            else:
+                worker.run()
+
+    def _refine_layers(self, layers, ref_layer, refined_layers):
+        refined_layers = ref_layer.align_sanitize_layers(refined_layers)
+        for layer, (im_arr, im_kwargs, _) in zip(layers, refined_layers):
+            if self._post_load_function is not None:
+                im_arr = self._post_load_function(im_arr)
+            _refine_layer(layer, im_arr, im_kwargs)
 
     def _validate_data_model(self):
 
@@ -337,6 +368,55 @@ class TimeSeriesReader(YTReader):
         return py_kwargs
 
 
+def _get_progressive_models(py_kwargs: dict):
+    # returns the kwargs of the models of the first pass, with every region at
+    # its coarsest progressive resolution, along with the kwargs of models
+    # containing only the regions at each finer resolution. Regions below the
+    # final resolution are not kept in the in-memory array cache, so that the
+    # coarse passes do not evict the full resolution arrays.
+    selections = py_kwargs["datasets"][0]["selections"]
+    regions = selections.get("regions", [])
+    if len(regions) == 0:
+        return [py_kwargs], []
+
+    default_res = _data_model.Region.model_fields["resolution"].default
+    resolutions = [region.get("resolution", default_res) for region in regions]
+    factors = _model_ingestor._get_progressive_factors()
+
+    default_policy = _data_model.DataContainer.model_fields["cache_policy"].default
+    policy = py_kwargs["datasets"][0].get("cache_policy", default_policy)
+    coarse_policy = "dataset" if policy == "dataset+arrays" else policy
+
+    def _regions_model(factor):
+        new_kwargs = copy.deepcopy(py_kwargs)
+        dataset = new_kwargs["datasets"][0]
+        dataset["selections"] = {"regions": dataset["selections"]["regions"]}
+        if factor != factors[-1]:
+            dataset["cache_policy"] = coarse_policy
+        for region, res in zip(dataset["selections"]["regions"], resolutions):
+            region["resolution"] = _model_ingestor._coarsen_resolution(res, factor)
+        return new_kwargs
+
+    first_pass = [_regions_model(factors[0])]
+    others = {key: sel for key, sel in selections.items() if key != "regions"}
+    if any(len(sel) > 0 for sel in others.values()):
+        new_kwargs = copy.deepcopy(py_kwargs)
+        new_kwargs["datasets"][0]["selections"] = others
+        first_pass.append(new_kwargs)
+
+    refinements = [_regions_model(factor) for factor in factors[1:]]
+    return first_pass, refinements
+
+
+@thread_worker
+def progressive_load(refinements):
+    # loads and yields the region layers of each refinement model
+    for py_kwargs in refinements:
+        model = _data_model.InputModel.model_validate(py_kwargs)
+        layer_list, _ = _model_ingestor._process_validated_model(model)
+        yield layer_list
+
+
 @thread_worker(progress=True)
 def time_series_load(model):  # pragma: no cover
     _, layer_list = _model_ingestor._process_validated_model(model)
@@ -1,6 +1,27 @@
 from yt.config import ytcfg
 
-_defaults = {"in_memory_cache": True}
+_defaults = {
+    "in_memory_cache": True,
+    "max_cached_datasets": 0,
+    "max_cache_memory": 0,
+    "cache_validation": "stat",
+    "cache_validation_interval": 10.0,
+    "in_memory_array_cache": False,
+    "max_array_cache_memory": 268435456,
+    "disk_cache_dir": "",
+    "max_disk_cache_size": 10737418240,
+    "timeseries_prefetch_depth": 0,
+    "selection_executor": "serial",
+    "ingestion_executor": "serial",
+    "max_workers": 0,
+    "region_tile_size": 0,
+    "region_tile_dir": "",
+    "lazy_chunk_size": 8,
+    "auto_resolution_max_memory": 536870912,
+    "progressive_coarsening": 8,
+    "timeseries_stack_dir": "",
+    "timeseries_follow_interval": 5.0,
+}
 
 
 def _get_updated_config(cfg):
@@ -1,5 +1,6 @@
 import abc
 import os.path
+import threading
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
@@ -7,21 +8,51 @@ import yt
 from napari import Viewer
 from unyt import unyt_array, unyt_quantity
 
-from yt_napari import _data_model as _dm, _model_ingestor as _mi
+from yt_napari import _array_cache, _data_model as _dm, _model_ingestor as _mi
+from yt_napari.config import ytcfg
 
 
 class _Selection(abc.ABC):
     nd: int = None
 
-    def __init__(self, field: Tuple[str, str], take_log: Optional[bool] = None):
+    def __init__(
+        self,
+        field: Tuple[str, str],
+        take_log: Optional[bool] = None,
+        dtype: Optional[str] = None,
+        quantize_range: Optional[Tuple[float, float]] = None,
+    ):
         self.field = field
         self._take_log = take_log
         self._aspect_ratio = None
 
+        _mi._validate_dtype(dtype)
+        if dtype in _mi._quantized_dtypes and quantize_range is None:
+            msg = (
+                f"dtype {dtype} requires a quantize_range so that every "
+                "timestep is quantized with the same scale and offset."
+            )
+            raise ValueError(msg)
+        self.dtype = dtype
+        self.quantize_range = quantize_range
+
     @abc.abstractmethod
     def sample_ds(self, ds):
         """sample a yt dataset with the selection object"""
 
+    @abc.abstractmethod
+    def _update_aspect_ratio(self, ds):
+        """set the aspect ratio from the dataset if not already known"""
+
+    def _cache_token(self) -> dict:
+        # the public attributes describing the selection geometry, used when
+        # building array cache keys
+        return {
+            ky: val
+            for ky, val in vars(self).items()
+            if not ky.startswith("_") and ky != "field"
+        }
+
     @property
     def _requires_scale(self):
         return any(self._aspect_ratio != 1.0)
@@ -35,9 +66,17 @@ class _Selection(abc.ABC):
             self._take_log = ds._get_field_info(self.field).take_log
         return self._take_log
 
+    @property
+    def _quantization(self) -> Optional[Tuple[float, float]]:
+        if self.dtype not in _mi._quantized_dtypes:
+            return None
+        return _mi._get_quantization(self.quantize_range, self.dtype)
+
     def _finalize_array(self, ds, sample):
-        if self.take_log(ds) is True:
-            return np.log10(sample)
+        sample, _ = _mi._finalize_data(sample, self.take_log(ds))
+        sample, _ = _mi._cast_to_dtype(
+            sample, self.dtype, quantization=self._quantization
+        )
         return sample
 
     @staticmethod
@@ -60,8 +99,12 @@ class _RegionBase(_Selection, abc.ABC):
         left_edge: Optional[Union[unyt_array, Tuple[np.ndarray, str]]] = None,
         right_edge: Optional[Union[unyt_array, Tuple[np.ndarray, str]]] = None,
         take_log: Optional[bool] = None,
+        dtype: Optional[str] = None,
+        quantize_range: Optional[Tuple[float, float]] = None,
     ):
-        super().__init__(field, take_log=take_log)
+        super().__init__(
+            field, take_log=take_log, dtype=dtype, quantize_range=quantize_range
+        )
         self.left_edge = left_edge
         self.right_edge = right_edge
         self._le, self._le_units = self._validate_unit_tuple(left_edge)
@@ -83,6 +126,10 @@ class _RegionBase(_Selection, abc.ABC):
         wid = RE - LE
         self._aspect_ratio = wid / wid[0]
 
+    def _update_aspect_ratio(self, ds):
+        if self._aspect_ratio is None:
+            self._calc_aspect_ratio(*self._get_edges(ds))
+
     def _get_edges(self, ds):
         if self.left_edge is None:
             LE = ds.domain_left_edge
@@ -120,6 +167,13 @@ class Region(_RegionBase):
     take_log: bool
         (optional) If True, take the log10 of the sampled field. Defaults to the
         default behavior for the field in the dataset.
+    dtype: str
+        (optional) the dtype of the sampled images, one of "float64" (default),
+        "float32", "uint8" or "uint16".
+    quantize_range: (float, float)
+        (required for uint8 and uint16) the (min, max) of the final values
+        (after taking the log) to quantize between. Values outside the range
+        are clipped.
     """
 
     nd = 3
@@ -131,9 +185,16 @@ class Region(_RegionBase):
         right_edge: Optional[Union[unyt_array, Tuple[np.ndarray, str]]] = None,
         resolution: Optional[Tuple[int, int, int]] = (400, 400, 400),
         take_log: Optional[bool] = None,
+        dtype: Optional[str] = None,
+        quantize_range: Optional[Tuple[float, float]] = None,
     ):
         super().__init__(
-            field, left_edge=left_edge, right_edge=right_edge, take_log=take_log
+            field,
+            left_edge=left_edge,
+            right_edge=right_edge,
+            take_log=take_log,
+            dtype=dtype,
+            quantize_range=quantize_range,
         )
         self.resolution = resolution
 
@@ -167,8 +228,7 @@ class Region(_RegionBase):
         LE, RE = self._get_edges(ds)
 
         res = self.resolution
-        if self._aspect_ratio is None:
-            self._calc_aspect_ratio(LE, RE)
+        self._update_aspect_ratio(ds)
 
         frb = _mi._get_region_frb(ds, LE, RE, res)
 
@@ -186,23 +246,26 @@ class CoveringGrid(_RegionBase):
         level: Optional[int] = 0,
         num_ghost_zones: Optional[int] = 0,
         take_log: Optional[bool] = None,
+        dtype: Optional[str] = None,
+        quantize_range: Optional[Tuple[float, float]] = None,
     ):
 
         super().__init__(
-            field, left_edge=left_edge, right_edge=right_edge, take_log=take_log
+            field,
+            left_edge=left_edge,
+            right_edge=right_edge,
+            take_log=take_log,
+            dtype=dtype,
+            quantize_range=quantize_range,
         )
         self.level = level
         self.num_ghost_zones = num_ghost_zones
 
     def sample_ds(self, ds):
         LE, RE = self._get_edges(ds)
+        self._update_aspect_ratio(ds)
 
-        if self._aspect_ratio is None:
-            self._calc_aspect_ratio(LE, RE)
-
-        frb, _ = _mi._get_covering_grid(
-            ds, LE, RE, self.level, self.num_ghost_zones, test_dims=None
-        )
+        frb, _ = _mi._get_covering_grid(ds, LE, RE, self.level, self.num_ghost_zones)
         data = frb[self.field]
         return self._finalize_array(ds, data)
 
@@ -234,6 +297,13 @@ class Slice(_Selection):
     take_log: bool
         (optional) If True, take the log10 of the sampled field. Defaults to the
         default behavior for the field in the dataset.
+    dtype: str
+        (optional) the dtype of the sampled images, one of "float64" (default),
+        "float32", "uint8" or "uint16".
+    quantize_range: (float, float)
+        (required for uint8 and uint16) the (min, max) of the final values
+        (after taking the log) to quantize between. Values outside the range
+        are clipped.
     """
 
     nd = 2
@@ -248,8 +318,12 @@ class Slice(_Selection):
         resolution: Optional[Tuple[int, int]] = (400, 400),
         periodic: Optional[bool] = False,
         take_log: Optional[bool] = None,
+        dtype: Optional[str] = None,
+        quantize_range: Optional[Tuple[float, float]] = None,
     ):
-        super().__init__(field, take_log=take_log)
+        super().__init__(
+            field, take_log=take_log, dtype=dtype, quantize_range=quantize_range
+        )
 
         self.normal = normal
         self.center = center
@@ -277,31 +351,7 @@ class Slice(_Selection):
     def _calc_aspect_ratio(self, width, height):
         self._aspect_ratio = np.array([1.0, height / width])
 
-    def sample_ds(self, ds):
-        """
-        return a fixed resolution slice of a field in a yt dataset.
-
-        Parameters
-        ----------
-        ds : yt dataset
-            the yt dataset to sample
-
-        Examples
-        --------
-
-        >>> import yt
-        >>> from unyt import unyt_quantity
-        >>> from yt_napari.timeseries import Slice
-        >>> ds = yt.load_sample("IsolatedGalaxy")
-        >>> w = unyt_quantity(0.2, 'Mpc')
-        >>> slc = Slice(("enzo", "Density"), "x", width=w, height=w)
-        >>> slc_data = slc.sample_ds(ds)
-
-        Notes
-        -----
-        This is equivalent to `ds.slice(...).to_frb()[field]`, but is a useful
-        abstraction for applying the same selection to a series of datasets.
-        """
+    def _get_center_width_height(self, ds):
         if self.center is None:
             center = ds.domain_center
         elif self._center_ndarray is not None:
@@ -325,10 +375,41 @@ class Slice(_Selection):
             height = ds.arr(self._height_val, self._height_units)
         else:
             height = self.height
+        return center, width, height
 
+    def _update_aspect_ratio(self, ds):
         if self._aspect_ratio is None:
+            _, width, height = self._get_center_width_height(ds)
             self._calc_aspect_ratio(width, height)
 
+    def sample_ds(self, ds):
+        """
+        return a fixed resolution slice of a field in a yt dataset.
+
+        Parameters
+        ----------
+        ds : yt dataset
+            the yt dataset to sample
+
+        Examples
+        --------
+
+        >>> import yt
+        >>> from unyt import unyt_quantity
+        >>> from yt_napari.timeseries import Slice
+        >>> ds = yt.load_sample("IsolatedGalaxy")
+        >>> w = unyt_quantity(0.2, 'Mpc')
+        >>> slc = Slice(("enzo", "Density"), "x", width=w, height=w)
+        >>> slc_data = slc.sample_ds(ds)
+
+        Notes
+        -----
+        This is equivalent to `ds.slice(...).to_frb()[field]`, but is a useful
+        abstraction for applying the same selection to a series of datasets.
+        """
+        center, width, height = self._get_center_width_height(ds)
+        self._update_aspect_ratio(ds)
+
         frb, _ = _mi._process_slice(
             ds,
             self.normal,
@@ -347,21 +428,52 @@ def _load_and_sample(file, selection: Union[Slice, Region], is_dask):
     if is_dask:
         yt.set_log_level(40)  # errors and critical only
     ds = _mi._load_with_timeseries_specials_check(file)
-    return selection.sample_ds(ds)
 
+    if _array_cache.disk_cache.directory is None:
+        # the persistent array cache is disabled
+        return selection.sample_ds(ds)
+
+    # check the persistent array cache before sampling
+    field_token = {"field": selection.field, "take_log": selection.take_log(ds)}
+    cache_key = _array_cache.get_cache_key(ds, selection, field_token)
+    if cache_key is None:
+        return selection.sample_ds(ds)
+    cached = _array_cache.disk_cache.get(cache_key)
+    if cached is not None:
+        selection._update_aspect_ratio(ds)
+        return cached[0]
+
+    data = selection.sample_ds(ds)
+    if selection._quantization is not None:
+        data_range = tuple(selection.quantize_range)
+    else:
+        data_range = (float(data.min()), float(data.max()))
+    md = {
+        "_data_range": data_range,
+        "_is_log": selection.take_log(ds),
+        "_quantization": selection._quantization,
+    }
+    _array_cache.disk_cache.add(cache_key, data, md)
+    return data
+
+
+def _check_dask():
+    try:
+        import dask  # noqa: F401
+    except ImportError:
+        msg = (
+            "This functionality requires dask: "
+            'pip install "dask[distributed, array]"'
+        )
+        raise ImportError(msg)
 
-def _get_im_data(
-    selection: Union[Slice, Region],
+
+def _get_file_selection(
     file_dir: Optional[str] = None,
     file_pattern: Optional[str] = None,
     file_list: Optional[List[str]] = None,
     file_range: Optional[Tuple[int, int, int]] = None,
-    load_as_stack: Optional[bool] = False,
-    use_dask: Optional[bool] = False,
-    return_delayed: Optional[bool] = True,
-    stack_scaling: Optional[float] = 1.0,
-    **kwargs,
-):
+) -> _dm.TimeSeriesFileSelection:
     ts_kwargs = dict(
         file_pattern=file_pattern,
         directory=file_dir,
@@ -371,26 +483,45 @@ def _get_im_data(
     for ky in ["file_pattern", "directory", "file_list", "file_range"]:
         if ts_kwargs[ky] is None:
             _ = ts_kwargs.pop(ky)
+    return _dm.TimeSeriesFileSelection(**ts_kwargs)
 
-    tfs = _dm.TimeSeriesFileSelection(**ts_kwargs)
-    files = _mi._find_timeseries_files(tfs)
 
-    im_data = []
+def _get_frame(file: str, selection: Union[Slice, Region], use_dask: bool):
+    # the sampled image of a single timestep, as a delayed array with dask
     if use_dask is False:
-        for file in files:
-            im_data.append(_load_and_sample(file, selection, use_dask))
-    else:
-        try:
-            from dask import array as da, delayed
-        except ImportError:
-            msg = (
-                "This functionality requires dask: "
-                'pip install "dask[distributed, array]"'
-            )
-            raise ImportError(msg)
-        for file in files:
-            data = delayed(_load_and_sample)(file, selection, use_dask)
-            im_data.append(da.from_delayed(data, selection.resolution, dtype=float))
+        return _load_and_sample(file, selection, use_dask)
+
+    from dask import array as da, delayed
+
+    data = delayed(_load_and_sample)(file, selection, use_dask)
+    dtype = np.dtype(selection.dtype or float)
+    return da.from_delayed(data, selection.resolution, dtype=dtype)
+
+
+def _get_im_data(
+    selection: Union[Slice, Region],
+    file_dir: Optional[str] = None,
+    file_pattern: Optional[str] = None,
+    file_list: Optional[List[str]] = None,
+    file_range: Optional[Tuple[int, int, int]] = None,
+    load_as_stack: Optional[bool] = False,
+    use_dask: Optional[bool] = False,
+    return_delayed: Optional[bool] = True,
+    stack_scaling: Optional[float] = 1.0,
+    **kwargs,
+):
+    tfs = _get_file_selection(file_dir, file_pattern, file_list, file_range)
+    files = _mi._find_timeseries_files(tfs)
+
+    if use_dask:
+        _check_dask()
+    im_data = [_get_frame(file, selection, use_dask) for file in files]
+
+    if selection._quantization is not None:
+        # record how to recover the data values
+        kwargs["metadata"] = dict(kwargs.get("metadata", {}))
+        kwargs["metadata"]["_data_range"] = tuple(selection.quantize_range)
+        kwargs["metadata"]["_quantization"] = selection._quantization
 
     # note: scale validation modifies kwargs in place
     _validate_scale(selection, kwargs, load_as_stack, stack_scaling)
@@ -432,6 +563,156 @@ def _validate_scale(
     kwargdict["scale"] = sc
 
 
+class _FrameBuffer:
+    # a stack of timestep images that grows by doubling its capacity, so that
+    # appending a frame copies a single frame (amortized)
+    def __init__(self, frames: np.ndarray):
+        self._frames = frames
+        self.size = frames.shape[0]
+
+    def append(self, frame: np.ndarray):
+        if self.size == self._frames.shape[0]:
+            shape = (max(2 * self.size, 1),) + self._frames.shape[1:]
+            frames = np.empty(shape, dtype=self._frames.dtype)
+            frames[: self.size] = self._frames[: self.size]
+            self._frames = frames
+        self._frames[self.size] = frame
+        self.size += 1
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._frames[: self.size]
+
+
+class TimeseriesFollower:
+    """
+    Follows a running simulation, adding the outputs that appear after a
+    timeseries was added to a viewer. Returned by add_to_viewer(follow=True).
+
+    The file selection is polled every interval seconds from a background
+    thread. Only new files are sampled, once their size and modification time
+    are unchanged between two polls (so that outputs still being written are
+    skipped). New frames are appended to the stacked layer, or added as new
+    layers when not stacking.
+
+    Parameters
+    ----------
+    viewer: napari.Viewer
+        the viewer the timeseries was added to
+    selection: Slice or Region
+        the selection to apply to each new dataset
+    file_selection: TimeSeriesFileSelection
+        the file selection to poll
+    files: List[str]
+        the files that are already loaded
+    layer: napari.layers.Image
+        the stacked layer to append to, None when not stacking
+    interval: float
+        the polling interval in seconds. Defaults to the
+        timeseries_follow_interval config value.
+    use_dask: bool
+        if True, new frames are delayed arrays
+    layer_kwargs: dict
+        the keyword arguments for new layers when not stacking
+    """
+
+    def __init__(
+        self,
+        viewer: Viewer,
+        selection: Union[Slice, Region],
+        file_selection: _dm.TimeSeriesFileSelection,
+        files: List[str],
+        layer=None,
+        interval: Optional[float] = None,
+        use_dask: Optional[bool] = False,
+        layer_kwargs: Optional[dict] = None,
+    ):
+        if interval is None:
+            interval = ytcfg.get("yt_napari", "timeseries_follow_interval")
+        self.viewer = viewer
+        self.selection = selection
+        self.file_selection = file_selection
+        self.known_files = set(files)
+        self.n_frames = len(files)
+        self.layer = layer
+        self.interval = interval
+        self.use_dask = use_dask
+        self.layer_kwargs = layer_kwargs or {}
+        self.worker = None
+        self._pending = {}
+        self._stopped = threading.Event()
+        self._buffer = None
+        if layer is not None and not use_dask:
+            self._buffer = _FrameBuffer(np.asarray(layer.data))
+
+    def poll(self) -> List[Tuple[str, np.ndarray]]:
+        """
+        check for new files, returning the (file, frame) of each new file
+        that has finished writing
+        """
+        new_files = []
+        for file in _mi._find_timeseries_files(self.file_selection):
+            if file in self.known_files:
+                continue
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            file_stat = (stat.st_size, stat.st_mtime_ns)
+            if self._pending.get(file) == file_stat:
+                new_files.append(file)
+            else:
+                self._pending[file] = file_stat
+
+        frames = []
+        for file in new_files:
+            frames.append((file, _get_frame(file, self.selection, self.use_dask)))
+            self.known_files.add(file)
+            self._pending.pop(file)
+        return frames
+
+    def _follow(self):
+        # the background polling loop, yielding new frames to the main thread
+        while not self._stopped.wait(self.interval):
+            for new_frame in self.poll():
+                yield new_frame
+
+    def add_frame(self, new_frame: Tuple[str, np.ndarray]):
+        """add a (file, frame) from poll to the viewer"""
+        file, frame = new_frame
+        if self.layer is None:
+            basename = self.layer_kwargs.get("name", None)
+            if basename is not None:
+                name = f"{basename}_{self.n_frames}"
+            else:
+                name = f"{os.path.basename(file)}_{self.selection.field}"
+            layer_kwargs = {k: v for k, v in self.layer_kwargs.items() if k != "name"}
+            self.viewer.add_image(frame, name=name, **layer_kwargs)
+        elif self._buffer is None:
+            from dask import array as da
+
+            self.layer.data = da.concatenate([self.layer.data, frame[None]])
+        else:
+            self._buffer.append(frame)
+            self.layer.data = self._buffer.data
+        self.n_frames += 1
+
+    def start(self):
+        """start polling in a background thread"""
+        from napari.qt.threading import thread_worker
+
+        self._stopped.clear()
+        self.worker = thread_worker(self._follow)()
+        self.worker.yielded.connect(self.add_frame)
+        self.worker.start()
+
+    def stop(self):
+        """stop polling"""
+        self._stopped.set()
+        if self.worker is not None:
+            self.worker.quit()
+
+
 def add_to_viewer(
     viewer: Viewer,
     selection: Union[Slice, Region],
@@ -443,6 +724,8 @@ def add_to_viewer(
     use_dask: Optional[bool] = False,
     return_delayed: Optional[bool] = True,
     stack_scaling: Optional[float] = 1.0,
+    follow: Optional[bool] = False,
+    follow_interval: Optional[float] = None,
     **kwargs,
 ):
     """
@@ -480,9 +763,21 @@ def add_to_viewer(
         in the stacked (time) dimension if load_as_stack is True. If scale is
         provided as a separate parameter, then stack_scaling is only used if
         the len(scale) matches the dimensionality of the spatial selection.
+    follow: bool
+        (optional, default False) If True, the file selection is polled for
+        new outputs, which are sampled and added to the viewer as they appear
+        (see TimeseriesFollower). Requires file_pattern.
+    follow_interval: float
+        (optional) the polling interval in seconds when follow is True.
+        Defaults to the timeseries_follow_interval config value.
     **kwargs
         any additional keyword arguments are passed to napari.Viewer().add_image()
 
+    Returns
+    -------
+    TimeseriesFollower or None
+        the started follower when follow is True, otherwise None
+
     Examples
     --------
 
@@ -495,6 +790,9 @@ def add_to_viewer(
     >>>                load_as_stack=True)
     """
 
+    if follow and file_pattern is None:
+        raise ValueError("follow requires a file_pattern to poll.")
+
     im_data, im_kwargs, files = _get_im_data(
         selection,
         file_dir=file_dir,
@@ -507,8 +805,11 @@ def add_to_viewer(
         stack_scaling=stack_scaling,
         **kwargs,
     )
+
+    layer = None
+    layer_kwargs = im_kwargs.copy()
     if load_as_stack:
-        viewer.add_image(im_data, **im_kwargs)
+        layer = viewer.add_image(im_data, **im_kwargs)
     else:
         basename = None
         if "name" in im_kwargs:
@@ -521,3 +822,19 @@ def add_to_viewer(
                 name = os.path.basename(files[im_id])
                 name = f"{name}_{selection.field}"
             viewer.add_image(im, name=name, **im_kwargs)
+
+    if not follow:
+        return None
+
+    follower = TimeseriesFollower(
+        viewer,
+        selection,
+        _get_file_selection(file_dir, file_pattern, None, file_range),
+        files,
+        layer=layer,
+        interval=follow_interval,
+        use_dask=use_dask and return_delayed,
+        layer_kwargs=layer_kwargs,
+    )
+    follower.start()
+    return follower
@@ -23,6 +23,41 @@ def _check_for_reference_layer(
     return None
 
 
+def _to_stored_values(layer: Layer, values: Tuple[float, float]) -> tuple:
+    # converts data values to the stored values of a quantized layer
+    quantization = layer.metadata.get("_quantization", None)
+    if quantization is None:
+        return values
+    scale, offset = quantization
+    return tuple((val - offset) / scale for val in values)
+
+
+def _refine_layer(layer: Layer, data, im_kwargs: dict):
+    # replaces the data of a progressively loaded layer with a finer sample,
+    # along with the scale, translation and metadata of the new sample
+    ndim = np.ndim(data)
+    layer.data = data
+    layer.scale = im_kwargs.get("scale", np.ones(ndim))
+    layer.translate = im_kwargs.get("translate", np.zeros(ndim))
+    layer.metadata = {**layer.metadata, **im_kwargs["metadata"]}
+    layer.reset_contrast_limits()
+
+
+def _sample_progressive_region(
+    ds, field, left_edge, right_edge, resolutions, take_log, rescale, dtype
+):
+    # yields the finalized samples of a region at each resolution
+    buffer_dtype = np.float32 if dtype == "float32" else None
+    for resolution in resolutions:
+        layer_domain = _mi.LayerDomain(left_edge, right_edge, resolution)
+        frb = _mi._get_region_frb(
+            ds, left_edge, right_edge, resolution, dtype=buffer_dtype
+        )
+        data, data_range = _mi._finalize_data(frb[field], take_log, rescale)
+        data, quantization = _mi._cast_to_dtype(data, dtype, data_range)
+        yield data, layer_domain, data_range, quantization
+
+
 class Scene:
     def __init__(self, reference_layer: Optional[_mi.ReferenceLayer] = None):
         self._reference_layer = reference_layer
@@ -61,12 +96,13 @@ class Scene:
         colormap=None,
         link_to=None,
         rescale=False,
+        dtype=None,
         **kwargs,
     ):
         # adds any new data to the viewer
 
-        if rescale:
-            data = _mi._linear_rescale(data)
+        data, data_range = _mi._finalize_data(data, take_log, rescale)
+        data, quantization = _mi._cast_to_dtype(data, dtype, data_range)
 
         if colormap is None:
             colormap = "viridis"
@@ -95,7 +131,12 @@ class Scene:
             fname = f"{field[0]}_{field[1]}"
 
         md = _mi.create_metadata_dict(
-            data, layer_domain, take_log, reference_layer=ref_layer
+            data,
+            layer_domain,
+            take_log,
+            reference_layer=ref_layer,
+            data_range=data_range,
+            quantization=quantization,
         )
         viewer.add_image(
             data,
@@ -116,13 +157,15 @@ class Scene:
         viewer: Viewer,
         ds,
         field: Tuple[str, str],
-        resolution: Optional[Tuple[int, int, int]] = None,
+        resolution: Optional[Union[Tuple[int, int, int], str]] = None,
         left_edge: Optional[unyt_array] = None,
         right_edge: Optional[unyt_array] = None,
         take_log: Optional[bool] = None,
         colormap: Optional[str] = None,
         link_to: Optional[Union[str, Layer]] = None,
         rescale: Optional[bool] = False,
+        dtype: Optional[str] = None,
+        progressive: Optional[bool] = False,
         **kwargs,
     ):
         """
@@ -140,8 +183,11 @@ class Scene:
             the left edge of the bounding box
         right_edge: unyt_array
             the right edge of the bounding box
-        resolution: Tuple[int, int, int]
-            the sampling resolution in each dimension, e.g., (400, 400, 400)
+        resolution: Union[Tuple[int, int, int], str]
+            the sampling resolution in each dimension, e.g., (400, 400, 400).
+            If "auto", the resolution matches the finest cells in the region,
+            limited by the auto_resolution_max_memory config option. The
+            chosen resolution is in the _layer_domain of the layer metadata.
         take_log : Optional[bool]
             if True, will take the log of the extracted data. Defaults to the
             default behavior for the field set by ds.
@@ -149,9 +195,24 @@ class Scene:
             the color map to use, default is "viridis"
         link_to : Optional[Union[str, Layer]]
             specify a layer to which the new layer should link
+        dtype : Optional[str]
+            the dtype of the image, one of "float64" (default), "float32",
+            "uint8" or "uint16". Integer images are quantized between the data
+            min and max, see the _quantization layer metadata.
+        progressive : Optional[bool]
+            if True, the layer is first added at the resolution reduced by the
+            progressive_coarsening config value along each axis. Its data is
+            then replaced in a background thread with samples at successively
+            doubled resolutions until the full resolution is reached.
+            Default False.
         **kwargs :
             any keyword argument accepted by Viewer.add_image()
 
+        Returns
+        -------
+        napari.qt.threading.GeneratorWorker or None
+            the started worker refining a progressive layer, otherwise None
+
         Examples
         --------
 
@@ -172,21 +233,25 @@ class Scene:
             right_edge = ds.domain_right_edge
         if resolution is None:
             resolution = (400, 400, 400)
+        elif isinstance(resolution, str) and resolution == "auto":
+            resolution = _mi._get_auto_resolution(ds, left_edge, right_edge)
         if take_log is None:
             take_log = ds._get_field_info(field).take_log
 
+        refinements = []
+        if progressive:
+            refinements = _mi._get_progressive_resolutions(resolution)
+            resolution = refinements.pop(0)
+
         # add the bounds of this new layer
         layer_domain = _mi.LayerDomain(left_edge, right_edge, resolution)
 
         # create the fixed resolution buffer
-        frb = ds.r[
-            left_edge[0] : right_edge[0] : complex(0, resolution[0]),  # noqa: E203
-            left_edge[1] : right_edge[1] : complex(0, resolution[1]),  # noqa: E203
-            left_edge[2] : right_edge[2] : complex(0, resolution[2]),  # noqa: E203
-        ]
+        buffer_dtype = np.float32 if dtype == "float32" else None
+        frb = _mi._get_region_frb(
+            ds, left_edge, right_edge, resolution, dtype=buffer_dtype
+        )
         data = frb[field]
-        if take_log:
-            data = np.log10(data)
 
         self._add_to_scene(
             viewer,
@@ -197,9 +262,39 @@ class Scene:
             colormap=colormap,
             link_to=link_to,
             rescale=rescale,
+            dtype=dtype,
             **kwargs,
         )
 
+        if len(refinements) == 0:
+            return None
+
+        from napari.qt.threading import thread_worker
+
+        layer = viewer.layers[-1]
+        ref_layer = layer.metadata["_reference_layer"]
+
+        def _on_sample(sample):
+            data, layer_domain, data_range, quantization = sample
+            splayer = (data, {}, "image", layer_domain)
+            _, im_kwargs, _ = ref_layer.align_sanitize_layer(splayer)
+            im_kwargs["metadata"] = _mi.create_metadata_dict(
+                data,
+                layer_domain,
+                take_log,
+                reference_layer=ref_layer,
+                data_range=data_range,
+                quantization=quantization,
+            )
+            _refine_layer(layer, data, im_kwargs)
+
+        worker = thread_worker(_sample_progressive_region)(
+            ds, field, left_edge, right_edge, refinements, take_log, rescale, dtype
+        )
+        worker.yielded.connect(_on_sample)
+        worker.start()
+        return worker
+
     def add_covering_grid(
         self,
         viewer: Viewer,
@@ -213,6 +308,7 @@ class Scene:
         colormap: Optional[str] = None,
         link_to: Optional[Union[str, Layer]] = None,
         rescale: Optional[bool] = False,
+        dtype: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -242,6 +338,10 @@ class Scene:
             the color map to use, default is "viridis"
         link_to : Optional[Union[str, Layer]]
             specify a layer to which the new layer should link
+        dtype : Optional[str]
+            the dtype of the image, one of "float64" (default), "float32",
+            "uint8" or "uint16". Integer images are quantized between the data
+            min and max, see the _quantization layer metadata.
         **kwargs :
             any keyword argument accepted by Viewer.add_image()
 
@@ -272,8 +372,6 @@ class Scene:
             ds, left_edge, right_edge, level, num_ghost_zones
         )
         data = frb[field]
-        if take_log:
-            data = np.log10(data)
 
         # add the bounds of this new layer
         layer_domain = _mi.LayerDomain(left_edge, right_edge, dims)
@@ -287,6 +385,7 @@ class Scene:
             colormap=colormap,
             link_to=link_to,
             rescale=rescale,
+            dtype=dtype,
             **kwargs,
         )
 
@@ -337,6 +436,7 @@ class Scene:
         colormap: Optional[str] = None,
         link_to: Optional[Union[str, Layer]] = None,
         rescale: Optional[bool] = False,
+        dtype: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -369,6 +469,10 @@ class Scene:
             the color map to use, default is "viridis"
         link_to : Optional[Union[str, Layer]]
             specify a layer to which the new layer should link
+        dtype : Optional[str]
+            the dtype of the image, one of "float64" (default), "float32",
+            "uint8" or "uint16". Integer images are quantized between the data
+            min and max, see the _quantization layer metadata.
         **kwargs :
             any keyword argument accepted by Viewer.add_image()
 
@@ -399,8 +503,6 @@ class Scene:
         )
 
         data = frb[field]
-        if take_log:
-            data = np.log10(data)
 
         self._add_to_scene(
             viewer,
@@ -411,9 +513,109 @@ class Scene:
             colormap=colormap,
             link_to=link_to,
             rescale=rescale,
+            dtype=dtype,
             **kwargs,
         )
 
+    def add_orthoslices(
+        self,
+        viewer: Viewer,
+        ds,
+        field: Tuple[str, str],
+        center: Optional[unyt_array] = None,
+        resolution: Optional[Tuple[int, int]] = (400, 400),
+        width: Optional[unyt_quantity] = None,
+        take_log: Optional[bool] = None,
+        periodic: Optional[bool] = False,
+        colormap: Optional[str] = None,
+        link_to: Optional[Union[str, Layer]] = None,
+        rescale: Optional[bool] = False,
+        dtype: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        sample the three orthogonal slices through a point of a yt dataset and
+        add them to a viewer as planes in 3D, one layer per slice.
+
+        Parameters
+        ----------
+        viewer: napari.Viewer
+            the active napari viewer
+        ds
+            the yt dataset to sample
+        field: Tuple[str, str]
+            the field tuple to sample  e.g., ('enzo', 'Density')
+        center: unyt_array
+            the point the slices pass through (3D), default domain center
+        width: unyt_quantity
+            the width and height of each slice, defaults to the full domain
+        resolution: Tuple[int, int]
+            the sampling resolution of each slice, e.g., (400, 400)
+        take_log : Optional[bool]
+            if True, will take the log of the extracted data. Defaults to the
+            default behavior for the field set by ds.
+        periodic: Optional[bool]
+            use periodic bounds for the slices, default False
+        colormap : Optional[str]
+            the color map to use, default is "viridis"
+        link_to : Optional[Union[str, Layer]]
+            specify a layer to which the new layers should link
+        dtype : Optional[str]
+            the dtype of the images, one of "float64" (default), "float32",
+            "uint8" or "uint16". Integer images are quantized between the data
+            min and max, see the _quantization layer metadata.
+        **kwargs :
+            any keyword argument accepted by Viewer.add_image(). A name is
+            suffixed with the normal axis of each slice.
+
+        Examples
+        --------
+
+        >>> import napari
+        >>> import yt
+        >>> from yt_napari.viewer import Scene
+        >>> viewer = napari.Viewer(ndisplay=3)
+        >>> ds = yt.load_sample("IsolatedGalaxy")
+        >>> yt_scene = Scene()
+        >>> yt_scene.add_orthoslices(viewer, ds, ("enzo", "Temperature"))
+
+        """
+
+        if take_log is None:
+            take_log = ds._get_field_info(field).take_log
+
+        name = kwargs.pop("name", f"{field[0]}_{field[1]}")
+        # the three planes are read in a single pass over the grids
+        slcs = _mi._read_orthoslices(ds, center, [field])
+        for normal in range(3):
+            frb, layer_domain = _mi._process_slice(
+                ds,
+                normal,
+                center=center,
+                width=width,
+                height=width,
+                resolution=resolution,
+                periodic=periodic,
+                slc=slcs[normal],
+            )
+            layer_domain, (data,) = _mi._orient_slice_in_3D(
+                ds, normal, center, layer_domain, [frb[field]]
+            )
+
+            self._add_to_scene(
+                viewer,
+                data,
+                layer_domain,
+                field,
+                take_log,
+                colormap=colormap,
+                link_to=link_to,
+                rescale=rescale,
+                dtype=dtype,
+                name=f"{name}_{ds.coordinates.axis_name[normal]}",
+                **kwargs,
+            )
+
     def normalize_color_limits(
         self,
         layers: List[Union[str, Layer]],
@@ -479,8 +681,9 @@ class Scene:
         # no need to check for linked again while getting the range
         data_range = self.get_data_range(clean_layers, check_linked=False)
 
-        # now apply those limits
-        self.set_across_layers(clean_layers, "contrast_limits", data_range)
+        # now apply those limits, in the stored values of quantized layers
+        for layer in clean_layers:
+            layer.contrast_limits = _to_stored_values(layer, data_range)
 
     def set_across_layers(
         self,
@@ -609,11 +812,13 @@ class Scene:
         min_val = np.inf
         max_val = -np.inf
         for layer in clean_layers:
-            if "_yt_napari_layer" in layer.metadata:
-                min_val = min([min_val, layer.metadata["_data_range"][0]])
-                max_val = max([max_val, layer.metadata["_data_range"][1]])
+            data_range = layer.metadata.get("_data_range")
+            if "_yt_napari_layer" in layer.metadata and data_range is not None:
+                min_val = min([min_val, data_range[0]])
+                max_val = max([max_val, data_range[1]])
             else:
-                min_val = min([min_val, layer.data.min()])
-                max_val = max([max_val, layer.data.max()])
+                # lazy yt layers have no pre-computed range
+                min_val = min([min_val, float(layer.data.min())])
+                max_val = max([max_val, float(layer.data.max())])
 
         return (min_val, max_val)